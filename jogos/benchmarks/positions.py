@@ -0,0 +1,90 @@
+import timeit
+from random import choice, seed
+
+from jogos import positions
+from spin_the_wheel.words import SecretWord
+
+LENGTHS = (100, 1_000, 10_000)
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ     '
+
+
+# What jogos/helpers did before the positions module
+def legacy_find_all(word, letter):
+    indexes = []
+    current_index = 0
+    can_search = letter in word
+
+    while (can_search):
+        found_index = word.find(letter, current_index)
+        indexes.append(found_index)
+
+        current_index = found_index + 1
+        can_search = letter in word[current_index:]
+
+    return indexes
+
+
+def legacy_map_positions(word):
+    positions_dict = {}
+
+    for i in range(len(word)):
+        letter = word[i]
+        if (letter not in positions_dict):
+            positions_dict[letter] = []
+        positions_dict[letter].append(i)
+
+    return positions_dict
+
+
+def legacy_play(word):
+    positions_dict = legacy_map_positions(word)
+    hidden_word = ['_' for _ in word]
+    for letter in ALPHABET[:26]:
+        if letter in positions_dict:
+            for i in positions_dict[letter]:
+                hidden_word[i] = letter
+
+
+def legacy_find_every_letter(word):
+    for letter in ALPHABET[:26]:
+        legacy_find_all(word, letter)
+
+
+def find_every_letter(word):
+    for letter in ALPHABET[:26]:
+        positions.find_all(word, letter)
+
+
+def play(word):
+    positions_dict = positions.map_positions(word)
+    hidden_word = positions.create_hidden_word(word, '_')
+    for letter in ALPHABET[:26]:
+        positions.reveal(hidden_word, positions_dict, letter)
+
+
+def secret_word_play(word):
+    secret_word = SecretWord(word=word)
+    for letter in ALPHABET[:26]:
+        secret_word.try_reveal(letter)
+
+
+def measure(label, function, word):
+    number = max(1, 20_000 // len(word))
+    seconds = timeit.timeit(lambda: function(word), number=number) / number
+    print(f'  {label}: {seconds * 1e6:,.0f}us')
+
+
+def main():
+    seed(0)
+    for length in LENGTHS:
+        word = ''.join(choice(ALPHABET) for _ in range(length))
+        print(f'Frase com {length} caracteres, revelando todas as letras')
+        measure('find_all antigo', legacy_find_every_letter, word)
+        measure('find_all', find_every_letter, word)
+        measure('map_positions antigo', legacy_play, word)
+        measure('map_positions e reveal', play, word)
+        measure('SecretWord', secret_word_play, word)
+
+
+if __name__ == '__main__':
+    main()
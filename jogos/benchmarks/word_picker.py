@@ -0,0 +1,55 @@
+import os
+import tempfile
+import time
+import tracemalloc
+from random import randint, seed
+
+from jogos import word_picker
+
+WORDS_COUNT = 2_000_000
+
+
+def read_every_line(file_path):
+    # What jogos/forca.get_word did before
+    with open(file_path, 'r', encoding='utf-8') as file:
+        words = [line.strip().upper() for line in file]
+
+    return words[randint(0, len(words) - 1)]
+
+
+def measure(label, function):
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    # Measured on a second run, tracemalloc slows every allocation down
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'  {label}: {seconds * 1000:,.1f}ms, pico de {peak / 1024:,.0f}KiB')
+
+
+def main():
+    seed(0)
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'words.txt')
+        with open(file_path, 'w', encoding='utf-8') as file:
+            for i in range(WORDS_COUNT):
+                file.write(f'palavra número {i}\n')
+
+        print(f'{WORDS_COUNT:,} palavras ({os.path.getsize(file_path) / 2 ** 20:,.0f}MiB)')
+        measure('lendo o arquivo todo', lambda: read_every_line(file_path))
+        measure('pick_word', lambda: word_picker.pick_word(file_path))
+        measure('sample_words com 10 palavras', lambda: word_picker.sample_words(file_path, 10))
+        measure('criando o índice', lambda: word_picker.build_offset_index(file_path))
+
+        picker = word_picker.IndexedWordPicker(file_path)
+        measure('IndexedWordPicker.pick_word', picker.pick_word)
+        measure('IndexedWordPicker.sample_words com 10 palavras', lambda: picker.sample_words(10))
+        picker.close()
+
+
+if __name__ == '__main__':
+    main()
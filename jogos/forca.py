@@ -1,37 +1,32 @@
-import time
-from random import randint
-from sys import argv
-
-from helpers import map_positions, normalize, clear
+from helpers import normalize, clear, get_default_clock
+from positions import create_hidden_word, map_positions, reveal
+from word_picker import pick_word
 
 PLACEHOLDER_LETTER = '_'
-DEBUG_MODE = 'debug' in argv[1:]
 
 
-def start_game():
+def start_game(clock=None):
+    clock = clock if clock is not None else get_default_clock()
     secret_word = get_word()
-    print_game_start_message()
-    init_rounds(secret_word)
+    print_game_start_message(clock)
+    init_rounds(secret_word, clock)
 
 
 def get_word():
-    with open('words.txt', 'r', encoding="utf-8") as file:
-        words = [normalize(line) for line in file]
-
-    return words[randint(0, len(words) - 1)]
+    return normalize(pick_word('words.txt'))
 
 
-def print_game_start_message():
+def print_game_start_message(clock):
     clear()
     print('***************************')
     print("Bem vindo ao jogo da Forca!")
     print("***************************")
-    sleep(0.5)
+    clock.sleep(0.5)
     print()
     input("Aperte enter para começar")
 
 
-def init_rounds(word):
+def init_rounds(word, clock):
     won = False
     hanged = False
 
@@ -39,16 +34,16 @@ def init_rounds(word):
     guessed_letters = []
     word = normalize(word)
     mapped_word_positions = map_positions(word)
-    hidden_word = [PLACEHOLDER_LETTER for _ in word]
+    hidden_word = create_hidden_word(word, PLACEHOLDER_LETTER)
 
     while (not won and not hanged):
         print_round_start_message(hidden_word, tries)
-        guess, guessed_letters, guessed_before = input_guess(guessed_letters)
+        guess, guessed_letters, guessed_before = input_guess(guessed_letters, clock)
 
         if (guessed_before):
             continue
 
-        tries, hidden_word = check_guess(guess, hidden_word, mapped_word_positions, tries)
+        tries, hidden_word = check_guess(guess, hidden_word, mapped_word_positions, tries, clock)
 
         won = PLACEHOLDER_LETTER not in hidden_word
         hanged = tries <= 0
@@ -71,7 +66,7 @@ def print_round_start_message(hidden_word, tries):
     print()
 
 
-def input_guess(guessed_letters):
+def input_guess(guessed_letters, clock):
     guess = input("Chute uma letra: ")
     guess = normalize(guess)
     guessed_before = guess in guessed_letters
@@ -80,29 +75,25 @@ def input_guess(guessed_letters):
     if (not guessed_before):
         print(f"Você chutou '{guess}'")
         gl_copy.append(guess)
-        sleep(0.6)
+        clock.sleep(0.6)
     else:
         print(f"A letra '{guess}' já foi chutada anteriormente")
-        sleep(2)
+        clock.sleep(2)
 
     return guess, gl_copy, guessed_before
 
 
-def check_guess(guess, hidden_word, mapped_word_positions, tries):
+def check_guess(guess, hidden_word, mapped_word_positions, tries, clock):
     hw_copy = hidden_word.copy()
 
-    if (guess in mapped_word_positions):
-        indexes = mapped_word_positions[guess]
-        letter_count = len(indexes)
+    letter_count = reveal(hw_copy, mapped_word_positions, guess)
+    if (letter_count > 0):
         print(f"Tem {letter_count} letras '{guess}'")
-
-        for i in indexes:
-            hw_copy[i] = guess
     else:
         print("Não foi dessa vez.")
         tries -= 1
 
-    sleep(2)
+    clock.sleep(2)
 
     return tries, hw_copy
 
@@ -199,10 +190,5 @@ def draw_gallows(tries):
     print()
 
 
-def sleep(seconds):
-    if (not DEBUG_MODE):
-        time.sleep(seconds)
-
-
 if (__name__ == "__main__"):
     start_game()
@@ -4,40 +4,29 @@ from sys import argv
 
 DEBUG_MODE = 'debug' in argv[1:]
 
-def sleep(seconds):
-    if (not DEBUG_MODE):
-        time.sleep(seconds)
-
-def clear():
-    os.system('cls' if os.name == 'nt' else 'clear')
-
 
-def normalize(word):
-    return word.strip().upper()
+# The pauses of the games go through a clock, in debug mode they are only
+# added up instead of waited
+class RealClock:
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
 
 
-def find_all(word, letter):
-    indexes = []
-    current_index = 0
-    can_search = letter in word
+class VirtualClock:
+    def __init__(self):
+        self.elapsed = 0.0
 
-    while (can_search):
-        found_index = word.find(letter, current_index)
-        indexes.append(found_index)
+    def sleep(self, seconds: float):
+        self.elapsed += seconds
 
-        current_index = found_index + 1
-        can_search = letter in word[current_index:]
 
-    return indexes
+def get_default_clock():
+    return VirtualClock() if DEBUG_MODE else RealClock()
 
 
-def map_positions(word):
-    positions_dict = {}
+def clear():
+    os.system('cls' if os.name == 'nt' else 'clear')
 
-    for i in range(len(word)):
-        letter = word[i]
-        if (letter not in positions_dict):
-            positions_dict[letter] = []
-        positions_dict[letter].append(i)
 
-    return positions_dict
\ No newline at end of file
+def normalize(word):
+    return word.strip().upper()
\ No newline at end of file
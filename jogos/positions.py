@@ -0,0 +1,36 @@
+from collections import defaultdict
+
+
+def map_positions(word):
+    # Every letter with the indexes where it shows up, in a single pass
+    positions_dict = defaultdict(list)
+
+    for i, letter in enumerate(word):
+        positions_dict[letter].append(i)
+
+    return dict(positions_dict)
+
+
+def find_all(word, letter):
+    indexes = []
+    found_index = word.find(letter)
+
+    while (found_index != -1):
+        indexes.append(found_index)
+        found_index = word.find(letter, found_index + 1)
+
+    return indexes
+
+
+def create_hidden_word(word, placeholder_letter):
+    return [placeholder_letter] * len(word)
+
+
+def reveal(hidden_word, positions_dict, letter):
+    # Writes the letter on the indexes mapped before and returns how many there were
+    indexes = positions_dict.get(letter, ())
+
+    for i in indexes:
+        hidden_word[i] = letter
+
+    return len(indexes)
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The tests import the games as jogos.<module>, the way oo/forca does, so the
+# repository root has to be importable. jogos itself stays off the path, its
+# jogos.py would shadow the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -0,0 +1,56 @@
+from jogos.helpers import normalize
+from jogos.positions import create_hidden_word, find_all, map_positions, reveal
+
+
+class Test_map_positions:
+    def test_should_map_every_index_of_repeated_letters(self):
+        assert map_positions('BANANA') == {'B': [0], 'A': [1, 3, 5], 'N': [2, 4]}
+
+    def test_should_map_nothing_for_an_empty_word(self):
+        assert map_positions('') == {}
+
+    def test_should_keep_accented_letters_apart_from_the_plain_ones(self):
+        positions_dict = map_positions(normalize(' sabão '))
+
+        assert positions_dict == {'S': [0], 'A': [1], 'B': [2], 'Ã': [3], 'O': [4]}
+
+
+class Test_find_all:
+    def test_should_find_every_index_of_repeated_letters(self):
+        assert find_all('BANANA', 'A') == [1, 3, 5]
+
+    def test_should_find_nothing_for_an_absent_letter(self):
+        assert find_all('BANANA', 'Z') == []
+
+    def test_should_find_the_same_indexes_as_the_map(self):
+        word = normalize('maçã')
+
+        for letter, indexes in map_positions(word).items():
+            assert find_all(word, letter) == indexes
+
+
+class Test_reveal:
+    def test_should_reveal_every_index_of_the_letter(self):
+        hidden_word = create_hidden_word('BANANA', '_')
+
+        letter_count = reveal(hidden_word, map_positions('BANANA'), 'A')
+
+        assert letter_count == 3
+        assert hidden_word == ['_', 'A', '_', 'A', '_', 'A']
+
+    def test_should_reveal_nothing_for_an_absent_letter(self):
+        hidden_word = create_hidden_word('BANANA', '_')
+
+        letter_count = reveal(hidden_word, map_positions('BANANA'), 'Z')
+
+        assert letter_count == 0
+        assert hidden_word == ['_'] * 6
+
+    def test_should_not_reveal_the_accented_letter_with_the_plain_one(self):
+        word = normalize('maçã')
+        hidden_word = create_hidden_word(word, '_')
+
+        letter_count = reveal(hidden_word, map_positions(word), 'A')
+
+        assert letter_count == 1
+        assert hidden_word == ['_', 'A', '_', '_']
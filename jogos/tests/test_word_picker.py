@@ -0,0 +1,114 @@
+import os
+from collections import Counter
+from random import Random
+from unittest import mock
+
+import pytest
+
+from jogos.word_picker import IndexedWordPicker, get_index_path, pick_word, sample_words
+
+WORDS = ['banana', 'melancia', 'morango', 'uva', 'laranja', 'abacaxi', 'manga', 'kiwi']
+
+
+@pytest.fixture()
+def words_path(tmp_path):
+    path = tmp_path / 'words.txt'
+    # Blank lines are never picked
+    path.write_text('\n'.join(WORDS[:4]) + '\n\n' + '\n'.join(WORDS[4:]) + '\n', encoding='utf-8')
+    return str(path)
+
+
+class Test_sample_words:
+    def test_should_pick_k_different_words(self, words_path):
+        words = sample_words(words_path, 3, Random(1))
+
+        assert len(words) == 3
+        assert len(set(words)) == 3
+        assert set(words) <= set(WORDS)
+
+    def test_should_pick_every_word_when_k_is_the_word_count(self, words_path):
+        assert sorted(sample_words(words_path, len(WORDS), Random(1))) == sorted(WORDS)
+
+    def test_should_raise_when_k_is_larger_than_the_word_count(self, words_path):
+        with pytest.raises(ValueError):
+            sample_words(words_path, len(WORDS) + 1, Random(1))
+
+    def test_should_pick_nothing_when_k_is_zero(self, words_path):
+        assert sample_words(words_path, 0, Random(1)) == []
+
+    def test_should_pick_the_same_words_with_the_same_seed(self, words_path):
+        assert sample_words(words_path, 3, Random(5)) == sample_words(words_path, 3, Random(5))
+
+    def test_should_pick_every_word_about_as_often(self, words_path):
+        rng = Random(0)
+        picks_count = 8000
+
+        counts = Counter(pick_word(words_path, rng) for _ in range(picks_count))
+
+        expected = picks_count / len(WORDS)
+        assert set(counts) == set(WORDS)
+        assert all(abs(count - expected) < 0.15 * expected for count in counts.values())
+
+
+class Test_IndexedWordPicker:
+    def test_should_get_the_words_by_position(self, words_path):
+        picker = IndexedWordPicker(words_path)
+
+        assert picker.count == len(WORDS)
+        assert [picker.get_word(position) for position in range(picker.count)] == WORDS
+
+    def test_should_get_the_last_word_without_a_line_break(self, tmp_path):
+        path = tmp_path / 'words.txt'
+        path.write_text('banana\nuva', encoding='utf-8')
+
+        picker = IndexedWordPicker(str(path))
+
+        assert picker.get_word(1) == 'uva'
+        picker.close()
+
+    def test_should_not_open_the_files_again_to_pick(self, words_path):
+        picker = IndexedWordPicker(words_path, Random(0))
+
+        with mock.patch('builtins.open', side_effect=AssertionError):
+            words = picker.sample_words(len(WORDS))
+
+        assert sorted(words) == sorted(WORDS)
+        picker.close()
+
+    def test_should_pick_the_same_words_with_the_same_seed(self, words_path):
+        first_picker = IndexedWordPicker(words_path, Random(5))
+        second_picker = IndexedWordPicker(words_path, Random(5))
+
+        assert first_picker.sample_words(4) == second_picker.sample_words(4)
+        assert first_picker.pick_word() == second_picker.pick_word()
+
+    def test_should_pick_every_word_about_as_often(self, words_path):
+        picker = IndexedWordPicker(words_path, Random(0))
+        picks_count = 8000
+
+        counts = Counter(picker.pick_word() for _ in range(picks_count))
+
+        expected = picks_count / len(WORDS)
+        assert set(counts) == set(WORDS)
+        assert all(abs(count - expected) < 0.15 * expected for count in counts.values())
+
+    def test_should_rebuild_the_index_when_the_words_change(self, words_path):
+        IndexedWordPicker(words_path)
+
+        with open(words_path, 'a', encoding='utf-8') as file:
+            file.write('pitanga\n')
+        stat = os.stat(words_path)
+        os.utime(words_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        picker = IndexedWordPicker(words_path)
+
+        assert picker.count == len(WORDS) + 1
+        assert picker.get_word(len(WORDS)) == 'pitanga'
+
+    def test_should_reuse_the_index_when_the_words_did_not_change(self, words_path):
+        IndexedWordPicker(words_path)
+        index_mtime_ns = os.stat(get_index_path(words_path)).st_mtime_ns
+
+        IndexedWordPicker(words_path)
+
+        assert os.stat(get_index_path(words_path)).st_mtime_ns == index_mtime_ns
@@ -0,0 +1,139 @@
+import math
+import mmap
+import os
+import random
+import struct
+from array import array
+from itertools import islice
+
+_INDEX_HEADER = struct.Struct('<qq')
+_OFFSET = struct.Struct('=q')
+
+
+def _iter_lines(file):
+    # Lines of a binary file without the blank ones, filter and bytes.strip
+    # both run in C, so skipping lines doesn't cost a Python step per line
+    return filter(bytes.strip, file)
+
+
+def _decode(line):
+    return line.decode('utf-8').strip()
+
+
+def _random_log(rng):
+    # log of a uniform number in (0, 1), random() may return 0
+    number = rng.random()
+    while number == 0:
+        number = rng.random()
+    return math.log(number)
+
+
+def sample_words(file_path, k, rng=None):
+    # Reservoir sampling (Algorithm L): a single pass over the file keeping
+    # only k lines, jumping over the lines that would never be picked
+    rng = rng or random
+    with open(file_path, 'rb') as file:
+        lines = _iter_lines(file)
+        reservoir = list(islice(lines, k))
+        if len(reservoir) < k:
+            raise ValueError(f'{file_path} tem apenas {len(reservoir)} palavras')
+        if k == 0:
+            return []
+
+        weight = math.exp(_random_log(rng) / k)
+        while True:
+            skip = math.floor(_random_log(rng) / math.log1p(-weight))
+            line = next(islice(lines, skip, None), None)
+            if line is None:
+                break
+
+            reservoir[rng.randrange(k)] = line
+            weight *= math.exp(_random_log(rng) / k)
+
+    rng.shuffle(reservoir)
+    return [_decode(line) for line in reservoir]
+
+
+def pick_word(file_path, rng=None):
+    return sample_words(file_path, 1, rng)[0]
+
+
+def get_index_path(file_path):
+    return f'{file_path}.offsets'
+
+
+def build_offset_index(file_path):
+    # The index is a file next to the words: the size and mtime of the words
+    # file it was built from, then the int64 offset of every word (native byte
+    # order, the index is a local cache)
+    stat = os.stat(file_path)
+    index_path = get_index_path(file_path)
+    temporary_path = f'{index_path}.{os.getpid()}.tmp'
+
+    with open(file_path, 'rb') as file, open(temporary_path, 'wb') as index_file:
+        index_file.write(_INDEX_HEADER.pack(stat.st_size, stat.st_mtime_ns))
+        offsets = array('q')
+        position = 0
+        for line in file:
+            if line.strip():
+                offsets.append(position)
+            position += len(line)
+
+            if len(offsets) >= 65536:
+                offsets.tofile(index_file)
+                offsets = array('q')
+        offsets.tofile(index_file)
+
+    os.replace(temporary_path, index_path)
+    return index_path
+
+
+def _map_file(file_path):
+    if os.path.getsize(file_path) == 0:
+        return b''
+
+    with open(file_path, 'rb') as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# Picks in O(1) with the offset index: both files stay mapped for the life of
+# the picker, so a pick is one lookup in the index and one slice of the words.
+# The index is rebuilt when the words change
+class IndexedWordPicker:
+    def __init__(self, file_path, rng=None):
+        self._file_path = file_path
+        self._random = rng or random
+
+        if not self._is_index_valid():
+            build_offset_index(file_path)
+        self._index = _map_file(get_index_path(file_path))
+        self._offsets = memoryview(self._index)[_INDEX_HEADER.size:].cast('q')
+        self._words = _map_file(file_path)
+        self.count = len(self._offsets)
+
+    def _is_index_valid(self):
+        try:
+            with open(get_index_path(self._file_path), 'rb') as index_file:
+                size, mtime_ns = _INDEX_HEADER.unpack(index_file.read(_INDEX_HEADER.size))
+        except (OSError, struct.error):
+            return False
+
+        stat = os.stat(self._file_path)
+        return size == stat.st_size and mtime_ns == stat.st_mtime_ns
+
+    def get_word(self, position):
+        offset = self._offsets[position]
+        end = self._words.find(b'\n', offset)
+        return _decode(self._words[offset:end if end != -1 else len(self._words)])
+
+    def pick_word(self):
+        return self.get_word(self._random.randrange(self.count))
+
+    def sample_words(self, k):
+        return [self.get_word(position) for position in self._random.sample(range(self.count), k)]
+
+    def close(self):
+        self._offsets.release()
+        for data in (self._index, self._words):
+            if isinstance(data, mmap.mmap):
+                data.close()
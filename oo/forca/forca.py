@@ -1,12 +1,13 @@
-from random import randint
-
-from jogos.helpers import map_positions, normalize, sleep, clear
+from jogos.helpers import normalize, clear, get_default_clock
+from jogos.positions import create_hidden_word, map_positions, reveal
+from jogos.word_picker import pick_word
 
 
 class Forca:
     __PLACEHOLDER_LETTER = '_'
 
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.__clock = clock if clock is not None else get_default_clock()
         self.__won = False
         self.__lost = False
         self.__tries = 7
@@ -53,20 +54,17 @@ class Forca:
     def __set_random_secret_word(self):
         self.__secret_word = normalize(self.__get_random_secret_word())
         self.__mapped_word_positions = map_positions(self.__secret_word)
-        self.__hidden_word = [Forca.__PLACEHOLDER_LETTER for _ in self.__secret_word]
+        self.__hidden_word = create_hidden_word(self.__secret_word, Forca.__PLACEHOLDER_LETTER)
 
     def __get_random_secret_word(self, file_path='fruits.txt'):
-        with open(file_path, 'r', encoding='utf-8') as file:
-            words = [line for line in file]
-
-        return words[randint(0, len(words) - 1)]
+        return pick_word(file_path)
 
     def __print_opening_message(self):
         clear()
         print('***************************')
         print("Bem vindo ao jogo da Forca!")
         print("***************************")
-        sleep(0.5)
+        self.__clock.sleep(0.5)
         print()
         input("Aperte enter para começar")
 
@@ -107,26 +105,22 @@ class Forca:
         if (not guessed_before):
             print(f"Você chutou '{guess}'")
             self.__guessed_letters.append(guess)
-            sleep(0.6)
+            self.__clock.sleep(0.6)
         else:
             print(f"A letra '{guess}' já foi chutada anteriormente")
-            sleep(2)
+            self.__clock.sleep(2)
 
         return guess, guessed_before
 
     def __check_guess(self, guess):
-        if (guess in self.__mapped_word_positions):
-            indexes = self.__mapped_word_positions[guess]
-            letter_count = len(indexes)
+        letter_count = reveal(self.__hidden_word, self.__mapped_word_positions, guess)
+        if (letter_count > 0):
             print(f"Tem {letter_count} letras '{guess}'")
-
-            for i in indexes:
-                self.__hidden_word[i] = guess
         else:
             print("Não foi dessa vez.")
             self.__tries -= 1
 
-        sleep(2)
+        self.__clock.sleep(2)
 
     def __print_victory_message(self):
         print(self.__victory_message)
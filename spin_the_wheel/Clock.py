@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+
+# Every pause of the game goes through a clock, so each game can choose how
+# those pauses are spent: really waiting, waiting less, or not waiting at all
+class RealClock:
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class ScaledClock:
+    def __init__(self, factor: float):
+        if factor <= 0:
+            raise ValueError('O fator de aceleração precisa ser positivo')
+        self.factor = factor
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds / self.factor)
+
+
+# Never waits, only adds up how long the game would have waited
+class VirtualClock:
+    def __init__(self):
+        self.elapsed = 0.0
+        self.sleeps_count = 0
+
+    def sleep(self, seconds: float):
+        self.elapsed += seconds
+        self.sleeps_count += 1
+
+
+# The game code is synchronous, so the pauses are collected while a round
+# step runs and the event loop waits for them with `await clock.flush()`
+# between steps, without blocking other sessions on the same loop
+class AsyncClock:
+    def __init__(self, factor: float = 1):
+        if factor <= 0:
+            raise ValueError('O fator de aceleração precisa ser positivo')
+        self.factor = factor
+        self.pending = 0.0
+        self.elapsed = 0.0
+
+    def sleep(self, seconds: float):
+        self.pending += seconds
+
+    async def flush(self):
+        seconds, self.pending = self.pending, 0.0
+        self.elapsed += seconds
+        await asyncio.sleep(seconds / self.factor)
@@ -0,0 +1,78 @@
+import os
+import shutil
+import sys
+
+from helpers import clear
+
+_CURSOR_HOME = '\x1b[H'
+_CLEAR_SCREEN = '\x1b[2J'
+_CLEAR_LINE = '\x1b[K'
+_CLEAR_BELOW = '\x1b[J'
+
+
+def _move_to_row(row: int):
+    return f'\x1b[{row};1H'
+
+
+def _enable_ansi():
+    if os.name != 'nt':
+        return True
+
+    # The legacy Windows console only understands the escapes once its virtual
+    # terminal mode is on, and older versions can't turn it on at all
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (AttributeError, OSError):
+        return False
+
+
+# Keeps the last frame written to the terminal and, on every render, writes
+# only the rows that changed, all of it in a single write. Whatever was
+# printed below the frame since the last render is cleared. Without ANSI
+# escapes every frame is a full redraw
+class FrameRenderer:
+    def __init__(self, stream=None, ansi: bool = None):
+        self._stream = stream
+        self._previous_lines = None
+        self._ansi = ansi if ansi is not None else _enable_ansi()
+
+    def render(self, lines):
+        lines = [str(line) for line in lines]
+        previous_lines = self._previous_lines
+
+        if not self._ansi:
+            clear()
+            parts = ['\n'.join(lines), '\n']
+        elif previous_lines is None:
+            parts = [_CURSOR_HOME, _CLEAR_SCREEN, '\n'.join(lines), '\n']
+        else:
+            parts = []
+            for i, line in enumerate(lines):
+                if i >= len(previous_lines) or previous_lines[i] != line:
+                    parts.append(_move_to_row(i + 1))
+                    parts.append(line)
+                    parts.append(_CLEAR_LINE)
+            parts.append(_move_to_row(len(lines) + 1))
+            parts.append(_CLEAR_BELOW)
+
+        # The rows are counted from the top of the screen, a frame taller than
+        # the terminal scrolls and the next one is redrawn from scratch
+        fits = len(lines) < shutil.get_terminal_size().lines
+        self._previous_lines = lines if self._ansi and fits else None
+        self._write(''.join(parts))
+
+    def invalidate(self):
+        # The next render redraws the whole screen, for when something else
+        # wrote on the terminal and may have scrolled the frame
+        self._previous_lines = None
+
+    def _write(self, text: str):
+        stream = self._stream or sys.stdout
+        stream.write(text)
+        stream.flush()
@@ -1,68 +1,128 @@
+import os
 from random import randrange
-from time import sleep
 
-from player import InputPlayerScene, Player
+from player import InputPlayerScene, Leaderboard, Player
 from Round import Round
-from helpers import sleep, clear
+from RoundCLI import RoundCLI
+from helpers import clear, get_default_clock
+from history import GameHistory, GameRecord
+from inputs import ConsoleInput
 from words import SecretWord
 
+absolute_path = os.path.dirname(os.path.abspath(__file__))
 
-class Game:
 
-    def __init__(self):
-        with open('drawings/victory_message.txt', 'r') as victory_file:
+class Game:
+    THEMES = ('fruits', 'video_games')
+
+    def __init__(self, clock=None, history: GameHistory = None, input_source=None, word_deck=None):
+        self._clock = clock if clock is not None else get_default_clock()
+        self._history = history
+        # Anything with draw(theme), the deck shared by every game by default
+        self._word_deck = word_deck
+        self._input_source = input_source if input_source is not None else ConsoleInput()
+        with open(f'{absolute_path}/drawings/victory_message.txt', 'r') as victory_file:
             self._victory_message = [line for line in victory_file]
             self._victory_message = ''.join(self._victory_message)
 
     def start(self):
         self._print_opening_message()
 
-        players = InputPlayerScene.input_players()
-        players = self._run_rounds(3, players)
-
-        self._end_game(players)
-
-    def _run_rounds(self, number_of_rounds: int, players: [Player, ...]):
+        players = InputPlayerScene.input_players(self._input_source)
+        leaderboard = Leaderboard(players)
+        game_record = GameRecord()
+        players = self._run_rounds(3, players, leaderboard, game_record)
+
+        all_time_ranking = self._save_game(players, game_record)
+        self._end_game(players, leaderboard, all_time_ranking)
+        leaderboard.close()
+
+    def _run_rounds(
+            self,
+            number_of_rounds: int,
+            players: [Player, ...],
+            leaderboard: Leaderboard,
+            game_record: GameRecord,
+    ):
         clear()
         print(f'Serão {number_of_rounds} rodadas para decidir quem vai ganhar')
-        sleep(2.5)
+        self._clock.sleep(2.5)
         print('Ganha quem tiver mais dinheiro')
-        sleep(2.5)
+        self._clock.sleep(2.5)
 
         current_round = 1
         while current_round <= number_of_rounds:
             theme = self._draw_theme()
-            secret_world = SecretWord(theme=theme)
-            Round(secret_world, theme, players).run()
+            secret_world = SecretWord.from_deck(theme, self._word_deck)
+            cli = RoundCLI(clock=self._clock, input_source=self._input_source)
+            game_round = Round(secret_world, theme, players, cli=cli, leaderboard=leaderboard)
+            game_round.run()
+
+            winner = game_round.winner
+            game_record.add_round(theme, secret_world.get_word(), winner and winner.name, game_round.turns_count)
             current_round += 1
 
         return players
 
     def _draw_theme(self):
-        themes = ['fruits', 'video_games']
-        return themes[randrange(0, len(themes))]
-
-    def _end_game(self, players):
+        return Game.THEMES[randrange(0, len(Game.THEMES))]
+
+    def _save_game(self, players, game_record: GameRecord):
+        # Only queues the game, it is written while the results are shown
+        if self._history is None:
+            return None
+
+        game_record.set_results(players)
+        all_time_ranking = self._get_all_time_ranking(game_record)
+        self._history.record_game(game_record)
+        return all_time_ranking
+
+    def _get_all_time_ranking(self, game_record: GameRecord, players_count=5):
+        # Read before the game is queued, so the saved totals don't have it yet
+        # and it is added here, without waiting for the writer
+        totals = {name: [total_money, wins_count]
+                  for name, total_money, wins_count, _ in self._history.get_top_players(players_count)}
+        player_names = [name for name, _ in game_record.results]
+        for name, (total_money, wins_count, _) in self._history.get_player_totals(player_names).items():
+            totals[name] = [total_money, wins_count]
+
+        for position, (name, money) in enumerate(game_record.results, 1):
+            player_totals = totals.setdefault(name, [0, 0])
+            player_totals[0] += money
+            player_totals[1] += position == 1
+
+        ranking = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, total_money, wins_count) for name, (total_money, wins_count) in ranking[:players_count]]
+
+    def _end_game(self, players, leaderboard: Leaderboard, all_time_ranking=None):
         clear()
-        self._print_victory_message(players)
+        self._print_victory_message(players, leaderboard, all_time_ranking)
 
-    def _print_top_five_ranking(self, players):
+    def _print_top_five_ranking(self, players, leaderboard: Leaderboard):
         players_count = len(players)
         if (players_count <= 1):
             return
 
-        ranked_players = sorted(players, key=lambda player: player.money, reverse=True)
-        max_rank = min(players_count, 5)
-        for i in range(max_rank):
-            rank = i + 1
-            player = ranked_players[i]
+        for rank, player in enumerate(leaderboard.top(5), 1):
             print(f"#{rank} - {player.name} com R${player.money:.2f}")
 
         print()
         print()
 
-    def _print_victory_message(self, players):
-        self._print_top_five_ranking(players)
+    def _print_all_time_ranking(self, all_time_ranking):
+        if not all_time_ranking:
+            return
+
+        print('Ranking geral:')
+        for rank, (name, total_money, wins_count) in enumerate(all_time_ranking, 1):
+            print(f"#{rank} - {name} com R${total_money:.2f} e {wins_count} vitórias")
+
+        print()
+        print()
+
+    def _print_victory_message(self, players, leaderboard: Leaderboard, all_time_ranking=None):
+        self._print_top_five_ranking(players, leaderboard)
+        self._print_all_time_ranking(all_time_ranking)
         print(self._victory_message)
 
     def _print_opening_message(self):
@@ -70,6 +130,6 @@ class Game:
         print('***************************')
         print("Bem vindo ao jogo da Forca!")
         print("***************************")
-        sleep(0.5)
+        self._clock.sleep(0.5)
         print()
-        input("Aperte enter para começar")
+        self._input_source("Aperte enter para começar")
@@ -0,0 +1,120 @@
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from contextlib import redirect_stdout
+from itertools import islice
+
+from Clock import VirtualClock
+from Game import Game
+from inputs import RandomInput, RecordingInput, ReplayInput, Transcript, InputExhausted
+from Sweep import Distribution
+from words import MemoryWordDeck, SecretWord
+
+
+def _play_game(input_source, seed: int):
+    # The real interactive path, only the screen goes nowhere and the pauses
+    # are virtual. The words come from a deck seeded like the session instead
+    # of the shared deck files, so a replay draws the same words as the
+    # recording. Returns False when the answers ran out before the end
+    random.seed(seed)
+    word_deck = MemoryWordDeck(SecretWord.get_theme_store(), random.Random(seed))
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            Game(clock=VirtualClock(), input_source=input_source, word_deck=word_deck).start()
+    except InputExhausted:
+        return False
+    return True
+
+
+def generate_transcripts(transcripts_count: int, seed: int = 0, invalid_chance: float = 0.1):
+    rng = random.Random(seed)
+    for _ in range(transcripts_count):
+        transcript = Transcript(rng.getrandbits(32))
+        input_source = RecordingInput(RandomInput(random.Random(rng.getrandbits(32)), invalid_chance), transcript)
+        _play_game(input_source, transcript.seed)
+        yield transcript
+
+
+class SessionResult:
+    __slots__ = ('answers_count', 'seconds', 'latencies', 'is_complete')
+
+    def __init__(self, answers_count, seconds, latencies, is_complete):
+        self.answers_count = answers_count
+        self.seconds = seconds
+        # {prompt: Distribution of microseconds}
+        self.latencies = latencies
+        self.is_complete = is_complete
+
+
+def replay_transcript(transcript: Transcript):
+    replay_input = ReplayInput(transcript.get_answers())
+
+    start = time.perf_counter()
+    is_complete = _play_game(replay_input, transcript.seed)
+    seconds = time.perf_counter() - start
+
+    latencies = {
+        prompt: Distribution(int(latency * 1e6) for latency in prompt_latencies)
+        for prompt, prompt_latencies in replay_input.latencies.items()
+    }
+    return SessionResult(replay_input.answers_count, seconds, latencies, is_complete)
+
+
+class LoadTestReport:
+    def __init__(self):
+        self.sessions_count = 0
+        self.incomplete_sessions_count = 0
+        self.answers_count = 0
+        self.seconds = 0
+        self.latencies = {}
+
+    def add(self, session_result: SessionResult):
+        self.sessions_count += 1
+        self.answers_count += session_result.answers_count
+        if not session_result.is_complete:
+            self.incomplete_sessions_count += 1
+
+        for prompt, latencies in session_result.latencies.items():
+            self.latencies.setdefault(prompt, Distribution()).update(latencies)
+
+    def get_answers_per_second(self):
+        return self.answers_count / self.seconds if self.seconds else 0
+
+    def get_sessions_per_second(self):
+        return self.sessions_count / self.seconds if self.seconds else 0
+
+
+def replay_transcripts(transcripts):
+    return [replay_transcript(transcript) for transcript in transcripts]
+
+
+def run_load_test(transcripts, workers: int = None, chunk_size: int = 16):
+    # Only a couple of chunks per worker are read ahead, so the transcripts
+    # can come straight from a file bigger than the memory
+    report = LoadTestReport()
+    start = time.perf_counter()
+
+    if workers == 1:
+        for transcript in transcripts:
+            report.add(replay_transcript(transcript))
+    else:
+        workers = workers or os.cpu_count() or 1
+        transcripts = iter(transcripts)
+        chunks = iter(lambda: list(islice(transcripts, chunk_size)), [])
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for chunk in chunks:
+                pending.add(executor.submit(replay_transcripts, chunk))
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        for session_result in future.result():
+                            report.add(session_result)
+
+            for future in as_completed(pending):
+                for session_result in future.result():
+                    report.add(session_result)
+
+    report.seconds = time.perf_counter() - start
+    return report
@@ -1,26 +1,45 @@
 from typing import Tuple
 
-from player import Player, InvalidAmount
+from player import Leaderboard, Player, InvalidAmount
 from RoundCLI import RoundCLI
 from menu import Menu, InvalidMenuOption
-from words import SecretWord, InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess
+from words import SecretWord, CandidateIndex, RevealKind, RevealStatus, letters
 from Wheel import Wheel
-from helpers import sleep
+from RoundRules import RoundRules
 
 
 class Round:
-    __GUESS_TYPE_WHEEL = 'wheel'
-    __GUESS_TYPE_BUY = 'buy'
-
-    __VOWEL_COST = 200
-    __WORD_VALUE = 500
-
-    def __init__(self, secret_word: SecretWord, theme: str, players: Tuple[Player, ...] = None):
+    STATE_CHOOSING_OPTION = 'choosing_option'
+    STATE_GUESSING_CONSONANT = 'guessing_consonant'
+    STATE_GUESSING_VOWEL = 'guessing_vowel'
+    STATE_GUESSING_WORD = 'guessing_word'
+    STATE_FINISHED = 'finished'
+
+    __CONSONANTS_MASK = letters.CONSONANTS_MASK | letters.DIGITS_MASK
+
+    __REVEAL_KINDS = {
+        STATE_GUESSING_CONSONANT: RevealKind.CONSONANT_OR_NUMBER,
+        STATE_GUESSING_VOWEL: RevealKind.VOWEL,
+    }
+
+    def __init__(
+            self,
+            secret_word: SecretWord,
+            theme: str,
+            players: Tuple[Player, ...] = None,
+            cli: RoundCLI = None,
+            rules: RoundRules = None,
+            leaderboard: Leaderboard = None,
+    ):
         self._set_secret_word(secret_word)
         self._theme = theme
+        self._cli = cli if cli is not None else RoundCLI()
+        self._rules = rules if rules is not None else RoundRules()
+        self._leaderboard = leaderboard
         self._set_players(players)
         self._set_wheel()
         self._set_menu()
+        self._set_state_handlers()
 
     def _set_players(self, players):
         if players is None:
@@ -29,14 +48,17 @@ class Round:
         self._players_count = len(self._players)
         self._current_player_index = 0
         self._current_player = self._players[0]
+        self._winner = None
 
     def _set_wheel(self):
-        self._wheel = Wheel([100, 200, 300, 400, 500])
+        self._wheel = Wheel(list(self._rules.wheel_options))
         self._letter_value = 0
 
     def _set_secret_word(self, secret_word):
         self._secret_word = secret_word
-        self._guessed_letters = []
+        self._state = Round.STATE_CHOOSING_OPTION
+        self._turns_count = 1
+        self._guesses_count = 0
 
     def _set_menu(self):
         self._menu = Menu('Escolha uma das opções:', {
@@ -45,134 +67,202 @@ class Round:
                 'action': self._spin_the_wheel
             },
             '2': {
-                'description': f'Comprar vogál por R${Round.__VOWEL_COST:.2f}',
+                'description': f'Comprar vogál por R${self._rules.vowel_cost:.2f}',
                 'action': self._buy_vowel
             },
             '3': {
                 'description': 'Advinhe a palavra',
-                'action': self._guess_word
+                'action': self._ask_for_word
+            },
+            '4': {
+                'description': 'Pedir uma dica',
+                'action': self._give_hint
             }
         })
 
-    def run(self):
-        return self._run_turn()
+    def _set_state_handlers(self):
+        self._state_handlers = {
+            Round.STATE_CHOOSING_OPTION: self._choose_option,
+            Round.STATE_GUESSING_CONSONANT: self._guess_letter,
+            Round.STATE_GUESSING_VOWEL: self._guess_letter,
+            Round.STATE_GUESSING_WORD: self._guess_word,
+        }
+
+    @property
+    def state(self):
+        return self._state
+
+    @property
+    def is_finished(self):
+        return self._state == Round.STATE_FINISHED
+
+    @property
+    def current_player(self):
+        return self._current_player
+
+    @property
+    def secret_word(self):
+        return self._secret_word
+
+    @property
+    def theme(self):
+        return self._theme
+
+    @property
+    def players(self):
+        return self._players
 
-    def _run_turn(self):
+    @property
+    def winner(self):
+        return self._winner
+
+    @property
+    def letter_value(self):
+        return self._letter_value
+
+    @property
+    def vowel_cost(self):
+        return self._rules.vowel_cost
+
+    @property
+    def turns_count(self):
+        return self._turns_count
+
+    @property
+    def guesses_count(self):
+        return self._guesses_count
+
+    def run(self):
+        while not self.is_finished:
+            self.step(self._input_action())
+
+    async def run_async(self, clock):
+        # Same loop as run, but the pauses collected by an AsyncClock during
+        # each step are awaited on the event loop, so many rounds can share it
+        while not self.is_finished:
+            self.step(self._input_action())
+            await clock.flush()
+
+    def step(self, action: str):
+        # Applies one input (menu option, letter or word) to the current state
+        # and returns the next state, without ever recursing into the next turn
+        if not self.is_finished:
+            self._state_handlers[self._state](action)
+        return self._state
+
+    def _input_action(self):
         self._print_turn_start_message()
-        self._input_options_menu()
+
+        if self._state == Round.STATE_CHOOSING_OPTION:
+            return self._cli.input_option(self._menu)
+        if self._state == Round.STATE_GUESSING_CONSONANT:
+            self._cli.print_letter_value_message(self._letter_value)
+            return self._cli.input_consonant_or_number_guess()
+        if self._state == Round.STATE_GUESSING_VOWEL:
+            return self._cli.input_vowel_guess()
+        return self._cli.input_word_guess()
 
     def _print_turn_start_message(self):
-        RoundCLI.print_start_message(self._secret_word, self._theme, self._current_player)
+        self._cli.print_start_message(self._secret_word, self._theme, self._current_player, self.get_standings())
 
-    def _input_options_menu(self):
+    def get_standings(self, players_count=5):
+        # Players with the most money, read from the leaderboard without sorting
+        if self._leaderboard is None:
+            return []
+        return self._leaderboard.top(players_count)
+
+    def _choose_option(self, option):
         try:
-            option_action = self._menu.input_menu()
-            option_action()
+            option_action = self._menu.select(option)
         except InvalidMenuOption as e:
-            print(e)
-            sleep(1)
-            self._run_turn()
+            self._cli.print_invalid_option_message(e)
             return
 
+        option_action()
+
     def _spin_the_wheel(self):
+        # With every consonant and number guessed, no answer could ever be accepted
+        if self._secret_word.guessed_letters_mask & Round.__CONSONANTS_MASK == Round.__CONSONANTS_MASK:
+            self._cli.print_invalid_option_message('Todas as consoantes e números já foram chutados')
+            return
+
         self._letter_value = self._wheel.spin()
-        self._try_to_guess(Round.__GUESS_TYPE_WHEEL)
+        self._state = Round.STATE_GUESSING_CONSONANT
 
     def _buy_vowel(self):
+        if self._secret_word.guessed_letters_mask & letters.VOWELS_MASK == letters.VOWELS_MASK:
+            self._cli.print_invalid_option_message('Todas as vogais já foram chutadas')
+            return
+
         try:
-            self._current_player.takes_money(Round.__VOWEL_COST)
-            self._try_to_guess(Round.__GUESS_TYPE_BUY)
+            self._current_player.takes_money(self._rules.vowel_cost)
+            self._state = Round.STATE_GUESSING_VOWEL
         except InvalidAmount:
-            print(f'Você não tem dinheiro suficiente para comprar uma vogal')
-            sleep(2)
-            self._run_turn()
+            self._cli.print_not_enough_money_message()
 
-    def _guess_word(self):
-        self._print_turn_start_message()
-        guess = input('Qual é a palavra? ')
-        has_guessed_word = self._secret_word.check_word(guess)
+    def _ask_for_word(self):
+        self._state = Round.STATE_GUESSING_WORD
+
+    def _give_hint(self):
+        hidden_word = self._secret_word.get_hidden_word()
+        guessed_letters = self._secret_word.previously_guessed_letters
+
+        candidate_index = CandidateIndex.for_theme(self._theme)
+        frequencies = candidate_index.get_letter_frequencies(hidden_word, guessed_letters)
+        candidates_count = candidate_index.count_candidates(hidden_word, guessed_letters)
+
+        best_letter = max(frequencies, key=frequencies.get) if frequencies else None
+        self._cli.print_hint_message(candidates_count, best_letter)
 
+    def _guess_word(self, guess):
+        has_guessed_word = self._secret_word.check_word(guess)
+        self._guesses_count += 1
         self._print_turn_start_message()
-        sleep(1)
 
         if has_guessed_word:
-            self._current_player.add_money(Round.__WORD_VALUE)
-            print(f'Você chutou {self._secret_word.get_word()} e acertou!')
-            sleep(2)
-            print(f'Você ganhou R${Round.__WORD_VALUE:.2f}')
-            sleep(2)
+            self._current_player.add_money(self._rules.word_value)
 
-        self._check_round(has_guessed_word)
+        self._cli.print_word_guess_message(has_guessed_word, self._secret_word.get_word(), self._rules.word_value)
+        self._end_turn(has_guessed_word)
 
-    def _try_to_guess(self, guess_type):
-        self._print_turn_start_message()
+    def _guess_letter(self, guess):
+        kind = Round.__REVEAL_KINDS[self._state]
+        self._cli.print_guess_message(guess)
+        status, letter_count = self._secret_word.try_reveal(guess, kind)
 
-        if guess_type == Round.__GUESS_TYPE_WHEEL:
-            RoundCLI.print_letter_value_message(self._letter_value)
+        if status == RevealStatus.REVEALED or status == RevealStatus.NOT_FOUND:
+            self._guesses_count += 1
+            has_guessed_letter = status == RevealStatus.REVEALED
+            self._check_guess(guess, letter_count, has_guessed_letter)
+            self._end_turn(has_guessed_letter)
+            return
 
-        try:
-            guess = self._input_guess(guess_type)
-            has_guessed_letter = self._check_guess(guess, guess_type)
-            self._check_round(has_guessed_letter)
-        except (InvalidLetter, HasGuessedLetterBefore) as error_message:
-            print(error_message)
-            sleep(1.5)
-            self._try_to_guess(guess_type)
-        except NothingLeftToGuess as error_message:
-            print(error_message)
-            sleep(1.5)
-
-    def _check_guess(self, guess, guess_type):
-        print(f"Você chutou '{guess}'")
-        letter_count = self._secret_word.get_letter_count(guess)
-        has_guessed_letter = self._reveal_letter(guess, guess_type)
-
-        if has_guessed_letter:
-            RoundCLI.print_guessed_correctly_message(letter_count, guess)
-
-            if guess_type == Round.__GUESS_TYPE_WHEEL:
-                earned_money = self._letter_value * letter_count
-                self._current_player.add_money(earned_money)
-                RoundCLI.print_earned_money_message(earned_money)
-
-        return has_guessed_letter
-
-    def _reveal_letter(self, guess, guess_type):
-        if guess_type == Round.__GUESS_TYPE_WHEEL:
-            has_guessed_letter = self._secret_word.reveal_consonant_or_number(guess)
-        elif guess_type == Round.__GUESS_TYPE_BUY:
-            has_guessed_letter = self._secret_word.reveal_vowel(guess)
-        else:
-            has_guessed_letter = False
-
-        return has_guessed_letter
-
-    def _input_guess(self, guess_type):
-        guess = ''
-
-        if guess_type == Round.__GUESS_TYPE_WHEEL:
-            guess = RoundCLI.input_consonant_or_number_guess()
-        elif guess_type == Round.__GUESS_TYPE_BUY:
-            guess = RoundCLI.input_vowel_guess()
-
-        return guess
-
-    def _check_round(self, has_guessed_letter):
-        if self._secret_word.was_guessed:
+        self._cli.print_invalid_guess_message(SecretWord.get_reveal_message(status, guess, kind))
+        if status == RevealStatus.NOTHING_LEFT:
+            self._state = Round.STATE_FINISHED
+
+    def _check_guess(self, guess, letter_count, has_guessed_letter):
+        if not has_guessed_letter:
             return
 
-        RoundCLI.print_end_turn_message(has_guessed_letter)
-        if has_guessed_letter:
-            return self._continue_turn()
-        else:
-            return self._next_turn()
+        self._cli.print_guessed_correctly_message(letter_count, guess)
+
+        if self._state == Round.STATE_GUESSING_CONSONANT:
+            earned_money = self._letter_value * letter_count
+            self._current_player.add_money(earned_money)
+            self._cli.print_earned_money_message(earned_money)
 
-    def _continue_turn(self):
-        return self._run_turn()
+    def _end_turn(self, has_guessed):
+        if self._secret_word.was_guessed:
+            self._winner = self._current_player
+            self._state = Round.STATE_FINISHED
+            return
 
-    def _next_turn(self):
-        self._select_next_player()
-        return self._run_turn()
+        self._cli.print_end_turn_message(has_guessed)
+        if not has_guessed:
+            self._select_next_player()
+            self._turns_count += 1
+        self._state = Round.STATE_CHOOSING_OPTION
 
     def _select_next_player(self):
         next_player_index = self._current_player_index + 1
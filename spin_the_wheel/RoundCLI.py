@@ -1,66 +1,166 @@
-from spin_the_wheel.player import Player
+from player import Player
 
-from helpers import clear, normalize, sleep
+from FrameRenderer import FrameRenderer
+from helpers import get_default_clock, normalize
+from inputs import ConsoleInput
 from words import SecretWord
 
 
 class RoundCLI:
-    @staticmethod
-    def print_start_message(secret_word: SecretWord, theme: str, current_player: Player):
+    def __init__(self, renderer: FrameRenderer = None, clock=None, input_source=None):
+        self._renderer = renderer if renderer is not None else FrameRenderer()
+        self._clock = clock if clock is not None else get_default_clock()
+        self._input_source = input_source if input_source is not None else ConsoleInput()
+
+    def print_start_message(self, secret_word: SecretWord, theme: str, current_player: Player, standings=()):
         hidden_word = secret_word.get_hidden_word()
         guessed_letters = secret_word.previously_guessed_letters
         theme = theme.replace('_', ' ').strip().title()
 
-        clear()
-        print(f'Tema: {theme}')
-        print(' '.join(hidden_word))
-        print()
+        frame = [
+            f'Tema: {theme}',
+            ' '.join(hidden_word),
+            '',
+        ]
 
         if len(guessed_letters) > 0:
-            RoundCLI.print_guessed_letters(guessed_letters)
+            frame.extend(self.get_guessed_letters_lines(guessed_letters))
+
+        frame.append(f"Turno: {current_player.name} | R${current_player.money:.2f}")
+        frame.append('')
+
+        if len(standings) > 1:
+            frame.extend(self.get_standings_lines(standings))
+
+        self._renderer.render(frame)
 
-        print(f"Turno: {current_player.name} | R${current_player.money:.2f}")
-        print()
+    def get_standings_lines(self, standings):
+        lines = [f"#{rank} - {player.name} com R${player.money:.2f}" for rank, player in enumerate(standings, 1)]
+        lines.append('')
+        return lines
 
-    @staticmethod
-    def print_guessed_letters(guessed_letters):
-        print('Letras que já foram chutadas:')
-        print(f'[ {", ".join(sorted(guessed_letters))} ]')
-        print()
+    def get_guessed_letters_lines(self, guessed_letters):
+        return [
+            'Letras que já foram chutadas:',
+            f'[ {", ".join(sorted(guessed_letters))} ]',
+            '',
+        ]
 
-    @staticmethod
-    def print_letter_value_message(letter_value):
-        print(f"Nessa rodada cada letra vale R${letter_value:.2f}")
-        print()
+    def print_letter_value_message(self, letter_value):
+        self._print(f"Nessa rodada cada letra vale R${letter_value:.2f}")
+        self._print()
 
-    @staticmethod
-    def input_consonant_or_number_guess():
-        guess = input("Chute uma consoante ou número: ")
+    def input_option(self, menu):
+        option = menu.input_option(self._input_source)
+        self._renderer.invalidate()
+        return option
+
+    def input_consonant_or_number_guess(self):
+        guess = self._input("Chute uma consoante ou número: ")
         guess = normalize(guess)
 
         return guess
 
-    @staticmethod
-    def input_vowel_guess():
-        guess = input("Chute uma vogal: ")
+    def input_vowel_guess(self):
+        guess = self._input("Chute uma vogal: ")
         guess = normalize(guess)
 
         return guess
 
-    @staticmethod
-    def print_guessed_correctly_message(letter_count, guess):
-        print(f"Tem {letter_count} letras '{guess}'")
-        sleep(0.5)
+    def input_word_guess(self):
+        return self._input('Qual é a palavra? ')
+
+    def _input(self, prompt):
+        answer = self._input_source(prompt)
+        self._renderer.invalidate()
+        return answer
+
+    def _print(self, *values):
+        # Anything written outside the renderer may scroll the frame, so the
+        # next one is a full repaint
+        print(*values)
+        self._renderer.invalidate()
+
+    def print_invalid_option_message(self, error):
+        self._print(error)
+        self._clock.sleep(1)
+
+    def print_not_enough_money_message(self):
+        self._print(f'Você não tem dinheiro suficiente para comprar uma vogal')
+        self._clock.sleep(2)
+
+    def print_guess_message(self, guess):
+        self._print(f"Você chutou '{guess}'")
+
+    def print_invalid_guess_message(self, message):
+        self._print(message)
+        self._clock.sleep(1.5)
+
+    def print_guessed_correctly_message(self, letter_count, guess):
+        self._print(f"Tem {letter_count} letras '{guess}'")
+        self._clock.sleep(0.5)
+
+    def print_earned_money_message(self, earned_money):
+        self._print(f"Você ganhou R${earned_money:.2f}")
+        self._clock.sleep(0.5)
+
+    def print_word_guess_message(self, has_guessed_word, word, word_value):
+        self._clock.sleep(1)
+        if not has_guessed_word:
+            return
 
-    @staticmethod
-    def print_earned_money_message(earned_money):
-        print(f"Você ganhou R${earned_money:.2f}")
-        sleep(0.5)
+        self._print(f'Você chutou {word} e acertou!')
+        self._clock.sleep(2)
+        self._print(f'Você ganhou R${word_value:.2f}')
+        self._clock.sleep(2)
 
-    @staticmethod
-    def print_end_turn_message(keep_playing):
+    def print_hint_message(self, candidates_count, best_letter):
+        if best_letter is None:
+            self._print('Não tenho nenhuma dica para essa palavra')
+        else:
+            self._print(f"Ainda existem {candidates_count} palavras possíveis, a letra mais comum entre elas é '{best_letter}'")
+        self._clock.sleep(2.5)
+
+    def print_end_turn_message(self, keep_playing):
         if keep_playing:
-            print("Continue jogando")
+            self._print("Continue jogando")
         else:
-            print("Não foi dessa vez.")
-        sleep(2)
+            self._print("Não foi dessa vez.")
+        self._clock.sleep(2)
+
+
+# Same interface as RoundCLI, but nothing is rendered and nothing sleeps, so a
+# round can be driven by Round.step as fast as the decisions come
+class HeadlessRoundCLI(RoundCLI):
+    def print_start_message(self, secret_word, theme, current_player, standings=()):
+        pass
+
+    def print_letter_value_message(self, letter_value):
+        pass
+
+    def print_invalid_option_message(self, error):
+        pass
+
+    def print_not_enough_money_message(self):
+        pass
+
+    def print_guess_message(self, guess):
+        pass
+
+    def print_invalid_guess_message(self, message):
+        pass
+
+    def print_guessed_correctly_message(self, letter_count, guess):
+        pass
+
+    def print_earned_money_message(self, earned_money):
+        pass
+
+    def print_word_guess_message(self, has_guessed_word, word, word_value):
+        pass
+
+    def print_hint_message(self, candidates_count, best_letter):
+        pass
+
+    def print_end_turn_message(self, keep_playing):
+        pass
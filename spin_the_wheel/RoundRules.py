@@ -0,0 +1,11 @@
+from typing import Sequence
+
+
+class RoundRules:
+    def __init__(self, vowel_cost: int = 200, word_value: int = 500, wheel_options: Sequence[int] = (100, 200, 300, 400, 500)):
+        self.vowel_cost = vowel_cost
+        self.word_value = word_value
+        self.wheel_options = tuple(wheel_options)
+
+    def __repr__(self):
+        return f'RoundRules(vowel_cost={self.vowel_cost}, word_value={self.word_value}, wheel_options={self.wheel_options})'
@@ -0,0 +1,173 @@
+from random import choice, random, randrange
+from typing import Callable, Sequence
+
+from Game import Game
+from player import Player
+from Round import Round
+from RoundRules import RoundRules
+from RoundCLI import HeadlessRoundCLI
+from words import SecretWord, CandidateIndex, letters
+
+_CONSONANTS = 'BCDFGHJKLMNPQRSTVWXYZ'
+_VOWELS = 'AEIOU'
+_DIGITS = '0123456789'
+
+
+def _choose_letter_left(letters_to_choose: str, letters_mask: int, guessed_letters_mask: int):
+    # Draws letters until one was not guessed yet, which is much cheaper than
+    # listing the letters left on every decision
+    if guessed_letters_mask & letters_mask == letters_mask:
+        return None
+
+    while True:
+        letter = letters_to_choose[int(random() * len(letters_to_choose))]
+        if not guessed_letters_mask & letters.letter_bit(letter):
+            return letter
+
+
+def _guess_candidate_word(game_round: Round):
+    secret_word = game_round.secret_word
+    candidates, _ = CandidateIndex.for_theme(game_round.theme).query(
+        secret_word.get_hidden_word(), secret_word.previously_guessed_letters
+    )
+    return choice(sorted(candidates)) if candidates else ''
+
+
+# A strategy receives the round waiting for a decision and returns the input a
+# player would type for Round.state: a menu option, a letter or a word
+def random_strategy(game_round: Round):
+    state = game_round.state
+    guessed_letters_mask = game_round.secret_word.guessed_letters_mask
+
+    if state == Round.STATE_GUESSING_CONSONANT:
+        return _choose_letter_left(_CONSONANTS, letters.CONSONANTS_MASK, guessed_letters_mask) or \
+            _choose_letter_left(_DIGITS, letters.DIGITS_MASK, guessed_letters_mask) or '0'
+    if state == Round.STATE_GUESSING_VOWEL:
+        return _choose_letter_left(_VOWELS, letters.VOWELS_MASK, guessed_letters_mask) or 'A'
+    if state == Round.STATE_GUESSING_WORD:
+        return _guess_candidate_word(game_round)
+
+    can_buy_vowel = game_round.current_player.money >= game_round.vowel_cost
+    has_vowels_left = guessed_letters_mask & letters.VOWELS_MASK != letters.VOWELS_MASK
+    has_consonants_left = guessed_letters_mask & letters.CONSONANTS_MASK != letters.CONSONANTS_MASK
+
+    if can_buy_vowel and has_vowels_left and (not has_consonants_left or random() < 0.25):
+        return '2'
+    if has_consonants_left:
+        return '1'
+    return '3'
+
+
+def frequency_strategy(game_round: Round):
+    # Plays like a solver: guesses the word as soon as only one theme word fits
+    # the board, otherwise the letter most common among the remaining words
+    state = game_round.state
+    secret_word = game_round.secret_word
+    candidate_index = CandidateIndex.for_theme(game_round.theme)
+    hidden_word = secret_word.get_hidden_word()
+    guessed_letters = secret_word.previously_guessed_letters
+
+    if state == Round.STATE_GUESSING_WORD:
+        return _guess_candidate_word(game_round)
+
+    frequencies = candidate_index.get_letter_frequencies(hidden_word, guessed_letters)
+    if state == Round.STATE_GUESSING_CONSONANT:
+        candidates = [letter for letter in frequencies if letter not in _VOWELS]
+        return max(candidates, key=frequencies.get) if candidates else random_strategy(game_round)
+    if state == Round.STATE_GUESSING_VOWEL:
+        candidates = [letter for letter in frequencies if letter in _VOWELS]
+        return max(candidates, key=frequencies.get) if candidates else random_strategy(game_round)
+
+    if candidate_index.count_candidates(hidden_word, guessed_letters) == 1:
+        return '3'
+    return random_strategy(game_round)
+
+
+class GameResult:
+    __slots__ = ('money', 'rounds_winners', 'rounds_turns', 'turns_count', 'guesses_count')
+
+    def __init__(self, players_count: int):
+        self.money = [0] * players_count
+        self.rounds_winners = []
+        self.rounds_turns = []
+        self.turns_count = 0
+        self.guesses_count = 0
+
+
+class SimulationReport:
+    def __init__(self, players_count: int):
+        self.games_count = 0
+        self.rounds_count = 0
+        self.unfinished_rounds_count = 0
+        self.turns_count = 0
+        self.guesses_count = 0
+        self.money = [0] * players_count
+        self.game_wins = [0] * players_count
+
+    def add(self, game_result: GameResult):
+        self.games_count += 1
+        self.rounds_count += len(game_result.rounds_winners)
+        self.unfinished_rounds_count += game_result.rounds_winners.count(None)
+        self.turns_count += game_result.turns_count
+        self.guesses_count += game_result.guesses_count
+
+        for i, money in enumerate(game_result.money):
+            self.money[i] += money
+        self.game_wins[game_result.money.index(max(game_result.money))] += 1
+
+    def get_average_money(self):
+        return [money / max(self.games_count, 1) for money in self.money]
+
+
+# Plays whole games without input, rendering or sleeping: every decision comes
+# from the strategy of the current player
+class Simulation:
+    def __init__(
+            self,
+            strategies: Sequence[Callable[[Round], str]],
+            rounds_count: int = 3,
+            themes: Sequence[str] = Game.THEMES,
+            max_steps_per_round: int = 1000,
+            rules: RoundRules = None,
+    ):
+        self._strategies = list(strategies)
+        self._rounds_count = rounds_count
+        self._themes = themes
+        self._max_steps_per_round = max_steps_per_round
+        self._rules = rules
+        self._cli = HeadlessRoundCLI()
+
+    def run(self, games_count: int):
+        report = SimulationReport(len(self._strategies))
+        for _ in range(games_count):
+            report.add(self.run_game())
+        return report
+
+    def run_game(self):
+        players = tuple(Player(f'Bot {i + 1}') for i in range(len(self._strategies)))
+        strategies = dict(zip(players, self._strategies))
+        game_result = GameResult(len(players))
+
+        for _ in range(self._rounds_count):
+            theme = self._themes[randrange(0, len(self._themes))]
+            game_round = self.create_round(SecretWord(theme=theme), theme, players)
+            self._play_round(game_round, strategies)
+
+            winner = game_round.winner
+            game_result.rounds_winners.append(None if winner is None else players.index(winner))
+            game_result.rounds_turns.append(game_round.turns_count)
+            game_result.turns_count += game_round.turns_count
+            game_result.guesses_count += game_round.guesses_count
+
+        game_result.money = [player.money for player in players]
+        return game_result
+
+    def create_round(self, secret_word: SecretWord, theme: str, players):
+        return Round(secret_word, theme, players, cli=self._cli, rules=self._rules)
+
+    def _play_round(self, game_round: Round, strategies: dict):
+        step = game_round.step
+        for _ in range(self._max_steps_per_round):
+            if game_round.is_finished:
+                return
+            step(strategies[game_round.current_player](game_round))
@@ -0,0 +1,132 @@
+import os
+import random
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Sequence
+
+from Round import Round
+from RoundRules import RoundRules
+from Simulation import Simulation
+
+
+class Distribution(Counter):
+    # Histogram of integer samples, cheap to send between processes and to merge
+
+    @property
+    def count(self):
+        return sum(self.values())
+
+    def mean(self):
+        count = self.count
+        return sum(value * times for value, times in self.items()) / count if count else 0
+
+    def percentile(self, percent: float):
+        count = self.count
+        if not count:
+            return 0
+
+        target = percent / 100 * (count - 1)
+        seen = 0
+        for value in sorted(self):
+            seen += self[value]
+            if seen > target:
+                return value
+        return max(self)
+
+    def summary(self):
+        return {
+            'mean': self.mean(),
+            'p5': self.percentile(5),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+        }
+
+
+class SweepResult:
+    def __init__(self, rules: RoundRules):
+        self.rules = rules
+        self.games_count = 0
+        self.earnings = Distribution()
+        self.round_turns = Distribution()
+        self.win_margins = Distribution()
+
+    def merge(self, other: 'SweepResult'):
+        self.games_count += other.games_count
+        self.earnings.update(other.earnings)
+        self.round_turns.update(other.round_turns)
+        self.win_margins.update(other.win_margins)
+
+
+def get_chunk_seed(seed: int, configuration_index: int, chunk_index: int):
+    # Seeding Random with a str hashes it with sha512, so the same sweep always
+    # gives every chunk the same independent stream, whatever worker runs it
+    return random.Random(f'{seed}:{configuration_index}:{chunk_index}').getrandbits(64)
+
+
+def run_chunk(rules: RoundRules, strategies: Sequence[Callable[[Round], str]], games_count: int, chunk_seed: int):
+    # The game code draws from the module level random, which is private to
+    # each worker process, so seeding it here is enough
+    random.seed(chunk_seed)
+    simulation = Simulation(strategies, rules=rules)
+    result = SweepResult(rules)
+
+    for _ in range(games_count):
+        game_result = simulation.run_game()
+        money = sorted(game_result.money, reverse=True)
+
+        result.games_count += 1
+        result.earnings.update(game_result.money)
+        result.round_turns.update(game_result.rounds_turns)
+        result.win_margins[money[0] - money[1] if len(money) > 1 else money[0]] += 1
+
+    return result
+
+
+def sweep(
+        configurations: Sequence[RoundRules],
+        strategies: Sequence[Callable[[Round], str]],
+        games_per_configuration: int,
+        games_per_chunk: int = 200,
+        workers: int = None,
+        seed: int = 0,
+):
+    # Yields (configuration index, SweepResult so far) every time a chunk
+    # finishes. Only a couple of chunks per worker are queued at a time, so
+    # breaking out of the loop stops the sweep without waiting for the rest
+    chunks = []
+    for configuration_index in range(len(configurations)):
+        games_left = games_per_configuration
+        chunk_index = 0
+        while games_left > 0:
+            games_count = min(games_per_chunk, games_left)
+            chunks.append((configuration_index, games_count, get_chunk_seed(seed, configuration_index, chunk_index)))
+            games_left -= games_count
+            chunk_index += 1
+
+    results = [SweepResult(rules) for rules in configurations]
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    max_pending = 2 * workers
+    pending = {}
+    chunks = iter(chunks)
+
+    try:
+        while True:
+            for configuration_index, games_count, chunk_seed in chunks:
+                future = executor.submit(
+                    run_chunk, configurations[configuration_index], strategies, games_count, chunk_seed
+                )
+                pending[future] = configuration_index
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                configuration_index = pending.pop(future)
+                results[configuration_index].merge(future.result())
+                yield configuration_index, results[configuration_index]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
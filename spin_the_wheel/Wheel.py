@@ -1,9 +1,30 @@
-from random import randrange, randint
-from decimal import Decimal
+import random
+from fractions import Fraction
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
-def to_decimal(value):
-    return Decimal(str(value))
+
+def _build_alias_table(probabilities: [Fraction]):
+    # Vose's alias method: every column keeps the chance of its own outcome and
+    # the outcome that fills the rest of it, so a draw is one column and one coin
+    count = len(probabilities)
+    scaled = [probability * count for probability in probabilities]
+    chances = [1.0] * count
+    aliases = list(range(count))
+
+    small = [i for i, probability in enumerate(scaled) if probability < 1]
+    large = [i for i, probability in enumerate(scaled) if probability >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        chances[less] = float(scaled[less])
+        aliases[less] = more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+
+    return chances, aliases
 
 
 class Wheel:
@@ -12,23 +33,105 @@ class Wheel:
         (3, 7),
         (8, 14),
     ]
-    _PRECISION_FACTOR = (0.9, 1, 1.1)
+    # 0.9, 1 and 1.1 as fractions, the placement is truncated after scaling
+    _PRECISION_FACTOR = (Fraction(9, 10), Fraction(1), Fraction(11, 10))
+
+    # {options count: (position probabilities, alias tables...)}
+    __tables = {}
+
+    def __init__(self, options: [int], rng: random.Random = None):
+        if not options:
+            raise ValueError('A roleta precisa de pelo menos uma opção')
 
-    def __init__(self, options: [int]):
         self._options = options
+        self._random = rng.random if rng is not None else random.random
+        self._alias_arrays = {}
+
+        # The chances only depend on how many options there are, so every
+        # wheel with the same size shares them
+        tables = Wheel.__tables.get(len(options))
+        if tables is None:
+            tables = self._build_tables()
+            Wheel.__tables[len(options)] = tables
+        (self._position_probabilities, self._random_strength_probabilities,
+         self._alias_tables, self._random_strength_alias_table) = tables
+
+    def _build_tables(self):
+        position_probabilities = [self._get_position_probabilities(strength)
+                                  for strength in range(len(Wheel._STRENGTH_RANGES))]
+        random_strength_probabilities = [
+            sum(probabilities) / len(Wheel._STRENGTH_RANGES)
+            for probabilities in zip(*position_probabilities)
+        ]
+
+        alias_tables = [_build_alias_table(probabilities) for probabilities in position_probabilities]
+        random_strength_alias_table = _build_alias_table(random_strength_probabilities)
+        return position_probabilities, random_strength_probabilities, alias_tables, random_strength_alias_table
 
     def spin(self, strength=None):
+        chances, aliases = self._get_alias_table(strength)
+
+        position = int(self._random() * len(chances))
+        if self._random() >= chances[position]:
+            position = aliases[position]
+        return self._options[position]
+
+    def spin_many(self, spins_count: int, strength=None, rng=None):
+        # Same draw as spin, done for every spin at once. rng is anything
+        # numpy.random.default_rng accepts: a seed, a Generator or None
+        if numpy is None:
+            raise RuntimeError('spin_many precisa do numpy instalado')
+
+        rng = numpy.random.default_rng(rng)
+        options, chances, aliases = self._get_alias_arrays(strength)
+
+        positions = rng.integers(0, len(chances), size=spins_count)
+        coins = rng.random(spins_count)
+        positions = numpy.where(coins < chances[positions], positions, aliases[positions])
+        return options[positions]
+
+    def _get_alias_table(self, strength):
         if not strength:
-            strength = randrange(len(Wheel._STRENGTH_RANGES))
-        rand_position = self._get_position(strength)
-        return self._options[rand_position]
+            return self._random_strength_alias_table
+        return self._alias_tables[strength]
 
-    def _get_position(self, strength):
-        rand_precision = randrange(0, len(Wheel._PRECISION_FACTOR))
-        precision = Wheel._PRECISION_FACTOR[rand_precision]
+    def _get_alias_arrays(self, strength):
+        key = strength or 0
+        alias_arrays = self._alias_arrays.get(key)
+        if alias_arrays is None:
+            chances, aliases = self._get_alias_table(strength)
+            alias_arrays = (numpy.array(self._options), numpy.array(chances), numpy.array(aliases))
+            self._alias_arrays[key] = alias_arrays
+        return alias_arrays
 
+    def distribution(self, strength=None):
+        # Exact chance of every option, options that show up more than once on
+        # the wheel have their chances added together
+        if not strength:
+            probabilities = self._random_strength_probabilities
+        else:
+            probabilities = self._position_probabilities[strength]
+
+        distribution = {}
+        for option, probability in zip(self._options, probabilities):
+            distribution[option] = distribution.get(option, 0) + probability
+        return distribution
+
+    def _get_position_probabilities(self, strength):
+        probabilities = [Fraction(0)] * len(self._options)
         min_placement, max_placement = Wheel._STRENGTH_RANGES[strength]
-        rand_placement = randint(min_placement, max_placement)
+        outcomes_count = (max_placement - min_placement + 1) * len(Wheel._PRECISION_FACTOR)
+
+        for placement in range(min_placement, max_placement + 1):
+            for precision in Wheel._PRECISION_FACTOR:
+                position = self._get_position(int(placement * precision))
+                probabilities[position] += Fraction(1, outcomes_count)
+
+        return probabilities
 
-        final_placement = int(to_decimal(rand_placement) * to_decimal(precision))
+    def _get_position(self, final_placement):
+        # The wheel has always skipped its last option, a wheel with a single
+        # option can only land on it
+        if len(self._options) == 1:
+            return 0
         return final_placement % (len(self._options) - 1)
@@ -0,0 +1,46 @@
+import timeit
+from random import choice, randrange, seed
+
+from spin_the_wheel.words import CandidateIndex, SecretWord
+
+WORDS_COUNT = 1_000_000
+QUERIES = 200
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def generate_words(words_count):
+    return [''.join(choice(ALPHABET) for _ in range(randrange(4, 13))) for _ in range(words_count)]
+
+
+def scan_with_regex(words, hidden_word, guessed_letters):
+    import re
+
+    hidden_letter = f"[^{''.join(guessed_letters)}]" if guessed_letters else '.'
+    pattern = re.compile(''.join(hidden_letter if letter == '_' else re.escape(letter) for letter in hidden_word))
+    return {word for word in words if len(word) == len(hidden_word) and pattern.fullmatch(word)}
+
+
+def main():
+    seed(0)
+    words = generate_words(WORDS_COUNT)
+
+    build_time = timeit.timeit(lambda: CandidateIndex(words), number=1)
+    candidate_index = CandidateIndex(words)
+
+    boards = []
+    for _ in range(QUERIES):
+        secret_word = SecretWord(word=choice(words))
+        for letter in 'AEIOURST':
+            secret_word.try_reveal(letter)
+        boards.append((secret_word.get_hidden_word(), secret_word.previously_guessed_letters))
+
+    index_time = timeit.timeit(lambda: [candidate_index.query(*board) for board in boards], number=1) / QUERIES
+    scan_time = timeit.timeit(lambda: [scan_with_regex(words, *board) for board in boards[:5]], number=1) / 5
+
+    print(f'{WORDS_COUNT} palavras, índice construído em {build_time:.1f} s')
+    print(f'Consulta pelo índice: {index_time * 1000:.2f} ms')
+    print(f'Varredura com regex:  {scan_time * 1000:.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import time
+from random import choice, randint, seed
+
+from spin_the_wheel.history import GameHistory, GameRecord
+from spin_the_wheel.player import Player
+
+GAMES_COUNT = 200_000
+PLAYERS_PER_GAME = 4
+NAMES = [f'Player {i}' for i in range(20_000)]
+THEMES = ['fruits', 'video_games']
+WINNER_NAMES = NAMES + [None]
+
+
+def create_game_record():
+    game_record = GameRecord()
+    for _ in range(3):
+        game_record.add_round(choice(THEMES), 'BANANA', choice(WINNER_NAMES), randint(1, 10))
+    game_record.set_results([Player(choice(NAMES), randint(0, 3000)) for _ in range(PLAYERS_PER_GAME)])
+    return game_record
+
+
+def measure_query(label, query):
+    start = time.perf_counter()
+    for _ in range(100):
+        query()
+    print(f'  {label}: {(time.perf_counter() - start) * 10:.2f}ms')
+
+
+def main():
+    seed(0)
+    game_records = [create_game_record() for _ in range(GAMES_COUNT)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        history = GameHistory(os.path.join(directory, 'history.db'))
+
+        start = time.perf_counter()
+        for game_record in game_records:
+            history.record_game(game_record)
+        queued_seconds = time.perf_counter() - start
+        history.flush()
+        seconds = time.perf_counter() - start
+
+        rows_count = GAMES_COUNT * (1 + 3 + PLAYERS_PER_GAME)
+        print(f'{GAMES_COUNT} jogos ({rows_count:,} linhas)')
+        print(f'  record_game: {queued_seconds / GAMES_COUNT * 1e6:.1f}us por jogo para quem termina o jogo')
+        print(f'  gravação: {GAMES_COUNT / seconds:,.0f} jogos por segundo')
+
+        measure_query('melhores jogadores', lambda: history.get_top_players(5))
+        measure_query('histórico de um jogador', lambda: history.get_player_history(choice(NAMES)))
+        measure_query('vitórias por tema', history.get_theme_win_rates)
+        history.close()
+
+
+if __name__ == '__main__':
+    main()
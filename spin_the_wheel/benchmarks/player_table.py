@@ -0,0 +1,40 @@
+import sys
+import timeit
+import tracemalloc
+
+from spin_the_wheel.player import Player, PlayerTable
+
+PLAYERS_COUNT = 1_000_000
+
+
+def measure(label, create_players):
+    tracemalloc.start()
+    players = create_players()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{label}: {memory / PLAYERS_COUNT:.1f} bytes por jogador')
+    return players
+
+
+def main():
+    # The names are created and interned before measuring, so the table reuses
+    # them while every Player keeps its own normalized copy
+    names = [sys.intern(f'Player {i}') for i in range(PLAYERS_COUNT)]
+
+    players = measure('Player', lambda: [Player(name, 100) for name in names])
+    table = measure('PlayerTable', lambda: PlayerTable(names))
+
+    seconds = timeit.timeit(lambda: [player.add_money(10) for player in players], number=1)
+    print(f'Player: dar R$10 para todos em {seconds * 1000:.0f}ms')
+    seconds = timeit.timeit(lambda: table.award_all(10), number=1)
+    print(f'PlayerTable: dar R$10 para todos em {seconds * 1000:.1f}ms')
+
+    seconds = timeit.timeit(lambda: sorted(players, key=lambda player: player.money, reverse=True)[:5], number=1)
+    print(f'Player: top 5 em {seconds * 1000:.0f}ms')
+    seconds = timeit.timeit(lambda: table.rank(5), number=1)
+    print(f'PlayerTable: top 5 em {seconds * 1000:.0f}ms')
+
+
+if __name__ == '__main__':
+    main()
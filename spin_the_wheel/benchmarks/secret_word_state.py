@@ -0,0 +1,116 @@
+import timeit
+import tracemalloc
+from collections import defaultdict
+from re import match
+
+import unidecode
+
+from spin_the_wheel.words import SecretWord, InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess
+
+INSTANCES = 20_000
+WORD = 'The Legend of Zelda: Breath of the Wild 2'
+GUESSES = 'THELGNDOFZABRWI2'
+
+
+# A copy of SecretWord before the bitset, so the baseline doesn't change with
+# it: an instance dict, a list of guessed letters, unidecode and a regex per
+# letter, and a full rescan of the hidden word after every reveal
+class LegacySecretWord:
+    __PLACEHOLDER_LETTER = '_'
+    __VALID_LETTERS_PATTERN = '[a-zA-Z0-9]'
+
+    def __init__(self, word):
+        self._secret_word = word.strip().upper()
+        self._hidden_word = self._create_hidden_word()
+        self._letter_positions_dict = self._map_positions()
+        self._previously_guessed_letters = []
+        self.was_guessed = False
+
+    @staticmethod
+    def _is_letter_valid(letter):
+        letter = LegacySecretWord._normalize_letter(letter)
+        return bool(match(LegacySecretWord.__VALID_LETTERS_PATTERN, letter))
+
+    @staticmethod
+    def _normalize_letter(letter):
+        letter = letter.strip()
+        is_word = len(letter) > 1
+        if is_word:
+            letter = letter[0]
+
+        return unidecode.unidecode(letter).strip().upper()
+
+    def _map_positions(self):
+        positions_dict = defaultdict(list)
+        normalized_word = unidecode.unidecode(self._secret_word)
+
+        for i in range(len(normalized_word)):
+            letter = normalized_word[i]
+            if self._is_letter_valid(letter):
+                positions_dict[letter].append(i)
+
+        return positions_dict
+
+    def _create_hidden_word(self):
+        hidden_word = []
+        for letter in self._secret_word:
+            if self._is_letter_valid(letter):
+                hidden_word.append(LegacySecretWord.__PLACEHOLDER_LETTER)
+            else:
+                hidden_word.append(letter)
+        return hidden_word
+
+    def reveal_letter(self, letter):
+        letter = LegacySecretWord._normalize_letter(letter)
+
+        if self.was_guessed:
+            raise NothingLeftToGuess()
+        if not self._is_letter_valid(letter):
+            raise InvalidLetter()
+        if letter in self._previously_guessed_letters:
+            raise HasGuessedLetterBefore()
+
+        self._previously_guessed_letters.append(letter)
+        if letter not in self._letter_positions_dict:
+            return False
+
+        for i in self._letter_positions_dict.pop(letter):
+            self._hidden_word[i] = self._secret_word[i]
+
+        self.was_guessed = LegacySecretWord.__PLACEHOLDER_LETTER not in self._hidden_word
+        return True
+
+
+def memory_per_instance(factory):
+    tracemalloc.start()
+    instances = [factory() for _ in range(INSTANCES)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(instances)
+
+
+def reveals_per_second(factory):
+    def play():
+        word = factory()
+        for letter in GUESSES:
+            word.reveal_letter(letter)
+
+    seconds = timeit.timeit(play, number=INSTANCES)
+    return INSTANCES * len(GUESSES) / seconds
+
+
+def main():
+    factories = {
+        'Lista + varredura': lambda: LegacySecretWord(WORD),
+        'Bitset + contador': lambda: SecretWord(word=WORD),
+    }
+
+    print(f"Palavra '{WORD}', {len(GUESSES)} chutes por partida")
+    for label, factory in factories.items():
+        memory = memory_per_instance(factory)
+        speed = reveals_per_second(factory)
+        print(f'{label}: {memory:.0f} bytes por instância, {speed:,.0f} chutes por segundo')
+
+
+if __name__ == '__main__':
+    main()
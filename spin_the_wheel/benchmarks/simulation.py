@@ -0,0 +1,42 @@
+import time
+from random import seed
+
+import repo_path  # noqa: F401
+from Simulation import Simulation, random_strategy, frequency_strategy
+
+# Run from the spin_the_wheel folder: python -m benchmarks.simulation
+#
+# One core plays about 0.8k-1.2k games per second with the random strategy and
+# about 1.8k-2.2k with the frequency one, short of the tens of thousands the
+# simulation was meant to reach. Building the SecretWord and Round of a round
+# is under 2% of the time. A random game is about 140 Round.step calls of a
+# few microseconds each, so the Python step itself is the ceiling; Sweep
+# spreads the games over processes instead
+GAMES_COUNT = 5000
+PLAYERS_COUNT = 3
+
+
+def run(label, strategies):
+    simulation = Simulation(strategies)
+    seed(0)
+
+    start = time.perf_counter()
+    report = simulation.run(GAMES_COUNT)
+    seconds = time.perf_counter() - start
+
+    average_money = ', '.join(f'R${money:.2f}' for money in report.get_average_money())
+    print(f'{label}: {GAMES_COUNT / seconds:,.0f} jogos por segundo')
+    print(f'  {report.turns_count / report.rounds_count:.1f} turnos e '
+          f'{report.guesses_count / report.rounds_count:.1f} chutes por rodada')
+    print(f'  dinheiro médio por jogador: {average_money}, vitórias: {report.game_wins}')
+
+
+def main():
+    print(f'{GAMES_COUNT} jogos de 3 rodadas com {PLAYERS_COUNT} jogadores')
+    run('Aleatório', [random_strategy] * PLAYERS_COUNT)
+    run('Frequência', [frequency_strategy] * PLAYERS_COUNT)
+    run('Misto', [random_strategy, frequency_strategy, random_strategy])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import os
+import time
+
+import repo_path  # noqa: F401
+from RoundRules import RoundRules
+from Simulation import random_strategy, frequency_strategy
+from Sweep import sweep
+
+# Run from the spin_the_wheel folder: python -m benchmarks.sweep
+GAMES_PER_CONFIGURATION = 2000
+STRATEGIES = [random_strategy, frequency_strategy, random_strategy]
+
+CONFIGURATIONS = [
+    RoundRules(vowel_cost=vowel_cost, word_value=word_value)
+    for vowel_cost in (100, 200, 400)
+    for word_value in (250, 500, 1000)
+]
+
+
+def run(workers):
+    start = time.perf_counter()
+    for _ in sweep(CONFIGURATIONS, STRATEGIES, GAMES_PER_CONFIGURATION, workers=workers):
+        pass
+    seconds = time.perf_counter() - start
+
+    games_count = GAMES_PER_CONFIGURATION * len(CONFIGURATIONS)
+    print(f'  {workers} processos: {games_count / seconds:,.0f} jogos por segundo')
+
+
+def main():
+    print(f'{len(CONFIGURATIONS)} configurações com {GAMES_PER_CONFIGURATION} jogos cada')
+
+    results = {}
+    for configuration_index, result in sweep(CONFIGURATIONS, STRATEGIES, GAMES_PER_CONFIGURATION):
+        results[configuration_index] = result
+
+    for configuration_index, result in sorted(results.items()):
+        rules = result.rules
+        earnings = result.earnings.summary()
+        print(f'  vogal R${rules.vowel_cost}, palavra R${rules.word_value}: '
+              f'ganho médio R${earnings["mean"]:.2f} (p5 R${earnings["p5"]}, p95 R${earnings["p95"]}), '
+              f'{result.round_turns.mean():.1f} turnos por rodada, '
+              f'margem mediana R${result.win_margins.percentile(50)}')
+
+    print('Escalabilidade:')
+    workers = 1
+    while workers <= os.cpu_count():
+        run(workers)
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import timeit
+import tracemalloc
+from random import randrange, seed
+
+from spin_the_wheel.words import ThemeStore
+
+WORDS_COUNT = 2_000_000
+PICKS = 20
+
+
+def read_every_line(file_path):
+    with open(file_path, 'r', encoding='utf-8') as file:
+        words = [line for line in file]
+
+    random_word = words[randrange(0, len(words))]
+    return random_word.strip()
+
+
+def generate_theme(assets_path, words_count):
+    with open(os.path.join(assets_path, 'generated.txt'), 'w', encoding='utf-8') as file:
+        for i in range(words_count):
+            file.write(f'Palavra número {i}\n')
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    seed(0)
+    with tempfile.TemporaryDirectory() as assets_path:
+        generate_theme(assets_path, WORDS_COUNT)
+        file_path = os.path.join(assets_path, 'generated.txt')
+
+        store = ThemeStore(assets_path)
+        build_time = timeit.timeit(lambda: store.count('generated'), number=1)
+        reload_time = timeit.timeit(lambda: ThemeStore(assets_path).count('generated'), number=1)
+
+        legacy_time = timeit.timeit(lambda: read_every_line(file_path), number=PICKS) / PICKS
+        store_time = timeit.timeit(lambda: store.get_random_word('generated'), number=PICKS * 1000) / (PICKS * 1000)
+
+        legacy_memory = peak_memory(lambda: read_every_line(file_path))
+        store_memory = peak_memory(lambda: store.get_random_word('generated'))
+
+    print(f'Tema com {WORDS_COUNT} palavras')
+    print(f'Construção do índice: {build_time * 1000:.1f} ms (recarregado do disco: {reload_time * 1000:.1f} ms)')
+    print(f'Lendo todas as linhas: {legacy_time * 1000:.3f} ms por palavra, pico de {legacy_memory / 1024:.0f} KiB')
+    print(f'ThemeStore:            {store_time * 1000:.3f} ms por palavra, pico de {store_memory / 1024:.0f} KiB')
+    print(f'{legacy_time / store_time:.0f}x mais rápido')
+
+
+if __name__ == '__main__':
+    main()
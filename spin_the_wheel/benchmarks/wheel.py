@@ -0,0 +1,20 @@
+import timeit
+
+from spin_the_wheel.Wheel import Wheel
+
+SPINS_COUNT = 1_000_000
+OPTIONS = [100, 200, 300, 400, 500]
+
+
+def main():
+    wheel = Wheel(OPTIONS)
+
+    seconds = timeit.timeit(wheel.spin, number=SPINS_COUNT)
+    print(f'spin: {SPINS_COUNT / seconds:,.0f} giros por segundo')
+
+    seconds = min(timeit.repeat(lambda: wheel.spin_many(SPINS_COUNT, rng=0), number=1, repeat=5))
+    print(f'spin_many: {SPINS_COUNT / seconds:,.0f} giros por segundo')
+
+
+if __name__ == '__main__':
+    main()
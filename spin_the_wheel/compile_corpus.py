@@ -0,0 +1,19 @@
+import glob
+import os
+from sys import argv
+
+import repo_path  # noqa: F401
+from words import compile_corpus
+
+# Compiles every theme in words/assets into a single binary corpus:
+#   python compile_corpus.py [output path]
+assets_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'words', 'assets')
+output_path = argv[1] if len(argv) > 1 else os.path.join(assets_path, 'themes.corpus')
+
+theme_paths = {
+    os.path.splitext(os.path.basename(theme_path))[0]: theme_path
+    for theme_path in sorted(glob.glob(os.path.join(assets_path, '*.txt')))
+}
+
+records_count = compile_corpus(theme_paths, output_path)
+print(f'{records_count} palavras de {len(theme_paths)} temas compiladas em {output_path}')
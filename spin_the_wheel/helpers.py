@@ -1,17 +1,25 @@
 import os
-import time
+import sys
 from sys import argv
 
+from Clock import RealClock, VirtualClock
+
 DEBUG_MODE = 'debug' in argv[1:]
 
 
-def sleep(seconds):
-    if not DEBUG_MODE:
-        time.sleep(seconds)
+def get_default_clock():
+    return VirtualClock() if DEBUG_MODE else RealClock()
 
 
 def clear():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI escapes instead of spawning a shell, the old Windows console does
+    # not understand them, so it still goes through cls
+    if os.name == 'nt':
+        os.system('cls')
+        return
+
+    sys.stdout.write('\x1b[H\x1b[2J')
+    sys.stdout.flush()
 
 
 def normalize(word):
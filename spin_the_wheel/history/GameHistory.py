@@ -0,0 +1,263 @@
+import queue
+import sqlite3
+import threading
+import time
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    finished_at REAL NOT NULL,
+    players_count INTEGER NOT NULL,
+    rounds_count INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rounds (
+    game_id INTEGER NOT NULL REFERENCES games (id),
+    round_number INTEGER NOT NULL,
+    theme TEXT NOT NULL,
+    word TEXT NOT NULL,
+    winner_name TEXT,
+    turns_count INTEGER NOT NULL,
+    PRIMARY KEY (game_id, round_number)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS results (
+    game_id INTEGER NOT NULL REFERENCES games (id),
+    player_name TEXT NOT NULL,
+    money INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (game_id, position)
+) WITHOUT ROWID;
+
+-- Running totals kept by every write, so the rankings never scan the history
+CREATE TABLE IF NOT EXISTS player_totals (
+    player_name TEXT PRIMARY KEY,
+    games_count INTEGER NOT NULL,
+    wins_count INTEGER NOT NULL,
+    total_money INTEGER NOT NULL,
+    best_money INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS theme_totals (
+    theme TEXT PRIMARY KEY,
+    rounds_count INTEGER NOT NULL,
+    solved_rounds_count INTEGER NOT NULL
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS results_by_player ON results (player_name, game_id DESC);
+CREATE INDEX IF NOT EXISTS rounds_by_theme ON rounds (theme, winner_name);
+CREATE INDEX IF NOT EXISTS player_totals_by_money ON player_totals (total_money DESC);
+'''
+
+_INSERT_GAME = 'INSERT INTO games VALUES (?, ?, ?, ?)'
+_INSERT_ROUND = 'INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?)'
+_INSERT_RESULT = 'INSERT INTO results VALUES (?, ?, ?, ?)'
+_UPDATE_PLAYER_TOTALS = '''
+INSERT INTO player_totals VALUES (?, 1, ?, ?, ?)
+ON CONFLICT (player_name) DO UPDATE SET
+    games_count = games_count + 1,
+    wins_count = wins_count + excluded.wins_count,
+    total_money = total_money + excluded.total_money,
+    best_money = MAX(best_money, excluded.best_money)
+'''
+_UPDATE_THEME_TOTALS = '''
+INSERT INTO theme_totals VALUES (?, 1, ?)
+ON CONFLICT (theme) DO UPDATE SET
+    rounds_count = rounds_count + 1,
+    solved_rounds_count = solved_rounds_count + excluded.solved_rounds_count
+'''
+
+
+class GameRecord:
+    __slots__ = ('finished_at', 'rounds', 'results')
+
+    def __init__(self):
+        self.finished_at = None
+        self.rounds = []
+        self.results = []
+
+    def add_round(self, theme: str, word: str, winner_name, turns_count: int):
+        self.rounds.append((theme, word, winner_name, turns_count))
+
+    def set_results(self, players):
+        # Players with the most money first, the first one wins the game
+        ranked_players = sorted(players, key=lambda player: player.money, reverse=True)
+        self.results = [(player.name, player.money) for player in ranked_players]
+        self.finished_at = time.time()
+
+
+# Completed games in a SQLite file. Games are handed to a writer thread, which
+# saves whatever is waiting in a single transaction, so ending a game never
+# waits on the disk. WAL mode lets the queries run while the writer is busy
+class GameHistory:
+    __BATCH_SIZE = 256
+
+    def __init__(self, database_path: str):
+        self._database_path = database_path
+        self._games = queue.Queue()
+        self._local = threading.local()
+        self._error = None
+
+        connection = self._connect()
+        connection.executescript(_SCHEMA)
+        connection.close()
+
+        self._writer = threading.Thread(target=self._write_games, name='GameHistory writer', daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        connection = sqlite3.connect(self._database_path, isolation_level=None)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        return connection
+
+    def record_game(self, game_record: GameRecord):
+        if self._error is not None:
+            raise self._error
+        self._games.put(game_record)
+
+    def flush(self):
+        # Waits until every recorded game is saved
+        self._games.join()
+        if self._error is not None:
+            raise self._error
+
+    def close(self):
+        self._games.put(None)
+        self._writer.join()
+
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+        if self._error is not None:
+            raise self._error
+
+    def _write_games(self):
+        connection = self._connect()
+        try:
+            while True:
+                game_records = [self._games.get()]
+                # Whatever else is already waiting goes in the same write
+                while len(game_records) < GameHistory.__BATCH_SIZE:
+                    try:
+                        game_records.append(self._games.get_nowait())
+                    except queue.Empty:
+                        break
+
+                closing = None in game_records
+                try:
+                    self._save(connection, [record for record in game_records if record is not None])
+                except Exception as error:
+                    # Kept for the next call from the game, the writer goes on
+                    # draining the queue so flush and close never hang
+                    self._error = error
+                finally:
+                    for _ in game_records:
+                        self._games.task_done()
+
+                if closing:
+                    return
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _save(connection, game_records):
+        if not game_records:
+            return
+
+        try:
+            GameHistory._save_batch(connection, game_records)
+        except Exception:
+            if len(game_records) == 1:
+                raise
+
+            # The batch was rolled back, so every game is tried again in its
+            # own transaction and only the ones that can't be saved are lost
+            first_error = None
+            for game_record in game_records:
+                try:
+                    GameHistory._save_batch(connection, [game_record])
+                except Exception as error:
+                    first_error = first_error or error
+            if first_error is not None:
+                raise first_error
+
+    @staticmethod
+    def _save_batch(connection, game_records):
+        connection.execute('BEGIN')
+        try:
+            # Only the writer thread inserts games, so it can number them and
+            # send the rows of the whole batch in one statement per table
+            (last_game_id,) = connection.execute('SELECT COALESCE(MAX(id), 0) FROM games').fetchone()
+            games, rounds, results = [], [], []
+            for game_id, game_record in enumerate(game_records, last_game_id + 1):
+                games.append((game_id, game_record.finished_at or time.time(),
+                              len(game_record.results), len(game_record.rounds)))
+                rounds.extend(
+                    (game_id, round_number) + game_round
+                    for round_number, game_round in enumerate(game_record.rounds, 1)
+                )
+                results.extend(
+                    (game_id, player_name, money, position)
+                    for position, (player_name, money) in enumerate(game_record.results, 1)
+                )
+
+            connection.executemany(_INSERT_GAME, games)
+            connection.executemany(_INSERT_ROUND, rounds)
+            connection.executemany(_UPDATE_THEME_TOTALS, [
+                (theme, int(winner_name is not None)) for _, _, theme, _, winner_name, _ in rounds
+            ])
+            connection.executemany(_INSERT_RESULT, results)
+            connection.executemany(_UPDATE_PLAYER_TOTALS, [
+                (player_name, int(position == 1), money, money) for _, player_name, money, position in results
+            ])
+            connection.execute('COMMIT')
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _get_reader(self):
+        # sqlite3 connections belong to the thread that opened them
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def get_top_players(self, players_count: int = 5):
+        return self._get_reader().execute(
+            'SELECT player_name, total_money, wins_count, games_count FROM player_totals '
+            'ORDER BY total_money DESC LIMIT ?',
+            (players_count,)
+        ).fetchall()
+
+    def get_player_totals(self, player_names):
+        # {player name: (total money, wins count, games count)}, only for the
+        # players that already have a saved game
+        player_names = list(player_names)
+        if not player_names:
+            return {}
+
+        placeholders = ', '.join('?' * len(player_names))
+        rows = self._get_reader().execute(
+            'SELECT player_name, total_money, wins_count, games_count FROM player_totals '
+            f'WHERE player_name IN ({placeholders})',
+            player_names
+        ).fetchall()
+        return {row[0]: row[1:] for row in rows}
+
+    def get_player_history(self, player_name: str, games_count: int = 10):
+        return self._get_reader().execute(
+            'SELECT games.id, games.finished_at, results.money, results.position FROM results '
+            'JOIN games ON games.id = results.game_id '
+            'WHERE results.player_name = ? ORDER BY results.game_id DESC LIMIT ?',
+            (player_name, games_count)
+        ).fetchall()
+
+    def get_theme_win_rates(self):
+        rows = self._get_reader().execute(
+            'SELECT theme, rounds_count, solved_rounds_count FROM theme_totals ORDER BY theme'
+        ).fetchall()
+        return {theme: solved_rounds_count / rounds_count for theme, rounds_count, solved_rounds_count in rows}
@@ -0,0 +1 @@
+from .GameHistory import GameHistory, GameRecord
@@ -0,0 +1,99 @@
+import time
+from collections import defaultdict
+from random import Random
+
+from .exceptions import InputExhausted
+
+# The menu asks for its option with an empty prompt
+MENU_PROMPT = ''
+
+_CONSONANTS = 'BCDFGHJKLMNPQRSTVWXYZ0123456789'
+_VOWELS = 'AEIOU'
+_NAMES = ('Ana', 'Bia', 'Caio', 'Davi', 'Eva', 'Fábio')
+
+
+# Input sources are called like input: they receive the prompt and return
+# what the player typed
+class ConsoleInput:
+    def __call__(self, prompt: str):
+        return input(prompt)
+
+
+# Answers the prompts with the recorded answers, as fast as they are asked,
+# and keeps how long the game took to handle every answer, by prompt
+class ReplayInput:
+    def __init__(self, answers):
+        self._answers = iter(answers)
+        self._last_prompt = None
+        self._last_answer_time = None
+        self.latencies = defaultdict(list)
+        self.answers_count = 0
+
+    def __call__(self, prompt: str):
+        now = time.perf_counter()
+        if self._last_prompt is not None:
+            self.latencies[self._last_prompt].append(now - self._last_answer_time)
+
+        try:
+            answer = next(self._answers)
+        except StopIteration:
+            raise InputExhausted(f"As respostas acabaram antes da pergunta '{prompt}'") from None
+
+        self.answers_count += 1
+        self._last_prompt = prompt
+        self._last_answer_time = time.perf_counter()
+        return answer
+
+
+# Wraps another source and writes down every prompt and answer
+class RecordingInput:
+    def __init__(self, input_source, transcript):
+        self._input_source = input_source
+        self.transcript = transcript
+
+    def __call__(self, prompt: str):
+        answer = self._input_source(prompt)
+        self.transcript.entries.append((prompt, answer))
+        return answer
+
+
+# Plays like a careless player: mostly valid answers for the prompt, and
+# every now and then something the game has to reject. It can't see the board,
+# so it doesn't repeat a letter until it has tried all of them, and it can't
+# guess the word, max_answers stops a session that goes on for too long
+class RandomInput:
+    def __init__(self, rng: Random = None, invalid_chance: float = 0.1, max_players: int = 4, max_answers: int = 1000):
+        self._random = rng if rng is not None else Random()
+        self._invalid_chance = invalid_chance
+        self._max_players = max_players
+        self._answers_left = max_answers
+        self._letters_left = {_CONSONANTS: [], _VOWELS: []}
+
+    def __call__(self, prompt: str):
+        if self._answers_left <= 0:
+            raise InputExhausted(f"Limite de respostas atingido na pergunta '{prompt}'")
+        self._answers_left -= 1
+
+        is_invalid = self._random.random() < self._invalid_chance
+        choice = self._random.choice
+
+        if prompt == MENU_PROMPT:
+            return choice(['0', '9', 'sair']) if is_invalid else choice('1111223')
+        if 'consoante' in prompt:
+            return choice(['A', '#', '']) if is_invalid else self._choose_letter(_CONSONANTS)
+        if 'vogal' in prompt:
+            return choice(['B', '7', '']) if is_invalid else self._choose_letter(_VOWELS)
+        if 'palavra' in prompt:
+            return ''.join(choice(_CONSONANTS + _VOWELS) for _ in range(self._random.randint(3, 8)))
+        if 'jogadores' in prompt:
+            return choice(['zero', '0', '-1']) if is_invalid else str(self._random.randint(1, self._max_players))
+        if 'nome' in prompt:
+            return '   ' if is_invalid else choice(_NAMES)
+        return ''
+
+    def _choose_letter(self, letters):
+        letters_left = self._letters_left[letters]
+        if not letters_left:
+            letters_left.extend(letters)
+            self._random.shuffle(letters_left)
+        return letters_left.pop()
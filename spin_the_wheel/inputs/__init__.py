@@ -0,0 +1,3 @@
+from .exceptions import InputExhausted
+from .InputSources import ConsoleInput, RandomInput, RecordingInput, ReplayInput
+from .transcripts import Transcript, load_transcripts, save_transcripts
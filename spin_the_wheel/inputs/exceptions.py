@@ -0,0 +1,2 @@
+class InputExhausted(Exception):
+    pass
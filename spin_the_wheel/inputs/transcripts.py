@@ -0,0 +1,41 @@
+import json
+
+
+# Everything typed during one session. The seed is applied to random and to
+# the session's word deck before it starts, so the replay draws the same words
+# and wheel spins
+class Transcript:
+    __slots__ = ('seed', 'entries')
+
+    def __init__(self, seed: int, entries=None):
+        self.seed = seed
+        self.entries = entries if entries is not None else []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get_answers(self):
+        return [answer for _, answer in self.entries]
+
+    def to_json(self):
+        return json.dumps({'seed': self.seed, 'entries': self.entries}, ensure_ascii=False)
+
+    @staticmethod
+    def from_json(line: str):
+        data = json.loads(line)
+        return Transcript(data['seed'], [tuple(entry) for entry in data['entries']])
+
+
+# One transcript per line, so big files can be read one session at a time
+def save_transcripts(file_path: str, transcripts):
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for transcript in transcripts:
+            file.write(transcript.to_json())
+            file.write('\n')
+
+
+def load_transcripts(file_path: str):
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield Transcript.from_json(line)
@@ -1,4 +1,10 @@
+import os
+
+import repo_path  # noqa: F401
 from Game import Game
+from history import GameHistory
 
-new_game = Game()
+history = GameHistory(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.db'))
+new_game = Game(history=history)
 new_game.start()
+history.close()
@@ -6,14 +6,22 @@ class Menu:
         self._label = label
         self._options = options
 
-    def input_menu(self):
+    def input_menu(self, input_source=None):
+        return self.select(self.input_option(input_source))
+
+    def input_option(self, input_source=None):
+        # input_source works like input, it receives the prompt and returns the answer
+        self.print_options()
+        return (input_source or input)('')
+
+    def print_options(self):
         print(self._label)
         for key in self._options.keys():
             option = self._options.get(key)
             description = option['description']
             print(f'[{key}] {description}')
 
-        input_option = input('')
+    def select(self, input_option):
         selected_option = self._options.get(input_option)
 
         if selected_option is None:
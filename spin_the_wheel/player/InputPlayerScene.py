@@ -4,20 +4,21 @@ from .Player import Player
 
 class InputPlayerScene:
     @staticmethod
-    def input_players():
+    def input_players(input_source=None):
+        read = input_source or input
         try:
-            players_count = int(input("Quantos jogadores serão? "))
+            players_count = int(read("Quantos jogadores serão? "))
         except ValueError:
             print('Você deve informar um número')
-            return InputPlayerScene.input_players()
+            return InputPlayerScene.input_players(input_source)
 
         if players_count < 1:
             print('Deve ter no mínimo 1 jogador(a)')
-            return InputPlayerScene.input_players()
+            return InputPlayerScene.input_players(input_source)
         players = []
 
         while players_count > 0:
-            player_name = input('Qual o nome do jogador? ')
+            player_name = read('Qual o nome do jogador? ')
             try:
                 players.append(Player(player_name))
                 players_count -= 1
@@ -0,0 +1,118 @@
+from itertools import count
+from random import Random
+
+from .Player import Player
+
+
+class _Node:
+    __slots__ = ('key', 'player', 'next_nodes')
+
+    def __init__(self, key, player, level):
+        self.key = key
+        self.player = player
+        self.next_nodes = [None] * level
+
+
+# Players ordered by money in a skip list: a money change is an O(log n)
+# removal and insertion, and the top K is a walk over the first K nodes. Ties
+# keep the order the players were added, like a stable sort would
+class Leaderboard:
+    __MAX_LEVEL = 32
+    __LEVEL_CHANCE = 0.25
+
+    def __init__(self, players=()):
+        self._head = _Node(None, None, Leaderboard.__MAX_LEVEL)
+        self._level = 1
+        self._keys = {}
+        self._sequence = count()
+        # Own generator, so building the leaderboard doesn't change the draws
+        # of a seeded game
+        self._random = Random()
+
+        for player in players:
+            self.add(player)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, player):
+        return player in self._keys
+
+    def __iter__(self):
+        node = self._head.next_nodes[0]
+        while node is not None:
+            yield node.player
+            node = node.next_nodes[0]
+
+    def add(self, player: Player):
+        if player in self._keys:
+            return
+
+        key = (-player.money, next(self._sequence))
+        self._keys[player] = key
+        self._insert(key, player)
+        player.add_listener(self._on_money_change)
+
+    def remove(self, player: Player):
+        key = self._keys.pop(player)
+        self._delete(key)
+        player.remove_listener(self._on_money_change)
+
+    def close(self):
+        for player in list(self._keys):
+            self.remove(player)
+
+    def top(self, k: int):
+        players = []
+        node = self._head.next_nodes[0]
+        while node is not None and len(players) < k:
+            players.append(node.player)
+            node = node.next_nodes[0]
+        return players
+
+    def _on_money_change(self, player: Player):
+        old_key = self._keys[player]
+        new_key = (-player.money, old_key[1])
+        if new_key == old_key:
+            return
+
+        self._delete(old_key)
+        self._keys[player] = new_key
+        self._insert(new_key, player)
+
+    def _find_previous_nodes(self, key):
+        previous_nodes = [self._head] * Leaderboard.__MAX_LEVEL
+        node = self._head
+        for level in range(self._level - 1, -1, -1):
+            next_node = node.next_nodes[level]
+            while next_node is not None and next_node.key < key:
+                node = next_node
+                next_node = node.next_nodes[level]
+            previous_nodes[level] = node
+        return previous_nodes
+
+    def _random_level(self):
+        level = 1
+        while level < Leaderboard.__MAX_LEVEL and self._random.random() < Leaderboard.__LEVEL_CHANCE:
+            level += 1
+        return level
+
+    def _insert(self, key, player):
+        previous_nodes = self._find_previous_nodes(key)
+        level = self._random_level()
+        self._level = max(self._level, level)
+
+        node = _Node(key, player, level)
+        for i in range(level):
+            node.next_nodes[i] = previous_nodes[i].next_nodes[i]
+            previous_nodes[i].next_nodes[i] = node
+
+    def _delete(self, key):
+        previous_nodes = self._find_previous_nodes(key)
+        node = previous_nodes[0].next_nodes[0]
+
+        for i in range(len(node.next_nodes)):
+            previous_nodes[i].next_nodes[i] = node.next_nodes[i]
+
+        while self._level > 1 and self._head.next_nodes[self._level - 1] is None:
+            self._level -= 1
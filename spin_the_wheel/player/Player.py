@@ -12,6 +12,7 @@ class Player:
         if money < 0:
             raise InvalidAmount('O valor de dinheiro tem que ser 0 ou maior')
         self._money = money
+        self._listeners = []
 
     @property
     def name(self):
@@ -27,6 +28,7 @@ class Player:
             raise InvalidAmount('O valor a ser adicionado tem que ser maior que 0')
 
         self._money += money
+        self._notify_listeners()
 
     def takes_money(self, money):
         money = int(money)
@@ -37,4 +39,16 @@ class Player:
             raise InvalidAmount(f'O valor tem que ser menor do que {self._money}')
 
         self._money -= money
+        self._notify_listeners()
         return money
+
+    def add_listener(self, listener):
+        # listener(player) is called after every change of money
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _notify_listeners(self):
+        for listener in self._listeners:
+            listener(self)
@@ -0,0 +1,148 @@
+import sys
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .exceptions import InvalidAmount, InvalidName
+
+
+def _normalize_name(name):
+    name = name.strip().lower().title()
+    if not name:
+        raise InvalidName('O jogador(a) deve ter um nome')
+    return sys.intern(name)
+
+
+def _validate_amount(money, message):
+    money = int(money)
+    if money < 1:
+        raise InvalidAmount(message)
+    return money
+
+
+# Same interface as Player, but the name and the money live in the table
+class PlayerView:
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __eq__(self, other):
+        return isinstance(other, PlayerView) and other._table is self._table and other._index == self._index
+
+    def __hash__(self):
+        return hash((id(self._table), self._index))
+
+    def __repr__(self):
+        return f'PlayerView({self.name!r}, {self.money})'
+
+    @property
+    def index(self):
+        return self._index
+
+    @property
+    def name(self):
+        return self._table._names[self._index]
+
+    @property
+    def money(self):
+        return self._table._balances[self._index]
+
+    def add_money(self, money):
+        money = _validate_amount(money, 'O valor a ser adicionado tem que ser maior que 0')
+
+        self._table._balances[self._index] += money
+        self._table._notify_listeners(self)
+
+    def takes_money(self, money):
+        money = _validate_amount(money, 'O valor a ser removido tem que ser maior que 0')
+
+        balances = self._table._balances
+        if money > balances[self._index]:
+            raise InvalidAmount(f'O valor tem que ser menor do que {balances[self._index]}')
+
+        balances[self._index] -= money
+        self._table._notify_listeners(self)
+        return money
+
+    def add_listener(self, listener):
+        self._table._listeners.setdefault(self._index, []).append(listener)
+
+    def remove_listener(self, listener):
+        self._table._listeners[self._index].remove(listener)
+
+
+# Players stored column by column: the names in one list and the money in a
+# single array of int64, so a big lobby costs a few bytes per player and the
+# bulk operations run over the whole column at once (with numpy when available)
+class PlayerTable:
+    def __init__(self, names=()):
+        self._names = []
+        self._balances = array('q')
+        self._listeners = {}
+
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError('Jogador(a) não existe')
+        return PlayerView(self, index % len(self))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield PlayerView(self, index)
+
+    def add(self, name, money=0):
+        name = _normalize_name(name)
+        money = int(money)
+        if money < 0:
+            raise InvalidAmount('O valor de dinheiro tem que ser 0 ou maior')
+
+        self._names.append(name)
+        self._balances.append(money)
+        return PlayerView(self, len(self._names) - 1)
+
+    @property
+    def players(self):
+        return tuple(self)
+
+    def get_total_money(self):
+        if numpy is not None and self._balances:
+            return int(self._get_balances_column().sum())
+        return sum(self._balances)
+
+    def award_all(self, money):
+        money = _validate_amount(money, 'O valor a ser adicionado tem que ser maior que 0')
+
+        if numpy is not None and self._balances:
+            self._get_balances_column()[:] += money
+        else:
+            self._balances = array('q', [balance + money for balance in self._balances])
+
+        for index in self._listeners:
+            self._notify_listeners(PlayerView(self, index))
+
+    def rank(self, players_count=None):
+        # Players with the most money first, ties keep the order they were added
+        if numpy is not None and self._balances:
+            indexes = numpy.argsort(-self._get_balances_column(), kind='stable')[:players_count].tolist()
+        else:
+            balances = self._balances
+            indexes = sorted(range(len(balances)), key=lambda index: -balances[index])[:players_count]
+        return [PlayerView(self, index) for index in indexes]
+
+    def _get_balances_column(self):
+        # Shares the memory of the array, nothing is copied
+        return numpy.frombuffer(self._balances, dtype=numpy.int64)
+
+    def _notify_listeners(self, player):
+        for listener in self._listeners.get(player.index, ()):
+            listener(player)
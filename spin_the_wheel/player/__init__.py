@@ -1,3 +1,5 @@
 from .InputPlayerScene import InputPlayerScene
+from .Leaderboard import Leaderboard
 from .Player import Player
+from .PlayerTable import PlayerTable, PlayerView
 from .exceptions import InvalidAmount, InvalidName
@@ -0,0 +1,39 @@
+import os
+from sys import argv
+
+import repo_path  # noqa: F401
+from inputs import load_transcripts, save_transcripts
+from LoadTest import generate_transcripts, run_load_test
+
+# Records random sessions and replays them through the real game input path:
+#   python replay_sessions.py generate <sessions count> <transcripts file>
+#   python replay_sessions.py replay <transcripts file> [processes]
+USAGE = 'python replay_sessions.py generate <sessões> <arquivo> | replay <arquivo> [processos]'
+
+
+def generate(sessions_count, file_path):
+    save_transcripts(file_path, generate_transcripts(int(sessions_count)))
+    print(f'{sessions_count} sessões gravadas em {file_path}')
+
+
+def replay(file_path, workers=None):
+    workers = int(workers) if workers else os.cpu_count()
+    report = run_load_test(load_transcripts(file_path), workers)
+
+    print(f'{report.sessions_count} sessões em {report.seconds:.2f}s com {workers} processos '
+          f'({report.incomplete_sessions_count} pararam antes do fim do jogo)')
+    print(f'{report.get_sessions_per_second():,.1f} sessões e {report.get_answers_per_second():,.0f} respostas por segundo')
+    print('Latência por pergunta (us): média, p50, p99')
+    for prompt, latencies in sorted(report.latencies.items(), key=lambda item: -item[1].count):
+        label = prompt.strip(' :') or '(menu)'
+        print(f'  {label}: {latencies.mean():.0f}, {latencies.percentile(50)}, {latencies.percentile(99)} '
+              f'em {latencies.count} respostas')
+
+
+if __name__ == '__main__':
+    if len(argv) >= 4 and argv[1] == 'generate':
+        generate(argv[2], argv[3])
+    elif len(argv) >= 3 and argv[1] == 'replay':
+        replay(*argv[2:4])
+    else:
+        print(USAGE)
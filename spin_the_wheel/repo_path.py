@@ -0,0 +1,10 @@
+import os
+import sys
+
+# The words share jogos.positions with the forca games. The scripts of this
+# folder run from here, so they import this module before anything else to
+# make the repository root importable
+_REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if _REPO_PATH not in sys.path:
+    sys.path.append(_REPO_PATH)
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Round, Game and the simulations import their neighbours the way main.py runs
+# them, from inside spin_the_wheel
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,52 @@
+import pytest
+
+from spin_the_wheel.words import CandidateIndex, SecretWord, ThemeStore
+
+
+@pytest.fixture(scope='module')
+def candidate_index():
+    return CandidateIndex(['Banana', 'Cereja', 'Laranja', 'Maçã', 'Manga', 'Pera', 'Uva', 'Mamão'])
+
+
+class Test_query:
+    def test_should_return_every_word_with_the_same_length_on_a_new_board(self, candidate_index):
+        words, frequencies = candidate_index.query(list('_____'), [])
+
+        assert words == {'MANGA', 'MAMÃO'}
+        assert frequencies == {'M': 2, 'A': 2, 'N': 1, 'G': 1, 'O': 1}
+
+    def test_should_only_return_words_matching_the_revealed_letters(self, candidate_index):
+        sw = SecretWord(word='Banana')
+        sw.reveal_letter('a')
+        words, frequencies = candidate_index.query(sw.get_hidden_word(), sw.previously_guessed_letters)
+
+        assert words == {'BANANA'}
+        assert frequencies == {'B': 1, 'N': 1}
+
+    def test_should_match_accented_letters_as_the_same_letter(self, candidate_index):
+        sw = SecretWord(word='Mamão')
+        sw.reveal_letter('a')
+        words, _ = candidate_index.query(sw.get_hidden_word(), sw.previously_guessed_letters)
+
+        assert words == {'MAMÃO'}
+
+    def test_should_exclude_words_with_a_guessed_letter_in_a_hidden_position(self, candidate_index):
+        words, _ = candidate_index.query(list('_____'), ['N'])
+
+        assert words == {'MAMÃO'}
+
+    def test_should_return_nothing_if_no_word_has_the_board_length(self, candidate_index):
+        assert candidate_index.query(list('__________'), []) == (set(), {})
+        assert candidate_index.count_candidates(list('__________'), []) == 0
+
+
+class Test_for_theme:
+    def test_should_build_the_index_once_per_theme(self, tmp_path):
+        (tmp_path / 'colors.txt').write_text('Azul\nVerde\nRoxo\n', encoding='utf-8')
+        theme_store = ThemeStore(str(tmp_path))
+
+        candidate_index = CandidateIndex.for_theme('colors', theme_store)
+
+        assert len(candidate_index) == 3
+        assert CandidateIndex.for_theme('colors', theme_store) is candidate_index
+        assert candidate_index.count_candidates(list('____'), []) == 2
@@ -0,0 +1,45 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+from spin_the_wheel.Clock import AsyncClock, ScaledClock, VirtualClock
+
+
+class Test_sleep:
+    def test_virtual_clock_should_add_up_the_time_without_waiting(self):
+        clock = VirtualClock()
+
+        with mock.patch('time.sleep') as _sleep:
+            clock.sleep(2)
+            clock.sleep(0.5)
+
+        assert clock.elapsed == 2.5
+        assert clock.sleeps_count == 2
+        assert _sleep.call_count == 0
+
+    def test_scaled_clock_should_wait_a_fraction_of_the_time(self):
+        clock = ScaledClock(10)
+
+        with mock.patch('time.sleep') as _sleep:
+            clock.sleep(2)
+
+        _sleep.assert_called_once_with(0.2)
+
+    def test_scaled_clock_should_not_accept_a_factor_that_is_not_positive(self):
+        with pytest.raises(ValueError):
+            ScaledClock(0)
+
+
+class Test_flush:
+    def test_async_clock_should_await_the_pending_time_at_once(self):
+        clock = AsyncClock(factor=1000)
+        clock.sleep(2)
+        clock.sleep(1)
+
+        with mock.patch('asyncio.sleep', new=mock.AsyncMock()) as _sleep:
+            asyncio.run(clock.flush())
+
+        _sleep.assert_awaited_once_with(0.003)
+        assert clock.pending == 0
+        assert clock.elapsed == 3
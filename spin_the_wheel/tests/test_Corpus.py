@@ -0,0 +1,53 @@
+import pytest
+
+from spin_the_wheel.words import Corpus, SecretWord, compile_corpus
+
+
+@pytest.fixture()
+def corpus(tmp_path):
+    fruits_path = tmp_path / 'fruits.txt'
+    fruits_path.write_text('Banana\n\nMaçã\nSabão em pó\n', encoding='utf-8')
+    colors_path = tmp_path / 'colors.txt'
+    colors_path.write_text('Azul\nVermelho', encoding='utf-8')
+
+    corpus_path = str(tmp_path / 'themes.corpus')
+    compile_corpus({'fruits': str(fruits_path), 'colors': str(colors_path)}, corpus_path)
+
+    corpus = Corpus(corpus_path)
+    yield corpus
+    corpus.close()
+
+
+class Test_compile_corpus:
+    def test_should_keep_every_theme_and_skip_blank_lines(self, corpus):
+        assert corpus.themes == ['fruits', 'colors']
+        assert corpus.count('fruits') == 3
+        assert corpus.count('colors') == 2
+
+    def test_should_store_the_word_folded_word_and_positions(self, corpus):
+        record = corpus.get_record('fruits', 2)
+
+        assert record.word == 'SABÃO EM PÓ'
+        assert record.folded_word == 'SABAO EM PO'
+        assert list(record.positions['A']) == [1, 3]
+        assert list(record.positions['O']) == [4, 10]
+
+    def test_should_raise_error_for_unknown_theme_or_position(self, corpus):
+        with pytest.raises(KeyError):
+            corpus.count('a9s7d9a87sd9')
+        with pytest.raises(IndexError):
+            corpus.get_record('colors', 2)
+
+
+class Test_from_record:
+    def test_should_behave_like_a_secret_word_created_from_the_word(self, corpus):
+        sw = SecretWord.from_record(corpus.get_record('fruits', 2))
+        expected = SecretWord(word='Sabão em pó')
+
+        assert sw.get_word() == expected.get_word()
+        assert sw.get_hidden_word() == expected.get_hidden_word()
+        assert sw.get_letter_count('o') == 2
+        assert sw.reveal_letter('o')
+        assert sw.get_hidden_word().count('_') == 7
+        assert sw.check_word('sabao em po')
+        assert sw.was_guessed
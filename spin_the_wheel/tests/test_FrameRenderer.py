@@ -0,0 +1,78 @@
+import io
+import os
+from unittest import mock
+
+from spin_the_wheel.FrameRenderer import FrameRenderer
+
+
+class Test_render:
+    def test_should_clear_the_screen_and_write_every_line_on_the_first_frame(self):
+        stream = io.StringIO()
+        FrameRenderer(stream).render(['Tema: Frutas', '_ _ _', ''])
+
+        assert stream.getvalue() == '\x1b[H\x1b[2JTema: Frutas\n_ _ _\n\n'
+
+    def test_should_only_write_the_lines_that_changed(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(['Tema: Frutas', '_ _ _', ''])
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render(['Tema: Frutas', 'A _ A', ''])
+
+        assert stream.getvalue() == '\x1b[2;1HA _ A\x1b[K\x1b[4;1H\x1b[J'
+
+    def test_should_write_the_new_lines_when_the_frame_grows(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(['A'])
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render(['A', 'B'])
+
+        assert stream.getvalue() == '\x1b[2;1HB\x1b[K\x1b[3;1H\x1b[J'
+
+    def test_should_write_the_frame_at_once(self):
+        stream = mock.Mock()
+        FrameRenderer(stream).render(['Tema: Frutas', '_ _ _', ''])
+
+        assert stream.write.call_count == 1
+        assert stream.flush.call_count == 1
+
+    def test_should_redraw_a_frame_taller_than_the_terminal_every_time(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        with mock.patch('shutil.get_terminal_size', return_value=os.terminal_size((80, 2))):
+            renderer.render(['A', 'B'])
+            stream.seek(0)
+            stream.truncate()
+
+            renderer.render(['A', 'C'])
+
+        assert stream.getvalue() == '\x1b[H\x1b[2JA\nC\n'
+
+    def test_should_clear_and_write_plain_lines_without_ansi(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream, ansi=False)
+        with mock.patch('spin_the_wheel.FrameRenderer.clear') as clear:
+            renderer.render(['A', 'B'])
+            renderer.render(['A', 'C'])
+
+        assert clear.call_count == 2
+        assert stream.getvalue() == 'A\nB\nA\nC\n'
+
+
+class Test_invalidate:
+    def test_should_redraw_the_whole_screen_on_the_next_frame(self):
+        stream = io.StringIO()
+        renderer = FrameRenderer(stream)
+        renderer.render(['A'])
+        renderer.invalidate()
+        stream.seek(0)
+        stream.truncate()
+
+        renderer.render(['A'])
+
+        assert stream.getvalue() == '\x1b[H\x1b[2JA\n'
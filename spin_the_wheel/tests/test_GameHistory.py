@@ -0,0 +1,103 @@
+import pytest
+
+from spin_the_wheel.history import GameHistory, GameRecord
+from spin_the_wheel.player import Player
+
+
+@pytest.fixture()
+def history(tmp_path):
+    history = GameHistory(str(tmp_path / 'history.db'))
+    yield history
+    history.close()
+
+
+def create_game_record(rounds, players_money):
+    game_record = GameRecord()
+    for theme, word, winner_name in rounds:
+        game_record.add_round(theme, word, winner_name, 3)
+
+    players = []
+    for name, money in players_money:
+        players.append(Player(name, money))
+    game_record.set_results(players)
+    return game_record
+
+
+class Test_get_top_players:
+    def test_should_add_up_the_money_of_every_game(self, history):
+        history.record_game(create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 500), ('Bia', 300)]))
+        history.record_game(create_game_record([('fruits', 'UVA', 'Bia')], [('Ana', 100), ('Bia', 400)]))
+        history.flush()
+
+        assert history.get_top_players(2) == [('Bia', 700, 1, 2), ('Ana', 600, 1, 2)]
+
+
+class Test_get_player_totals:
+    def test_should_return_only_the_players_with_saved_games(self, history):
+        history.record_game(create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 500), ('Bia', 300)]))
+        history.flush()
+
+        assert history.get_player_totals(['Bia', 'Caio']) == {'Bia': (300, 0, 1)}
+        assert history.get_player_totals([]) == {}
+
+
+class Test_get_player_history:
+    def test_should_return_the_latest_games_first(self, history):
+        history.record_game(create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 500), ('Bia', 300)]))
+        history.record_game(create_game_record([('fruits', 'UVA', 'Bia')], [('Ana', 100), ('Bia', 400)]))
+        history.flush()
+
+        games = history.get_player_history('Ana')
+
+        assert [(money, position) for _, _, money, position in games] == [(100, 2), (500, 1)]
+
+
+class Test_get_theme_win_rates:
+    def test_should_count_the_rounds_someone_won(self, history):
+        history.record_game(create_game_record(
+            [('fruits', 'BANANA', 'Ana'), ('fruits', 'UVA', None), ('video_games', 'ASTRO BOT', 'Ana')],
+            [('Ana', 500)]
+        ))
+        history.flush()
+
+        assert history.get_theme_win_rates() == {'fruits': 0.5, 'video_games': 1}
+
+
+class Test_close:
+    def test_should_save_the_games_still_waiting(self, tmp_path):
+        database_path = str(tmp_path / 'history.db')
+        history = GameHistory(database_path)
+        for _ in range(50):
+            history.record_game(create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 10)]))
+        history.close()
+
+        reopened_history = GameHistory(database_path)
+        assert reopened_history.get_top_players(1) == [('Ana', 500, 50, 50)]
+        reopened_history.close()
+
+    def test_should_not_hang_when_a_game_cannot_be_saved(self, tmp_path):
+        history = GameHistory(str(tmp_path / 'history.db'))
+        broken_game_record = create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 10)])
+        broken_game_record.results.append(('Bia',))
+        history.record_game(broken_game_record)
+
+        with pytest.raises(ValueError):
+            history.flush()
+        with pytest.raises(ValueError):
+            history.close()
+
+    def test_should_save_the_other_games_of_the_batch_of_a_broken_game(self, tmp_path):
+        database_path = str(tmp_path / 'history.db')
+        history = GameHistory(database_path)
+        broken_game_record = create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 10)])
+        broken_game_record.results.append(('Bia',))
+        for game_number in range(101):
+            game_record = create_game_record([('fruits', 'BANANA', 'Ana')], [('Ana', 10)])
+            history.record_game(broken_game_record if game_number == 50 else game_record)
+
+        with pytest.raises(ValueError):
+            history.close()
+
+        reopened_history = GameHistory(database_path)
+        assert reopened_history.get_top_players(1) == [('Ana', 1000, 100, 100)]
+        reopened_history.close()
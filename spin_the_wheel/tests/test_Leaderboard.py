@@ -0,0 +1,65 @@
+from random import Random
+
+from spin_the_wheel.player import Leaderboard, Player
+
+
+def create_players(*names):
+    return [Player(name) for name in names]
+
+
+class Test_top:
+    def test_should_return_the_players_with_the_most_money_first(self):
+        ana, bia, caio = create_players('Ana', 'Bia', 'Caio')
+        leaderboard = Leaderboard([ana, bia, caio])
+
+        bia.add_money(300)
+        caio.add_money(100)
+
+        assert leaderboard.top(2) == [bia, caio]
+
+    def test_should_keep_the_order_the_players_were_added_on_ties(self):
+        ana, bia, caio = create_players('Ana', 'Bia', 'Caio')
+        leaderboard = Leaderboard([ana, bia, caio])
+
+        caio.add_money(100)
+        ana.add_money(100)
+
+        assert leaderboard.top(3) == [ana, caio, bia]
+
+    def test_should_follow_the_money_taken_from_a_player(self):
+        ana, bia = create_players('Ana', 'Bia')
+        leaderboard = Leaderboard([ana, bia])
+        ana.add_money(300)
+        bia.add_money(200)
+
+        ana.takes_money(200)
+
+        assert leaderboard.top(2) == [bia, ana]
+
+    def test_should_match_a_full_sort_after_many_updates(self):
+        random = Random(4)
+        players = [Player(f'Player {i}') for i in range(300)]
+        leaderboard = Leaderboard(players)
+
+        for _ in range(3000):
+            player = players[random.randrange(len(players))]
+            if player.money and random.random() < 0.3:
+                player.takes_money(random.randint(1, player.money))
+            else:
+                player.add_money(random.randint(1, 500))
+
+        assert leaderboard.top(300) == sorted(players, key=lambda player: player.money, reverse=True)
+        assert list(leaderboard) == leaderboard.top(300)
+
+
+class Test_remove:
+    def test_should_stop_following_the_player(self):
+        ana, bia = create_players('Ana', 'Bia')
+        leaderboard = Leaderboard([ana, bia])
+
+        leaderboard.remove(ana)
+        ana.add_money(100)
+
+        assert leaderboard.top(2) == [bia]
+        assert ana not in leaderboard
+        assert len(leaderboard) == 1
@@ -0,0 +1,26 @@
+import glob
+import os
+
+from LoadTest import generate_transcripts, replay_transcript
+
+DECKS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'words', 'assets', '*.deck')
+
+
+def _read_decks():
+    decks = {}
+    for path in glob.glob(DECKS_PATH):
+        with open(path, 'rb') as file:
+            decks[path] = file.read()
+    return decks
+
+
+class Test_replay_transcript:
+    def test_should_replay_the_recorded_sessions(self):
+        decks = _read_decks()
+
+        transcripts = list(generate_transcripts(4, seed=1))
+        results = [replay_transcript(transcript) for transcript in transcripts]
+
+        assert [result.answers_count for result in results] == [len(transcript) for transcript in transcripts]
+        assert any(result.is_complete for result in results)
+        assert _read_decks() == decks
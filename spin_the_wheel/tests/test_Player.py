@@ -67,3 +67,14 @@ class Test_takes_money:
             player = Player('Test', 100)
             player.takes_money(101)
 
+
+class Test_add_listener:
+    def test_should_call_the_listener_after_the_money_changes(self):
+        player = Player('Test')
+        money_changes = []
+        player.add_listener(lambda changed_player: money_changes.append(changed_player.money))
+
+        player.add_money(300)
+        player.takes_money(100)
+
+        assert money_changes == [300, 200]
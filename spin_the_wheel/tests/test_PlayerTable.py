@@ -0,0 +1,83 @@
+import pytest
+
+from spin_the_wheel.player import InvalidAmount, InvalidName, Leaderboard, PlayerTable
+
+
+class Test_add:
+    def test_should_clean_and_title_case_the_player_name(self):
+        player = PlayerTable().add('   KLAUS kazlauskas     ', 120)
+
+        assert player.name == 'Klaus Kazlauskas'
+        assert player.money == 120
+
+    def test_should_not_accept_an_empty_name(self):
+        with pytest.raises(InvalidName):
+            PlayerTable().add('   ')
+
+    def test_should_not_accept_a_negative_amount_of_money(self):
+        with pytest.raises(InvalidAmount):
+            PlayerTable().add('Test', -120)
+
+
+class Test_player_view:
+    def test_should_change_the_money_in_the_table(self):
+        table = PlayerTable(['Ana', 'Bia'])
+
+        table[0].add_money(300)
+        money_taken = table[0].takes_money(100)
+
+        assert money_taken == 100
+        assert table[0].money == 200
+        assert table[1].money == 0
+
+    def test_should_not_take_more_money_than_the_player_has(self):
+        table = PlayerTable(['Ana'])
+
+        with pytest.raises(InvalidAmount):
+            table[0].takes_money(1)
+
+    def test_should_be_equal_to_another_view_of_the_same_player(self):
+        table = PlayerTable(['Ana', 'Bia'])
+
+        assert table[0] == table[0]
+        assert table[0] != table[1]
+        assert table.players.index(table[1]) == 1
+
+    def test_should_work_with_the_leaderboard(self):
+        table = PlayerTable(['Ana', 'Bia'])
+        leaderboard = Leaderboard(table.players)
+
+        table[1].add_money(100)
+
+        assert leaderboard.top(2) == [table[1], table[0]]
+
+
+class Test_award_all:
+    def test_should_add_the_money_to_every_player(self):
+        table = PlayerTable(['Ana', 'Bia'])
+        table[0].add_money(50)
+
+        table.award_all(100)
+
+        assert [player.money for player in table] == [150, 100]
+        assert table.get_total_money() == 250
+
+    def test_should_notify_the_listeners(self):
+        table = PlayerTable(['Ana', 'Bia'])
+        leaderboard = Leaderboard(table.players)
+        table[1].add_money(10)
+
+        table.award_all(100)
+
+        assert [player.money for player in leaderboard.top(2)] == [110, 100]
+
+
+class Test_rank:
+    def test_should_return_the_players_with_the_most_money_first(self):
+        table = PlayerTable(['Ana', 'Bia', 'Caio', 'Davi'])
+        table[2].add_money(300)
+        table[3].add_money(100)
+        table[1].add_money(100)
+
+        assert [player.name for player in table.rank()] == ['Caio', 'Bia', 'Davi', 'Ana']
+        assert [player.name for player in table.rank(2)] == ['Caio', 'Bia']
@@ -0,0 +1,123 @@
+import asyncio
+import io
+
+import pytest
+
+from Clock import AsyncClock, VirtualClock
+from FrameRenderer import FrameRenderer
+from player import Player
+from Round import Round
+from RoundCLI import HeadlessRoundCLI, RoundCLI
+from RoundRules import RoundRules
+from words import SecretWord
+
+RULES = RoundRules(vowel_cost=200, word_value=500, wheel_options=(300, 300))
+
+
+@pytest.fixture()
+def players():
+    return (Player('Ana', 1000), Player('Bia'))
+
+
+@pytest.fixture()
+def game_round(players):
+    return Round(SecretWord(word='Banana'), 'fruits', players, cli=HeadlessRoundCLI(clock=VirtualClock()), rules=RULES)
+
+
+class Test_step:
+    def test_should_spin_the_wheel_and_reveal_the_consonant(self, game_round, players):
+        assert game_round.step('1') == Round.STATE_GUESSING_CONSONANT
+        assert game_round.letter_value == 300
+
+        assert game_round.step('N') == Round.STATE_CHOOSING_OPTION
+        assert ''.join(game_round.secret_word.get_hidden_word()) == '__N_N_'
+        assert players[0].money == 1000 + 300 * 2
+        assert game_round.current_player is players[0]
+
+    def test_should_pass_the_turn_when_the_consonant_is_not_in_the_word(self, game_round, players):
+        game_round.step('1')
+
+        assert game_round.step('X') == Round.STATE_CHOOSING_OPTION
+        assert game_round.current_player is players[1]
+        assert game_round.turns_count == 2
+
+    def test_should_buy_a_vowel_and_reveal_it(self, game_round, players):
+        assert game_round.step('2') == Round.STATE_GUESSING_VOWEL
+        assert players[0].money == 800
+
+        assert game_round.step('A') == Round.STATE_CHOOSING_OPTION
+        assert ''.join(game_round.secret_word.get_hidden_word()) == '_A_A_A'
+
+    def test_should_not_buy_a_vowel_without_money(self, game_round, players):
+        game_round.step('1')
+        game_round.step('X')
+
+        assert game_round.step('2') == Round.STATE_CHOOSING_OPTION
+        assert players[1].money == 0
+
+    def test_should_finish_when_the_word_is_guessed(self, game_round, players):
+        assert game_round.step('3') == Round.STATE_GUESSING_WORD
+
+        assert game_round.step('banana') == Round.STATE_FINISHED
+        assert game_round.is_finished
+        assert game_round.winner is players[0]
+        assert players[0].money == 1500
+
+    def test_should_pass_the_turn_when_the_word_is_wrong(self, game_round, players):
+        game_round.step('3')
+
+        assert game_round.step('abacaxi') == Round.STATE_CHOOSING_OPTION
+        assert game_round.current_player is players[1]
+        assert game_round.winner is None
+
+    def test_should_ask_again_when_the_option_is_invalid(self, game_round, players):
+        assert game_round.step('9') == Round.STATE_CHOOSING_OPTION
+        assert game_round.step('') == Round.STATE_CHOOSING_OPTION
+        assert game_round.current_player is players[0]
+        assert game_round.turns_count == 1
+
+    def test_should_ask_again_when_the_letter_is_invalid(self, game_round):
+        game_round.step('1')
+
+        assert game_round.step('A') == Round.STATE_GUESSING_CONSONANT
+        assert game_round.guesses_count == 0
+
+    def test_should_finish_when_the_last_letter_is_revealed(self, game_round, players):
+        game_round.step('1')
+        game_round.step('N')
+        game_round.step('1')
+        game_round.step('B')
+        game_round.step('2')
+
+        assert game_round.step('A') == Round.STATE_FINISHED
+        assert game_round.winner is players[0]
+
+    def test_should_ignore_actions_after_the_round_is_finished(self, game_round, players):
+        game_round.step('3')
+        game_round.step('banana')
+
+        assert game_round.step('1') == Round.STATE_FINISHED
+        assert players[0].money == 1500
+
+
+class Test_run_async:
+    def test_should_await_the_pauses_of_every_round_on_the_same_loop(self, capsys):
+        def start_round(answers):
+            clock = AsyncClock(factor=1000)
+            answers = iter(answers)
+            cli = RoundCLI(renderer=FrameRenderer(io.StringIO()), clock=clock, input_source=lambda prompt: next(answers))
+            players = (Player('Ana'), Player('Bia'))
+            return Round(SecretWord(word='Banana'), 'fruits', players, cli=cli, rules=RULES), clock
+
+        first_round, first_clock = start_round(['3', 'banana'])
+        second_round, second_clock = start_round(['3', 'abacaxi', '3', 'banana'])
+
+        async def run_both():
+            await asyncio.gather(first_round.run_async(first_clock), second_round.run_async(second_clock))
+
+        asyncio.run(run_both())
+
+        assert first_round.winner is first_round.players[0]
+        assert second_round.winner is second_round.players[1]
+        assert first_clock.pending == second_clock.pending == 0
+        assert 0 < first_clock.elapsed < second_clock.elapsed
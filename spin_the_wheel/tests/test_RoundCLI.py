@@ -0,0 +1,21 @@
+from unittest import mock
+
+from spin_the_wheel.RoundCLI import RoundCLI
+
+
+class Test_print:
+    def test_should_repaint_the_whole_frame_after_a_message(self, capsys):
+        renderer = mock.Mock()
+        RoundCLI(renderer=renderer).print_guess_message('a')
+
+        assert capsys.readouterr().out == "Você chutou 'a'\n"
+        renderer.invalidate.assert_called_once_with()
+
+
+class Test_input:
+    def test_should_repaint_the_whole_frame_after_an_answer(self):
+        renderer = mock.Mock()
+        cli = RoundCLI(renderer=renderer, input_source=lambda prompt: 'Abacaxi')
+
+        assert cli.input_word_guess() == 'Abacaxi'
+        renderer.invalidate.assert_called_once_with()
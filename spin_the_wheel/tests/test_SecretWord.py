@@ -1,7 +1,8 @@
 import pytest
 from random import seed
 
-from spin_the_wheel.words import SecretWord, InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess, RequiredField
+from spin_the_wheel.words import SecretWord, InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess, RequiredField, \
+    RevealKind, RevealStatus
 
 
 @pytest.fixture(scope='module')
@@ -23,7 +24,7 @@ class Test___init__:
         assert sw.get_letter_count('a') == 2
         assert sw.get_letter_count('o') == 2
         assert sw.get_letter_count('e') == 1
-        assert len(sw._previously_guessed_letters) == 0
+        assert len(sw.previously_guessed_letters) == 0
         assert not sw.was_guessed
 
     def test_should_get_random_word_if_a_theme_is_passed(self):
@@ -36,7 +37,7 @@ class Test___init__:
         assert sw.get_letter_count('o') == 2
         assert sw.get_letter_count('e') == 0
         assert sw.get_letter_count('t') == 2
-        assert len(sw._previously_guessed_letters) == 0
+        assert len(sw.previously_guessed_letters) == 0
         assert not sw.was_guessed
 
     def test_should_raise_error_if_no_theme_or_word_is_passed(self):
@@ -307,3 +308,37 @@ class Test_get_letter_count:
         count = secret_word.get_letter_count('a')
 
         assert count == 2
+
+
+class Test_previously_guessed_letters:
+    def test_should_return_every_guessed_letter_including_the_missed_ones(self, secret_word):
+        secret_word.reveal_letter('o')
+        secret_word.reveal_letter('z')
+        secret_word.reveal_letter('1')
+
+        assert sorted(secret_word.previously_guessed_letters) == ['1', 'O', 'Z']
+
+    def test_should_not_have_instance_dict(self, secret_word):
+        with pytest.raises(AttributeError):
+            secret_word.extra = True
+
+
+class Test_try_reveal:
+    def test_should_return_the_status_and_the_number_of_revealed_letters(self, secret_word):
+        assert secret_word.try_reveal('a') == (RevealStatus.REVEALED, 2)
+        assert secret_word.try_reveal('z') == (RevealStatus.NOT_FOUND, 0)
+        assert secret_word.get_hidden_word().count('_') == 7
+
+    def test_should_return_status_instead_of_raising_error(self, secret_word):
+        assert secret_word.try_reveal('@') == (RevealStatus.INVALID_LETTER, 0)
+        assert secret_word.try_reveal('s', RevealKind.VOWEL) == (RevealStatus.WRONG_KIND, 0)
+        assert secret_word.try_reveal('o', RevealKind.CONSONANT_OR_NUMBER) == (RevealStatus.WRONG_KIND, 0)
+
+        secret_word.try_reveal('s')
+        assert secret_word.try_reveal('s') == (RevealStatus.GUESSED_BEFORE, 0)
+
+    def test_should_return_nothing_left_after_the_word_was_guessed(self, secret_word):
+        secret_word.check_word('sabao em po')
+
+        assert secret_word.was_guessed
+        assert secret_word.try_reveal('z') == (RevealStatus.NOTHING_LEFT, 0)
@@ -0,0 +1,60 @@
+from random import seed
+
+from Clock import VirtualClock
+from player import Player
+from RoundCLI import HeadlessRoundCLI
+from Simulation import Simulation, frequency_strategy, random_strategy
+from words import SecretWord
+
+
+class Test_run:
+    def test_should_play_every_game_to_the_end(self):
+        seed(0)
+        report = Simulation([random_strategy, frequency_strategy]).run(20)
+
+        assert report.games_count == 20
+        assert report.rounds_count == 60
+        assert report.unfinished_rounds_count == 0
+        assert sum(report.game_wins) == 20
+        assert all(money >= 0 for money in report.money)
+
+    def test_should_play_the_same_games_with_the_same_seed(self):
+        seed(7)
+        first_report = Simulation([random_strategy, random_strategy]).run(5)
+        seed(7)
+        second_report = Simulation([random_strategy, random_strategy]).run(5)
+
+        assert first_report.money == second_report.money
+        assert first_report.turns_count == second_report.turns_count
+
+
+class Test_strategies:
+    def test_should_answer_every_state_of_the_round(self):
+        seed(0)
+        simulation = Simulation([frequency_strategy])
+        game_round = simulation.create_round(SecretWord(word='Banana'), 'fruits', (Player('Bot', 1000),))
+
+        assert random_strategy(game_round) in {'1', '2'}
+        game_round.step('1')
+        consonant = frequency_strategy(game_round)
+        assert len(consonant) == 1
+        assert consonant in set('BCDFGHJKLMNPQRSTVWXYZ0123456789')
+        game_round.step('N')
+        game_round.step('2')
+        vowel = random_strategy(game_round)
+        assert len(vowel) == 1
+        assert vowel in set('AEIOU')
+
+
+class Test_HeadlessRoundCLI:
+    def test_should_not_print_or_sleep(self, capsys):
+        clock = VirtualClock()
+        cli = HeadlessRoundCLI(clock=clock)
+
+        cli.print_start_message(SecretWord(word='Banana'), 'fruits', Player('Bot'))
+        cli.print_guessed_correctly_message(3, 'A')
+        cli.print_word_guess_message(True, 'BANANA', 500)
+        cli.print_end_turn_message(False)
+
+        assert capsys.readouterr().out == ''
+        assert clock.elapsed == 0
@@ -0,0 +1,51 @@
+from RoundRules import RoundRules
+from Simulation import random_strategy
+from Sweep import Distribution, SweepResult, run_chunk, sweep
+
+CONFIGURATIONS = [RoundRules(), RoundRules(vowel_cost=100, word_value=1000)]
+
+
+class Test_Distribution:
+    def test_should_summarize_the_samples(self):
+        distribution = Distribution([1, 2, 2, 3, 10])
+
+        assert distribution.count == 5
+        assert distribution.mean() == 3.6
+        assert distribution.percentile(0) == 1
+        assert distribution.percentile(50) == 2
+        assert distribution.percentile(100) == 10
+
+    def test_should_return_zero_when_there_are_no_samples(self):
+        assert Distribution().mean() == 0
+        assert Distribution().percentile(50) == 0
+
+
+class Test_run_chunk:
+    def test_should_play_the_same_games_with_the_same_seed(self):
+        first_result = run_chunk(CONFIGURATIONS[0], [random_strategy, random_strategy], 3, 42)
+        second_result = run_chunk(CONFIGURATIONS[0], [random_strategy, random_strategy], 3, 42)
+
+        assert first_result.games_count == 3
+        assert first_result.earnings == second_result.earnings
+        assert first_result.round_turns.count == 9
+
+    def test_should_merge_the_results(self):
+        result = SweepResult(CONFIGURATIONS[0])
+        result.merge(run_chunk(CONFIGURATIONS[0], [random_strategy, random_strategy], 2, 1))
+        result.merge(run_chunk(CONFIGURATIONS[0], [random_strategy, random_strategy], 3, 2))
+
+        assert result.games_count == 5
+        assert result.earnings.count == 10
+        assert result.win_margins.count == 5
+
+
+class Test_sweep:
+    def test_should_play_every_game_of_every_configuration(self):
+        results = {}
+        for configuration_index, result in sweep(CONFIGURATIONS, [random_strategy, random_strategy], 4,
+                                                 games_per_chunk=3, workers=1):
+            results[configuration_index] = result
+
+        assert sorted(results) == [0, 1]
+        assert [result.games_count for result in results.values()] == [4, 4]
+        assert results[1].rules is CONFIGURATIONS[1]
@@ -0,0 +1,65 @@
+import os
+from random import seed
+
+import pytest
+
+from spin_the_wheel.words import ThemeStore
+
+
+@pytest.fixture()
+def assets_path(tmp_path):
+    (tmp_path / 'colors.txt').write_text('Azul\nVermelho\n  Amarelo  \nVerde', encoding='utf-8')
+    return str(tmp_path)
+
+
+class Test_get_word:
+    def test_should_return_the_stripped_word_of_the_line(self, assets_path):
+        store = ThemeStore(assets_path)
+
+        assert store.count('colors') == 4
+        assert store.get_word('colors', 0) == 'Azul'
+        assert store.get_word('colors', 2) == 'Amarelo'
+        assert store.get_word('colors', 3) == 'Verde'
+
+    def test_should_read_accented_words(self, tmp_path):
+        (tmp_path / 'food.txt').write_text('Sabão em pó\nPão\n', encoding='utf-8')
+        store = ThemeStore(str(tmp_path))
+
+        assert store.count('food') == 2
+        assert list(store.iter_words('food')) == ['Sabão em pó', 'Pão']
+
+    def test_should_throw_error_if_the_theme_doesnt_exists(self, assets_path):
+        with pytest.raises(FileNotFoundError):
+            ThemeStore(assets_path).get_word('a9s7d9a87sd9', 0)
+
+
+class Test_get_random_word:
+    def test_should_pick_the_same_word_as_reading_every_line(self, assets_path):
+        store = ThemeStore(assets_path)
+
+        seed(3)
+        word = store.get_random_word('colors')
+
+        assert word == 'Vermelho'
+
+
+class Test_index:
+    def test_should_persist_the_index_next_to_the_asset(self, assets_path):
+        ThemeStore(assets_path).count('colors')
+
+        assert os.path.exists(os.path.join(assets_path, 'colors.idx'))
+        assert ThemeStore(assets_path).get_word('colors', 1) == 'Vermelho'
+
+    def test_should_rebuild_the_index_when_the_asset_changes(self, assets_path):
+        store = ThemeStore(assets_path)
+        assert store.count('colors') == 4
+
+        file_path = os.path.join(assets_path, 'colors.txt')
+        with open(file_path, 'a', encoding='utf-8') as file:
+            file.write('\nRoxo\n')
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert store.count('colors') == 5
+        assert store.get_word('colors', 4) == 'Roxo'
+        assert ThemeStore(assets_path).count('colors') == 5
@@ -0,0 +1,101 @@
+from collections import Counter
+from decimal import Decimal
+from fractions import Fraction
+from random import Random, seed
+
+import pytest
+
+from spin_the_wheel.Wheel import Wheel
+
+OPTIONS = [100, 200, 300, 400, 500]
+
+
+def get_decimal_distribution(options, strengths):
+    # Every outcome of the original Decimal based spin, weighted equally
+    counter = Counter()
+    for strength in strengths:
+        min_placement, max_placement = Wheel._STRENGTH_RANGES[strength]
+        for placement in range(min_placement, max_placement + 1):
+            for precision in (0.9, 1, 1.1):
+                final_placement = int(Decimal(str(placement)) * Decimal(str(precision)))
+                counter[options[final_placement % (len(options) - 1)]] += 1
+
+    total = sum(counter.values())
+    return {option: Fraction(count, total) for option, count in counter.items()}
+
+
+class Test_distribution:
+    def test_should_match_the_decimal_spin_for_a_random_strength(self):
+        distribution = Wheel(OPTIONS).distribution()
+        expected = get_decimal_distribution(OPTIONS, [0])
+
+        for strength in (1, 2):
+            for option, probability in get_decimal_distribution(OPTIONS, [strength]).items():
+                expected[option] = expected.get(option, 0) + probability
+        expected = {option: probability / 3 for option, probability in expected.items()}
+
+        assert {option: p for option, p in distribution.items() if p} == expected
+        assert sum(distribution.values()) == 1
+
+    @pytest.mark.parametrize('strength', [1, 2])
+    def test_should_match_the_decimal_spin_for_a_given_strength(self, strength):
+        distribution = Wheel(OPTIONS).distribution(strength)
+
+        assert {option: p for option, p in distribution.items() if p} == \
+            get_decimal_distribution(OPTIONS, [strength])
+
+    def test_should_never_land_on_the_last_option(self):
+        assert Wheel(OPTIONS).distribution()[500] == 0
+
+    def test_should_add_up_repeated_options(self):
+        distribution = Wheel([100, 100, 300]).distribution()
+
+        assert distribution == {100: Fraction(1), 300: Fraction(0)}
+
+
+class Test_spin:
+    def test_should_follow_the_distribution(self):
+        seed(1)
+        wheel = Wheel(OPTIONS)
+        spins_count = 60000
+        counter = Counter(wheel.spin() for _ in range(spins_count))
+
+        for option, probability in wheel.distribution().items():
+            assert counter[option] / spins_count == pytest.approx(float(probability), abs=0.01)
+
+    def test_should_always_land_on_the_only_option(self):
+        assert {Wheel([300]).spin() for _ in range(100)} == {300}
+
+    def test_should_not_accept_a_wheel_without_options(self):
+        with pytest.raises(ValueError):
+            Wheel([])
+
+    def test_should_repeat_the_spins_of_a_seeded_generator(self):
+        first_wheel = Wheel(OPTIONS, rng=Random(7))
+        second_wheel = Wheel(OPTIONS, rng=Random(7))
+
+        assert [first_wheel.spin() for _ in range(50)] == [second_wheel.spin() for _ in range(50)]
+
+
+class Test_spin_many:
+    def test_should_follow_the_distribution(self):
+        pytest.importorskip('numpy')
+        wheel = Wheel(OPTIONS)
+        spins = wheel.spin_many(60000, rng=1)
+
+        for option, probability in wheel.distribution().items():
+            assert (spins == option).mean() == pytest.approx(float(probability), abs=0.01)
+
+    def test_should_repeat_the_spins_of_the_same_seed(self):
+        pytest.importorskip('numpy')
+        wheel = Wheel(OPTIONS)
+
+        assert wheel.spin_many(100, rng=3).tolist() == wheel.spin_many(100, rng=3).tolist()
+
+    def test_should_only_land_on_options_of_the_given_strength(self):
+        pytest.importorskip('numpy')
+        wheel = Wheel(OPTIONS)
+        spins = wheel.spin_many(1000, strength=1, rng=5)
+
+        possible_options = {option for option, probability in wheel.distribution(1).items() if probability}
+        assert set(spins.tolist()) == possible_options
@@ -0,0 +1,93 @@
+import os
+from multiprocessing import get_context
+from random import Random
+
+import pytest
+
+from spin_the_wheel.words import MemoryWordDeck, ThemeStore, WordDeck
+
+COLORS = ['Azul', 'Vermelho', 'Amarelo', 'Verde', 'Roxo']
+
+
+@pytest.fixture()
+def assets_path(tmp_path):
+    (tmp_path / 'colors.txt').write_text('\n'.join(COLORS), encoding='utf-8')
+    return str(tmp_path)
+
+
+def _draw_positions(assets_path, draws_count):
+    deck = WordDeck(ThemeStore(assets_path), assets_path)
+    positions = [deck.draw_position('colors') for _ in range(draws_count)]
+    deck.close()
+    return positions
+
+
+class Test_draw:
+    def test_should_draw_every_word_before_repeating_any(self, assets_path):
+        deck = WordDeck(ThemeStore(assets_path), assets_path, Random(3))
+
+        words = [deck.draw('colors') for _ in range(len(COLORS))]
+
+        assert sorted(words) == sorted(COLORS)
+        assert deck.remaining('colors') == 0
+
+    def test_should_shuffle_again_when_the_deck_ends(self, assets_path):
+        deck = WordDeck(ThemeStore(assets_path), assets_path, Random(3))
+
+        first_deck = [deck.draw('colors') for _ in range(len(COLORS))]
+        second_deck = [deck.draw('colors') for _ in range(len(COLORS))]
+
+        assert sorted(second_deck) == sorted(COLORS)
+        assert second_deck[0] != first_deck[-1]
+        assert deck.remaining('colors') == 0
+
+    def test_should_keep_the_cursor_between_decks_of_the_same_file(self, assets_path):
+        store = ThemeStore(assets_path)
+        first_words = [WordDeck(store, assets_path).draw('colors') for _ in range(2)]
+
+        deck = WordDeck(store, assets_path)
+        assert deck.remaining('colors') == 3
+        other_words = [deck.draw('colors') for _ in range(3)]
+
+        assert sorted(first_words + other_words) == sorted(COLORS)
+        assert os.path.exists(os.path.join(assets_path, 'colors.deck'))
+
+    def test_should_shuffle_again_when_the_theme_changes(self, assets_path):
+        deck = WordDeck(ThemeStore(assets_path), assets_path)
+        deck.draw('colors')
+
+        with open(os.path.join(assets_path, 'colors.txt'), 'a', encoding='utf-8') as file:
+            file.write('\nPreto')
+
+        assert deck.remaining('colors') == len(COLORS) + 1
+
+    def test_should_not_repeat_words_between_processes(self, assets_path):
+        with get_context('spawn').Pool(4) as pool:
+            decks = pool.starmap(_draw_positions, [(assets_path, len(COLORS))] * 4)
+
+        positions = sorted(position for deck in decks for position in deck)
+        assert positions == sorted(list(range(len(COLORS))) * 4)
+
+
+class Test_MemoryWordDeck:
+    def test_should_draw_every_word_before_repeating_any(self, assets_path):
+        deck = MemoryWordDeck(ThemeStore(assets_path), Random(3))
+
+        first_deck = [deck.draw('colors') for _ in range(len(COLORS))]
+        second_deck = [deck.draw('colors') for _ in range(len(COLORS))]
+
+        assert sorted(first_deck) == sorted(COLORS)
+        assert sorted(second_deck) == sorted(COLORS)
+        assert second_deck[0] != first_deck[-1]
+
+    def test_should_draw_the_same_words_with_the_same_seed(self, assets_path):
+        store = ThemeStore(assets_path)
+        first_deck = MemoryWordDeck(store, Random(7))
+        second_deck = MemoryWordDeck(store, Random(7))
+
+        assert [first_deck.draw('colors') for _ in range(8)] == [second_deck.draw('colors') for _ in range(8)]
+
+    def test_should_not_write_any_deck_file(self, assets_path):
+        MemoryWordDeck(ThemeStore(assets_path), Random(3)).draw('colors')
+
+        assert not os.path.exists(os.path.join(assets_path, 'colors.deck'))
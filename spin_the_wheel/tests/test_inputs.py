@@ -0,0 +1,70 @@
+from random import Random
+
+import pytest
+
+from spin_the_wheel.inputs import (
+    InputExhausted, RandomInput, RecordingInput, ReplayInput, Transcript, load_transcripts, save_transcripts
+)
+from spin_the_wheel.player import InputPlayerScene
+
+
+class Test_ReplayInput:
+    def test_should_answer_with_the_recorded_answers(self):
+        replay_input = ReplayInput(['2', 'Ana', 'Bia'])
+
+        players = InputPlayerScene.input_players(replay_input)
+
+        assert [player.name for player in players] == ['Ana', 'Bia']
+        assert replay_input.answers_count == 3
+
+    def test_should_keep_the_latency_of_every_prompt(self):
+        replay_input = ReplayInput(['1', 'Ana'])
+
+        InputPlayerScene.input_players(replay_input)
+
+        assert len(replay_input.latencies['Quantos jogadores serão? ']) == 1
+
+    def test_should_raise_when_the_answers_run_out(self):
+        with pytest.raises(InputExhausted):
+            InputPlayerScene.input_players(ReplayInput(['2', 'Ana']))
+
+
+class Test_RecordingInput:
+    def test_should_record_every_prompt_and_answer(self):
+        transcript = Transcript(seed=1)
+
+        InputPlayerScene.input_players(RecordingInput(ReplayInput(['x', '1', 'Ana']), transcript))
+
+        assert transcript.entries == [
+            ('Quantos jogadores serão? ', 'x'),
+            ('Quantos jogadores serão? ', '1'),
+            ('Qual o nome do jogador? ', 'Ana'),
+        ]
+
+
+class Test_RandomInput:
+    def test_should_not_repeat_a_letter_before_trying_all_of_them(self):
+        random_input = RandomInput(Random(2), invalid_chance=0)
+
+        vowels = [random_input('Chute uma vogal: ') for _ in range(5)]
+
+        assert sorted(vowels) == ['A', 'E', 'I', 'O', 'U']
+
+    def test_should_stop_after_the_maximum_of_answers(self):
+        random_input = RandomInput(Random(2), max_answers=2)
+        random_input('')
+        random_input('')
+
+        with pytest.raises(InputExhausted):
+            random_input('')
+
+
+class Test_save_transcripts:
+    def test_should_load_the_saved_transcripts(self, tmp_path):
+        file_path = str(tmp_path / 'sessions.jsonl')
+        transcripts = [Transcript(1, [('', '1'), ('Chute uma vogal: ', 'Á')]), Transcript(2)]
+
+        save_transcripts(file_path, transcripts)
+        loaded_transcripts = list(load_transcripts(file_path))
+
+        assert [(t.seed, t.entries) for t in loaded_transcripts] == [(t.seed, t.entries) for t in transcripts]
@@ -0,0 +1,38 @@
+from unittest import mock
+
+from spin_the_wheel.words import letters, SecretWord
+
+
+class Test_lookup:
+    def test_should_fold_accented_letters_to_upper_case_letters(self):
+        assert letters.fold_letter('á') == 'A'
+        assert letters.fold_letter('Ç') == 'C'
+        assert letters.fold_letter('ÿ') == 'Y'
+
+    def test_should_classify_vowels_consonants_and_digits(self):
+        assert letters.classify('ó') == letters.VOWEL
+        assert letters.classify('ñ') == letters.CONSONANT
+        assert letters.classify('7') == letters.DIGIT
+
+    def test_should_classify_special_characters_as_non_guessable(self):
+        for character in ['_', '-', '!', ' ', ':', '']:
+            assert letters.classify(character) == letters.NON_GUESSABLE
+
+    def test_should_handle_characters_outside_the_table(self):
+        assert letters.lookup('Ω') == ('O', 'O', letters.VOWEL)
+
+
+class Test_fold_word:
+    def test_should_fold_and_strip_the_whole_word(self):
+        assert letters.fold_word(' Sabão em pó ') == 'SABAO EM PO'
+
+
+class Test_secret_word_board:
+    @mock.patch('unidecode.unidecode', side_effect=AssertionError('unidecode should not be called'))
+    def test_should_not_call_unidecode_to_build_the_board_and_guess(self, _unidecode):
+        sw = SecretWord(word='Ação e reação')
+
+        assert sw.reveal_vowel('a')
+        assert sw.reveal_consonant_or_number('ç')
+        assert sw.get_letter_count('E') == 2
+        assert _unidecode.call_count == 0
@@ -0,0 +1,156 @@
+from collections import defaultdict
+
+from . import letters
+from .SecretWord import SecretWord
+
+
+# Byte string used by bytes.translate to turn a column into '1' where the
+# symbol id matches and '0' everywhere else
+def _match_table(symbol_id: int):
+    return b'0' * symbol_id + b'1' + b'0' * (255 - symbol_id)
+
+
+_MATCH_TABLES = [_match_table(symbol_id) for symbol_id in range(256)]
+
+
+class _LengthBucket:
+    def __init__(self, length: int, words: list, symbol_words: list):
+        self.length = length
+        self.words = words
+        self.all_words = (1 << len(words)) - 1
+        self.positions = [self._get_position_bitsets(symbol_words, position) for position in range(length)]
+        self.guessable = [0] * length
+        self.letters = defaultdict(int)
+
+        for position, bitsets in enumerate(self.positions):
+            for symbol, bitset in bitsets.items():
+                if letters.classify(symbol) != letters.NON_GUESSABLE:
+                    self.guessable[position] |= bitset
+                    self.letters[symbol] |= bitset
+
+    def _get_position_bitsets(self, symbol_words: list, position: int):
+        # Bit i of a bitset is set when the word i has the symbol in this position
+        column = ''.join([symbol_word[position] for symbol_word in symbol_words])
+        symbols = sorted(set(column))
+        if len(symbols) > len(_MATCH_TABLES):
+            return self._get_position_bitsets_by_word(column)
+
+        symbol_ids = {ord(symbol): chr(symbol_id) for symbol_id, symbol in enumerate(symbols)}
+        column = column.translate(symbol_ids).encode('latin-1')[::-1]
+
+        return {symbol: int(column.translate(_MATCH_TABLES[symbol_id]), 2) for symbol_id, symbol in enumerate(symbols)}
+
+    @staticmethod
+    def _get_position_bitsets_by_word(column: str):
+        bitsets = defaultdict(int)
+        for word_id, symbol in enumerate(column):
+            bitsets[symbol] |= 1 << word_id
+        return dict(bitsets)
+
+
+def _iter_bits(bitset: int):
+    bits = bin(bitset)[:1:-1]
+    position = bits.find('1')
+    while position != -1:
+        yield position
+        position = bits.find('1', position + 1)
+
+
+def _count_bits(bitset: int):
+    return bin(bitset).count('1')
+
+
+# Finds the theme words that still match a board. Words are bucketed by length
+# and each (position, letter) pair keeps a bitset of the words that have it, so
+# a query is a few bitset intersections instead of a scan over the whole theme
+class CandidateIndex:
+    __PLACEHOLDER_LETTER = '_'
+
+    # {theme: (ThemeIndex the candidates were built from, CandidateIndex)}
+    __theme_indexes = {}
+
+    def __init__(self, words):
+        bucket_words = defaultdict(dict)
+
+        for word in words:
+            word = word.strip().upper()
+            if word:
+                bucket_words[len(word)][word] = letters.fold_symbols(word)
+
+        self._buckets = {
+            length: _LengthBucket(length, list(symbol_words.keys()), list(symbol_words.values()))
+            for length, symbol_words in bucket_words.items()
+        }
+
+    @staticmethod
+    def for_theme(theme: str, theme_store=None):
+        if theme_store is None:
+            theme_store = SecretWord.get_theme_store()
+
+        theme_index = theme_store.get_index(theme)
+        cached = CandidateIndex.__theme_indexes.get(theme)
+        if cached is not None and cached[0] is theme_index:
+            return cached[1]
+
+        candidate_index = CandidateIndex(theme_index.iter_words())
+        CandidateIndex.__theme_indexes[theme] = (theme_index, candidate_index)
+        return candidate_index
+
+    def __len__(self):
+        return sum(len(bucket.words) for bucket in self._buckets.values())
+
+    def query(self, hidden_word, guessed_letters):
+        bucket, candidates = self._filter(hidden_word, guessed_letters)
+        if not candidates:
+            return set(), {}
+
+        words = {bucket.words[word_id] for word_id in _iter_bits(candidates)}
+        return words, self._count_letters(bucket, candidates, guessed_letters)
+
+    def count_candidates(self, hidden_word, guessed_letters):
+        _, candidates = self._filter(hidden_word, guessed_letters)
+        return _count_bits(candidates)
+
+    def get_letter_frequencies(self, hidden_word, guessed_letters):
+        bucket, candidates = self._filter(hidden_word, guessed_letters)
+        if not candidates:
+            return {}
+        return self._count_letters(bucket, candidates, guessed_letters)
+
+    def _filter(self, hidden_word, guessed_letters):
+        bucket = self._buckets.get(len(hidden_word))
+        if bucket is None:
+            return None, 0
+
+        guessed_letters = [letters.fold_letter(letter) for letter in guessed_letters]
+        candidates = bucket.all_words
+
+        for position, character in enumerate(hidden_word):
+            symbols = bucket.positions[position]
+
+            if character == CandidateIndex.__PLACEHOLDER_LETTER:
+                # A hidden position holds a letter nobody has guessed yet
+                candidates &= bucket.guessable[position]
+                for letter in guessed_letters:
+                    candidates &= ~symbols.get(letter, 0)
+            else:
+                candidates &= symbols.get(letters.fold_symbols(character), 0)
+
+            if not candidates:
+                break
+
+        return bucket, candidates
+
+    @staticmethod
+    def _count_letters(bucket: _LengthBucket, candidates: int, guessed_letters):
+        guessed_letters = {letters.fold_letter(letter) for letter in guessed_letters}
+        frequencies = {}
+
+        for letter, bitset in bucket.letters.items():
+            if letter in guessed_letters:
+                continue
+            count = _count_bits(candidates & bitset)
+            if count:
+                frequencies[letter] = count
+
+        return frequencies
@@ -0,0 +1,182 @@
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from random import randrange
+
+from . import letters
+
+# Layout of a compiled corpus (headers are little endian, arrays use the byte
+# order of the machine that compiled it):
+#
+#   header   magic, version, themes count, records count, offsets position, themes position
+#   records  one record per word, written in the order the words were read
+#   offsets  u64 position of every record plus the end of the last one
+#   themes   u16 name length, name, u64 first record, u64 records count
+#
+# and of a record:
+#
+#   u32 word size, u32 folded word size, u16 letters count, word, folded word,
+#   then for every letter: u8 letter, u32 positions count, u32 positions
+_HEADER = struct.Struct('<4sIIQQQ')
+_RECORD_HEADER = struct.Struct('<IIH')
+_LETTER_HEADER = struct.Struct('<BI')
+_THEME_HEADER = struct.Struct('<H')
+_THEME_RANGE = struct.Struct('<QQ')
+
+_MAGIC = b'SWCP'
+_VERSION = 1
+
+
+class CorpusRecord:
+    __slots__ = ('word', 'folded_word', 'positions')
+
+    def __init__(self, word: str, folded_word: str, positions: dict):
+        self.word = word
+        self.folded_word = folded_word
+        self.positions = positions
+
+
+class Corpus:
+    def __init__(self, file_path: str):
+        with open(file_path, 'rb') as file:
+            self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, themes_count, records_count, offsets_position, themes_position = \
+            _HEADER.unpack_from(self._data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f'{file_path} não é um corpus compilado')
+
+        self._offsets = memoryview(self._data)[offsets_position:themes_position].cast('Q')
+        self._themes = self._read_themes(themes_position, themes_count)
+
+    def _read_themes(self, position: int, themes_count: int):
+        themes = {}
+        for _ in range(themes_count):
+            (name_size,) = _THEME_HEADER.unpack_from(self._data, position)
+            position += _THEME_HEADER.size
+            name = self._data[position:position + name_size].decode('utf-8')
+            position += name_size
+            themes[name] = _THEME_RANGE.unpack_from(self._data, position)
+            position += _THEME_RANGE.size
+        return themes
+
+    @property
+    def themes(self):
+        return list(self._themes.keys())
+
+    def count(self, theme: str):
+        return self._get_theme_range(theme)[1]
+
+    def get_record(self, theme: str, position: int):
+        first_record, records_count = self._get_theme_range(theme)
+        if not 0 <= position < records_count:
+            raise IndexError(f'O tema {theme} tem apenas {records_count} palavras')
+
+        return self._read_record(self._offsets[first_record + position])
+
+    def get_random_record(self, theme: str):
+        return self.get_record(theme, randrange(0, self.count(theme)))
+
+    def _get_theme_range(self, theme: str):
+        theme_range = self._themes.get(theme)
+        if theme_range is None:
+            raise KeyError(f'O tema {theme} não existe no corpus')
+        return theme_range
+
+    def _read_record(self, position: int):
+        data = self._data
+        word_size, folded_word_size, letters_count = _RECORD_HEADER.unpack_from(data, position)
+        position += _RECORD_HEADER.size
+
+        word = data[position:position + word_size].decode('utf-8')
+        position += word_size
+        folded_word = data[position:position + folded_word_size].decode('utf-8')
+        position += folded_word_size
+
+        positions = {}
+        for _ in range(letters_count):
+            letter, positions_count = _LETTER_HEADER.unpack_from(data, position)
+            position += _LETTER_HEADER.size
+
+            letter_positions = array('I')
+            letter_positions.frombytes(data[position:position + positions_count * 4])
+            positions[chr(letter)] = letter_positions
+            position += positions_count * 4
+
+        return CorpusRecord(word, folded_word, positions)
+
+    def close(self):
+        self._offsets.release()
+        self._data.close()
+
+
+def _pack_record(word: str):
+    word = word.strip().upper()
+    positions = {letter: array('I', indexes) for letter, indexes in letters.map_guessable_positions(word).items()}
+
+    encoded_word = word.encode('utf-8')
+    encoded_folded_word = letters.fold_word(word).encode('utf-8')
+    parts = [
+        _RECORD_HEADER.pack(len(encoded_word), len(encoded_folded_word), len(positions)),
+        encoded_word,
+        encoded_folded_word,
+    ]
+    for letter, letter_positions in positions.items():
+        parts.append(_LETTER_HEADER.pack(ord(letter), len(letter_positions)))
+        parts.append(letter_positions.tobytes())
+
+    return b''.join(parts)
+
+
+def compile_corpus(theme_paths: dict, output_path: str):
+    # Streams every theme file record by record, the offsets go to a temporary
+    # file, so the corpus can be bigger than the available memory
+    themes = []
+    records_count = 0
+    output_directory = os.path.dirname(os.path.abspath(output_path))
+
+    with open(output_path, 'wb') as output, tempfile.TemporaryFile(dir=output_directory) as offsets_file:
+        output.write(b'\0' * _HEADER.size)
+        position = _HEADER.size
+        offsets = array('Q')
+
+        for theme, theme_path in theme_paths.items():
+            first_record = records_count
+            with open(theme_path, 'r', encoding='utf-8') as theme_file:
+                for line in theme_file:
+                    if not line.strip():
+                        continue
+
+                    record = _pack_record(line)
+                    offsets.append(position)
+                    output.write(record)
+                    position += len(record)
+                    records_count += 1
+
+                    if len(offsets) >= 65536:
+                        offsets.tofile(offsets_file)
+                        offsets = array('Q')
+
+            themes.append((theme, first_record, records_count - first_record))
+
+        offsets.append(position)
+        offsets.tofile(offsets_file)
+
+        offsets_position = position
+        offsets_file.seek(0)
+        for chunk in iter(lambda: offsets_file.read(1 << 20), b''):
+            output.write(chunk)
+
+        themes_position = output.tell()
+        for theme, first_record, theme_records_count in themes:
+            encoded_theme = theme.encode('utf-8')
+            output.write(_THEME_HEADER.pack(len(encoded_theme)))
+            output.write(encoded_theme)
+            output.write(_THEME_RANGE.pack(first_record, theme_records_count))
+
+        output.seek(0)
+        output.write(_HEADER.pack(_MAGIC, _VERSION, len(themes), records_count, offsets_position, themes_position))
+
+    return records_count
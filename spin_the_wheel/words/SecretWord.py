@@ -1,19 +1,38 @@
 import os
-from random import randrange
-from re import match
 from collections import defaultdict
-import unidecode
 
+from . import letters
 from .exceptions import InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess, RequiredField
+from .reveal import RevealKind, RevealStatus
+from .ThemeStore import ThemeStore
+from .WordDeck import WordDeck
 
 # Look for your absolute directory path
 absolute_path = os.path.dirname(os.path.abspath(__file__))
 
 
 class SecretWord:
+    __slots__ = (
+        '_secret_word',
+        '_hidden_word',
+        '_letter_positions_dict',
+        '_guessed_letters_mask',
+        '_hidden_letters_count',
+        '_folded_word',
+    )
+
     __PLACEHOLDER_LETTER = '_'
-    __VALID_LETTERS_PATTERN = '[a-zA-Z0-9]'
-    __VALID_VOWELS_PATTERN = '[aeiouAEIOU]'
+
+    __REVEAL_ERRORS = {
+        RevealStatus.WRONG_KIND: InvalidLetter,
+        RevealStatus.INVALID_LETTER: InvalidLetter,
+        RevealStatus.GUESSED_BEFORE: HasGuessedLetterBefore,
+        RevealStatus.NOTHING_LEFT: NothingLeftToGuess,
+    }
+
+    # Shared by every SecretWord, so each theme is indexed only once per process
+    _theme_store = ThemeStore(f'{absolute_path}/assets')
+    _word_deck = WordDeck(_theme_store, f'{absolute_path}/assets')
 
     def __init__(self, theme: str = None, word: str = None):
         if not word and not theme:
@@ -23,29 +42,68 @@ class SecretWord:
             word = SecretWord._get_random_secret_word(theme)
 
         self._secret_word = word.strip().upper()
-        self._hidden_word = self._create_hidden_word()
         self._letter_positions_dict = self._map_positions()
-        self._previously_guessed_letters = []
-        self.was_guessed = False
+        self._hidden_word = self._create_hidden_word()
+        self._guessed_letters_mask = 0
+        self._hidden_letters_count = sum(len(indexes) for indexes in self._letter_positions_dict.values())
+        self._folded_word = None
+
+    @staticmethod
+    def from_deck(theme: str, word_deck=None):
+        # Next word of the deck, the one shared by every game by default. No
+        # word repeats until the deck ends
+        word_deck = word_deck if word_deck is not None else SecretWord._word_deck
+        return SecretWord(word=word_deck.draw(theme))
+
+    @staticmethod
+    def get_theme_store():
+        return SecretWord._theme_store
+
+    @staticmethod
+    def from_record(record):
+        # Builds the word straight from a compiled corpus record, which already
+        # carries the folded word and the letter positions
+        secret_word = SecretWord.__new__(SecretWord)
+        secret_word._secret_word = record.word
+        secret_word._folded_word = record.folded_word
+        secret_word._letter_positions_dict = dict(record.positions)
+        secret_word._guessed_letters_mask = 0
+
+        hidden_word = list(record.word)
+        hidden_letters_count = 0
+        for indexes in record.positions.values():
+            hidden_letters_count += len(indexes)
+            for i in indexes:
+                hidden_word[i] = SecretWord.__PLACEHOLDER_LETTER
+        secret_word._hidden_word = hidden_word
+        secret_word._hidden_letters_count = hidden_letters_count
+
+        return secret_word
 
     @property
     def previously_guessed_letters(self):
-        return self._previously_guessed_letters
+        return letters.letters_from_mask(self._guessed_letters_mask)
 
-    @staticmethod
-    def _get_random_secret_word(theme):
-        file_path = f'{absolute_path}/assets/{theme}.txt'
+    @property
+    def guessed_letters_mask(self):
+        return self._guessed_letters_mask
 
-        with open(file_path, 'r', encoding='utf-8') as file:
-            words = [line for line in file]
+    @property
+    def was_guessed(self):
+        return self._hidden_letters_count == 0
 
-        random_word = words[randrange(0, len(words))]
-        return random_word.strip()
+    @staticmethod
+    def _get_random_secret_word(theme):
+        return SecretWord._theme_store.get_random_word(theme)
 
     @staticmethod
     def _is_letter_valid(letter: str):
         letter = SecretWord._normalize_letter(letter)
-        return bool(match(SecretWord.__VALID_LETTERS_PATTERN, letter))
+        return letters.classify(letter) != letters.NON_GUESSABLE
+
+    @staticmethod
+    def _is_vowel(letter: str):
+        return letters.classify(letter) == letters.VOWEL
 
     @staticmethod
     def _normalize_letter(letter: str):
@@ -54,30 +112,21 @@ class SecretWord:
         if is_word:
             letter = letter[0]
 
-        return SecretWord._normalize_word(letter)
+        return letters.fold_letter(letter)
 
     @staticmethod
     def _normalize_word(word: str):
-        return unidecode.unidecode(word).strip().upper()
+        return letters.fold_word(word)
 
     def _map_positions(self):
-        positions_dict = defaultdict(list)
-        normalized_word = unidecode.unidecode(self._secret_word)
-
-        for i in range(len(normalized_word)):
-            letter = normalized_word[i]
-            if self._is_letter_valid(letter):
-                positions_dict[letter].append(i)
-
-        return positions_dict
+        return defaultdict(list, letters.map_guessable_positions(self._secret_word))
 
     def _create_hidden_word(self):
-        hidden_word = []
-        for letter in self._secret_word:
-            if self._is_letter_valid(letter):
-                hidden_word.append(SecretWord.__PLACEHOLDER_LETTER)
-            else:
-                hidden_word.append(letter)
+        hidden_word = list(self._secret_word)
+
+        for indexes in self._letter_positions_dict.values():
+            for i in indexes:
+                hidden_word[i] = SecretWord.__PLACEHOLDER_LETTER
         return hidden_word
 
     def get_word(self):
@@ -87,56 +136,72 @@ class SecretWord:
         return self._hidden_word
 
     def reveal_vowel(self, letter: str):
-        letter = SecretWord._normalize_letter(letter)
-
-        is_vowel = bool(match(SecretWord.__VALID_VOWELS_PATTERN, letter))
-        if not is_vowel:
-            raise InvalidLetter('Você deveria chutar uma vogal')
-
-        return self.reveal_letter(letter)
+        return self._reveal(letter, RevealKind.VOWEL)
 
     def reveal_consonant_or_number(self, letter: str):
-        letter = SecretWord._normalize_letter(letter)
-
-        is_vowel = bool(match(SecretWord.__VALID_VOWELS_PATTERN, letter))
-        if is_vowel:
-            raise InvalidLetter('Você deveria chutar uma consoante ou número')
-
-        return self.reveal_letter(letter)
+        return self._reveal(letter, RevealKind.CONSONANT_OR_NUMBER)
 
     def reveal_letter(self, letter: str):
-        letter = SecretWord._normalize_letter(letter)
-
-        self._check_if_word_was_guessed()
-        self._check_if_letter_is_valid(letter)
-        self._check_if_letter_was_guessed_before(letter)
+        return self._reveal(letter, RevealKind.LETTER)
 
-        self._previously_guessed_letters.append(letter)
+    def _reveal(self, letter: str, kind: RevealKind):
+        status, _ = self.try_reveal(letter, kind)
 
-        if not self.has_letter(letter):
+        if status == RevealStatus.REVEALED:
+            return True
+        if status == RevealStatus.NOT_FOUND:
             return False
 
-        indexes = self._letter_positions_dict[letter]
-        for i in indexes:
-            self._hidden_word[i] = self._secret_word[i]
-
-        self._letter_positions_dict.pop(letter)
-        self.was_guessed = SecretWord.__PLACEHOLDER_LETTER not in self._hidden_word
+        error = SecretWord.__REVEAL_ERRORS[status]
+        raise error(SecretWord.get_reveal_message(status, letter, kind))
 
-        return True
+    def try_reveal(self, letter: str, kind: RevealKind = RevealKind.LETTER):
+        # Same rules as the reveal_* methods, but every outcome is returned as
+        # (status, revealed count) instead of raising
+        letter = SecretWord._normalize_letter(letter)
+        letter_class = letters.classify(letter)
+
+        if kind == RevealKind.VOWEL and letter_class != letters.VOWEL:
+            return RevealStatus.WRONG_KIND, 0
+        if kind == RevealKind.CONSONANT_OR_NUMBER and letter_class == letters.VOWEL:
+            return RevealStatus.WRONG_KIND, 0
+        if self._hidden_letters_count == 0:
+            return RevealStatus.NOTHING_LEFT, 0
+        if letter_class == letters.NON_GUESSABLE:
+            return RevealStatus.INVALID_LETTER, 0
+
+        letter_bit = letters.letter_bit(letter)
+        if self._guessed_letters_mask & letter_bit:
+            return RevealStatus.GUESSED_BEFORE, 0
+        self._guessed_letters_mask |= letter_bit
+
+        indexes = self._letter_positions_dict.pop(letter, None)
+        if indexes is None:
+            return RevealStatus.NOT_FOUND, 0
+
+        hidden_word = self._hidden_word
+        secret_word = self._secret_word
+        for i in indexes:
+            hidden_word[i] = secret_word[i]
+        self._hidden_letters_count -= len(indexes)
 
-    def _check_if_letter_was_guessed_before(self, letter):
-        has_guessed_letter_before = letter in self._previously_guessed_letters
-        if has_guessed_letter_before:
-            raise HasGuessedLetterBefore(f'A letra \'{letter}\' já foi chutada anteriormente')
+        return RevealStatus.REVEALED, len(indexes)
 
-    def _check_if_letter_is_valid(self, letter):
-        if not self._is_letter_valid(letter):
-            raise InvalidLetter(f'\'{letter}\' não é uma letra válida')
+    @staticmethod
+    def get_reveal_message(status: RevealStatus, letter: str, kind: RevealKind = RevealKind.LETTER):
+        letter = SecretWord._normalize_letter(letter)
 
-    def _check_if_word_was_guessed(self):
-        if self.was_guessed:
-            raise NothingLeftToGuess('Não tem mais nada para ser adivinhado')
+        if status == RevealStatus.WRONG_KIND and kind == RevealKind.VOWEL:
+            return 'Você deveria chutar uma vogal'
+        if status == RevealStatus.WRONG_KIND:
+            return 'Você deveria chutar uma consoante ou número'
+        if status == RevealStatus.INVALID_LETTER:
+            return f'\'{letter}\' não é uma letra válida'
+        if status == RevealStatus.GUESSED_BEFORE:
+            return f'A letra \'{letter}\' já foi chutada anteriormente'
+        if status == RevealStatus.NOTHING_LEFT:
+            return 'Não tem mais nada para ser adivinhado'
+        return ''
 
     def has_letter(self, letter: str):
         letter = SecretWord._normalize_letter(letter)
@@ -150,14 +215,14 @@ class SecretWord:
         return len(indexes)
 
     def check_word(self, word):
-        secret_word = SecretWord._normalize_word(self.get_word())
+        secret_word = self._folded_word or SecretWord._normalize_word(self.get_word())
         word = SecretWord._normalize_word(word)
 
         was_guessed = secret_word == word
 
         if was_guessed:
-            letters = list(self._letter_positions_dict.keys())
-            for letter in letters:
-                self.reveal_letter(letter)
+            remaining_letters = list(self._letter_positions_dict.keys())
+            for letter in remaining_letters:
+                self.try_reveal(letter)
 
         return was_guessed
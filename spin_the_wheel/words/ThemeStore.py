@@ -0,0 +1,143 @@
+import mmap
+import os
+import struct
+import threading
+from array import array
+from random import randrange
+
+
+class ThemeIndex:
+    def __init__(self, file_path: str, mtime_ns: int, size: int, offsets: array):
+        self._file_path = file_path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self._offsets = offsets
+        self._data = self._map_file()
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def _map_file(self):
+        if self.size == 0:
+            return b''
+
+        with open(self._file_path, 'rb') as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def is_stale(self, stat: os.stat_result):
+        return stat.st_mtime_ns != self.mtime_ns or stat.st_size != self.size
+
+    def get_word(self, position: int):
+        start = self._offsets[position]
+        end = self._offsets[position + 1]
+        return self._data[start:end].decode('utf-8').strip()
+
+    def iter_words(self):
+        for position in range(len(self)):
+            yield self.get_word(position)
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+# Builds the line offsets of a theme once, persists them next to the asset
+# (<theme>.idx) and rebuilds them whenever the asset mtime or size changes
+class ThemeStore:
+    __INDEX_EXTENSION = '.idx'
+    __INDEX_MAGIC = b'SWIX'
+    __INDEX_HEADER = struct.Struct('<4sqqq')
+
+    def __init__(self, assets_path: str):
+        self._assets_path = assets_path
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def get_random_word(self, theme: str):
+        theme_index = self.get_index(theme)
+        return theme_index.get_word(randrange(0, len(theme_index)))
+
+    def get_word(self, theme: str, position: int):
+        return self.get_index(theme).get_word(position)
+
+    def count(self, theme: str):
+        return len(self.get_index(theme))
+
+    def iter_words(self, theme: str):
+        return self.get_index(theme).iter_words()
+
+    def get_index(self, theme: str):
+        file_path = self._get_theme_path(theme)
+        stat = os.stat(file_path)
+
+        theme_index = self._indexes.get(theme)
+        if theme_index is not None and not theme_index.is_stale(stat):
+            return theme_index
+
+        with self._lock:
+            theme_index = self._indexes.get(theme)
+            if theme_index is None or theme_index.is_stale(stat):
+                if theme_index is not None:
+                    theme_index.close()
+                theme_index = self._load_index(file_path, stat)
+                self._indexes[theme] = theme_index
+
+        return theme_index
+
+    def _get_theme_path(self, theme: str):
+        return os.path.join(self._assets_path, f'{theme}.txt')
+
+    def _load_index(self, file_path: str, stat: os.stat_result):
+        index_path = file_path[:-len('.txt')] + ThemeStore.__INDEX_EXTENSION
+
+        offsets = self._read_offsets(index_path, stat)
+        if offsets is None:
+            offsets = self._build_offsets(file_path)
+            self._write_offsets(index_path, stat, offsets)
+
+        return ThemeIndex(file_path, stat.st_mtime_ns, stat.st_size, offsets)
+
+    @staticmethod
+    def _build_offsets(file_path: str):
+        offsets = array('q', [0])
+        position = 0
+
+        with open(file_path, 'rb') as file:
+            for line in file:
+                position += len(line)
+                offsets.append(position)
+
+        return offsets
+
+    @staticmethod
+    def _read_offsets(index_path: str, stat: os.stat_result):
+        header = ThemeStore.__INDEX_HEADER
+
+        try:
+            with open(index_path, 'rb') as index_file:
+                magic, mtime_ns, size, count = header.unpack(index_file.read(header.size))
+                if magic != ThemeStore.__INDEX_MAGIC or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                    return None
+
+                offsets = array('q')
+                offsets.fromfile(index_file, count + 1)
+                return offsets
+        except (OSError, EOFError, struct.error):
+            return None
+
+    @staticmethod
+    def _write_offsets(index_path: str, stat: os.stat_result, offsets: array):
+        header = ThemeStore.__INDEX_HEADER
+        temporary_path = f'{index_path}.{os.getpid()}.tmp'
+
+        try:
+            with open(temporary_path, 'wb') as index_file:
+                index_file.write(header.pack(
+                    ThemeStore.__INDEX_MAGIC, stat.st_mtime_ns, stat.st_size, len(offsets) - 1
+                ))
+                offsets.tofile(index_file)
+            os.replace(temporary_path, index_path)
+        except OSError:
+            # The index is only a cache, a read-only assets folder keeps it in memory
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
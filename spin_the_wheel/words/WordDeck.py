@@ -0,0 +1,175 @@
+import os
+import random
+import struct
+import threading
+from array import array
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .ThemeStore import ThemeStore
+
+
+# Hands out the words of a theme in a shuffled order without repeating any of
+# them until every word was drawn, then shuffles the deck again. The order and
+# the cursor live in <theme>.deck, locked while drawing, so every process
+# playing at the same time draws from the same deck
+class WordDeck:
+    __DECK_EXTENSION = '.deck'
+    __DECK_MAGIC = b'SWDK'
+    # magic, theme mtime, theme size, words count, cursor
+    __DECK_HEADER = struct.Struct('<4sqqqq')
+    __CURSOR = struct.Struct('<q')
+    __CURSOR_POSITION = __DECK_HEADER.size - __CURSOR.size
+    __POSITION = struct.Struct('=I')
+
+    def __init__(self, theme_store: ThemeStore, decks_path: str, rng: random.Random = None):
+        self._theme_store = theme_store
+        self._decks_path = decks_path
+        self._random = rng if rng is not None else random
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def draw(self, theme: str):
+        return self._theme_store.get_word(theme, self.draw_position(theme))
+
+    def draw_position(self, theme: str):
+        theme_index = self._theme_store.get_index(theme)
+        if len(theme_index) == 0:
+            raise ValueError(f'O tema {theme} não tem nenhuma palavra')
+
+        with self._lock:
+            deck_file = self._get_file(theme)
+            if fcntl is not None:
+                fcntl.flock(deck_file.fileno(), fcntl.LOCK_EX)
+            try:
+                return self._draw_position(deck_file, theme_index)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(deck_file.fileno(), fcntl.LOCK_UN)
+
+    def remaining(self, theme: str):
+        theme_index = self._theme_store.get_index(theme)
+        with self._lock:
+            deck_file = self._get_file(theme)
+            header = self._read_header(deck_file, theme_index)
+            if header is None:
+                return len(theme_index)
+            count, cursor = header
+            return count - cursor
+
+    def _draw_position(self, deck_file, theme_index):
+        header = self._read_header(deck_file, theme_index)
+        last_position = None
+
+        if header is not None:
+            count, cursor = header
+            if cursor >= count:
+                last_position = self._read_position(deck_file, count - 1)
+                header = None
+
+        if header is None:
+            self._shuffle(deck_file, theme_index, last_position)
+            cursor = 0
+
+        # Only the cursor is rewritten on a draw, the order stays untouched
+        position = self._read_position(deck_file, cursor)
+        deck_file.seek(WordDeck.__CURSOR_POSITION)
+        deck_file.write(WordDeck.__CURSOR.pack(cursor + 1))
+        return position
+
+    def _read_header(self, deck_file, theme_index):
+        header = WordDeck.__DECK_HEADER
+        deck_file.seek(0)
+        data = deck_file.read(header.size)
+        if len(data) < header.size:
+            return None
+
+        magic, mtime_ns, size, count, cursor = header.unpack(data)
+        if magic != WordDeck.__DECK_MAGIC or mtime_ns != theme_index.mtime_ns or size != theme_index.size:
+            return None
+        if count != len(theme_index):
+            return None
+        return count, cursor
+
+    def _read_position(self, deck_file, cursor: int):
+        deck_file.seek(WordDeck.__DECK_HEADER.size + cursor * WordDeck.__POSITION.size)
+        (position,) = WordDeck.__POSITION.unpack(deck_file.read(WordDeck.__POSITION.size))
+        return position
+
+    def _shuffle(self, deck_file, theme_index, last_position):
+        count = len(theme_index)
+        positions = array('I', range(count))
+        self._random.shuffle(positions)
+
+        # The last word of the previous deck doesn't open the next one
+        if count > 1 and positions[0] == last_position:
+            positions[0], positions[-1] = positions[-1], positions[0]
+
+        deck_file.seek(0)
+        deck_file.truncate()
+        deck_file.write(WordDeck.__DECK_HEADER.pack(
+            WordDeck.__DECK_MAGIC, theme_index.mtime_ns, theme_index.size, count, 0
+        ))
+        positions.tofile(deck_file)
+
+    def _get_file(self, theme: str):
+        deck_file = self._files.get(theme)
+        if deck_file is None:
+            deck_path = os.path.join(self._decks_path, f'{theme}{WordDeck.__DECK_EXTENSION}')
+            descriptor = os.open(deck_path, os.O_RDWR | os.O_CREAT, 0o644)
+            deck_file = os.fdopen(descriptor, 'r+b', buffering=0)
+            self._files[theme] = deck_file
+        return deck_file
+
+    def close(self):
+        with self._lock:
+            for deck_file in self._files.values():
+                deck_file.close()
+            self._files.clear()
+
+
+# Same draws as WordDeck, but the order and the cursor only live in memory, so
+# a seeded deck always hands out the same words and never touches the files
+# shared by the real games
+class MemoryWordDeck:
+    def __init__(self, theme_store: ThemeStore, rng: random.Random = None):
+        self._theme_store = theme_store
+        self._random = rng if rng is not None else random
+        # {theme: [shuffled positions, cursor]}
+        self._decks = {}
+
+    def draw(self, theme: str):
+        return self._theme_store.get_word(theme, self.draw_position(theme))
+
+    def draw_position(self, theme: str):
+        count = self._theme_store.count(theme)
+        if count == 0:
+            raise ValueError(f'O tema {theme} não tem nenhuma palavra')
+
+        deck = self._decks.get(theme)
+        if deck is None or len(deck[0]) != count:
+            deck = self._decks[theme] = [self._shuffle(count, None), 0]
+        elif deck[1] >= count:
+            deck = self._decks[theme] = [self._shuffle(count, deck[0][-1]), 0]
+
+        positions, cursor = deck
+        deck[1] = cursor + 1
+        return positions[cursor]
+
+    def remaining(self, theme: str):
+        deck = self._decks.get(theme)
+        if deck is None or len(deck[0]) != self._theme_store.count(theme):
+            return self._theme_store.count(theme)
+        return len(deck[0]) - deck[1]
+
+    def _shuffle(self, count: int, last_position):
+        positions = array('I', range(count))
+        self._random.shuffle(positions)
+
+        # The last word of the previous deck doesn't open the next one
+        if count > 1 and positions[0] == last_position:
+            positions[0], positions[-1] = positions[-1], positions[0]
+        return positions
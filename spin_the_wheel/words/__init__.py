@@ -1,2 +1,7 @@
 from .SecretWord import SecretWord
 from .exceptions import InvalidLetter, HasGuessedLetterBefore, NothingLeftToGuess, RequiredField
+from .reveal import RevealKind, RevealStatus
+from .ThemeStore import ThemeStore
+from .WordDeck import WordDeck, MemoryWordDeck
+from .CandidateIndex import CandidateIndex
+from .Corpus import Corpus, CorpusRecord, compile_corpus
@@ -0,0 +1,108 @@
+from functools import lru_cache
+
+import unidecode
+
+from jogos.positions import map_positions
+
+NON_GUESSABLE = 0
+VOWEL = 1
+CONSONANT = 2
+DIGIT = 3
+
+_VOWELS = 'AEIOU'
+_CONSONANTS = 'BCDFGHJKLMNPQRSTVWXYZ'
+_DIGITS = '0123456789'
+
+# Every guessable letter owns one bit, so a set of guesses fits in a single int
+_GUESSABLE_LETTERS = ''.join(sorted(_VOWELS + _CONSONANTS + _DIGITS))
+_LETTER_BITS = {letter: 1 << i for i, letter in enumerate(_GUESSABLE_LETTERS)}
+
+VOWELS_MASK = sum(_LETTER_BITS[letter] for letter in _VOWELS)
+CONSONANTS_MASK = sum(_LETTER_BITS[letter] for letter in _CONSONANTS)
+DIGITS_MASK = sum(_LETTER_BITS[letter] for letter in _DIGITS)
+
+# Basic Latin, Latin-1 Supplement, Latin Extended-A and Latin Extended-B
+_TABLE_SIZE = 0x250
+
+
+def _classify_letter(letter: str):
+    if letter in _VOWELS:
+        return VOWEL
+    if letter in _CONSONANTS:
+        return CONSONANT
+    if letter in _DIGITS:
+        return DIGIT
+    return NON_GUESSABLE
+
+
+def _build_entry(character: str):
+    folded = unidecode.unidecode(character).upper()
+    letter = folded.strip()[:1]
+    letter_class = _classify_letter(letter) if letter else NON_GUESSABLE
+    return folded, letter, letter_class
+
+
+_TABLE = tuple(_build_entry(chr(code_point)) for code_point in range(_TABLE_SIZE))
+_EMPTY_ENTRY = ('', '', NON_GUESSABLE)
+
+
+@lru_cache(maxsize=4096)
+def _build_entry_outside_table(character: str):
+    return _build_entry(character)
+
+
+def lookup(character: str):
+    # Returns (folded, letter, class): the full transliteration used to compare
+    # words, the single upper case letter used as a guess and its class
+    if not character:
+        return _EMPTY_ENTRY
+
+    code_point = ord(character)
+    if code_point < _TABLE_SIZE:
+        return _TABLE[code_point]
+    return _build_entry_outside_table(character)
+
+
+def fold_letter(character: str):
+    return lookup(character)[1]
+
+
+def classify(character: str):
+    return lookup(character)[2]
+
+
+def fold_word(word: str):
+    return ''.join([lookup(character)[0] for character in word]).strip()
+
+
+def letter_bit(letter: str):
+    return _LETTER_BITS.get(letter, 0)
+
+
+def letters_from_mask(mask: int):
+    return [letter for letter in _GUESSABLE_LETTERS if mask & _LETTER_BITS[letter]]
+
+
+class _SymbolTable(dict):
+    # str.translate table: guessable characters become their guess letter and
+    # every other character is kept, so the word length never changes
+    def __missing__(self, code_point):
+        _, letter, letter_class = lookup(chr(code_point))
+        return chr(code_point) if letter_class == NON_GUESSABLE else letter
+
+
+_SYMBOL_TABLE = _SymbolTable()
+for _code_point, (_, _letter, _letter_class) in enumerate(_TABLE):
+    if _letter_class != NON_GUESSABLE:
+        _SYMBOL_TABLE[_code_point] = _letter
+
+
+def fold_symbols(word: str):
+    return word.translate(_SYMBOL_TABLE)
+
+
+def map_guessable_positions(word: str):
+    # The positions index shared with the forca games, over the folded
+    # symbols, which keep the word length, without what can't be guessed
+    return {symbol: indexes for symbol, indexes in map_positions(fold_symbols(word)).items()
+            if classify(symbol) != NON_GUESSABLE}
@@ -0,0 +1,16 @@
+from enum import Enum, IntEnum
+
+
+class RevealKind(Enum):
+    LETTER = 'letter'
+    VOWEL = 'vowel'
+    CONSONANT_OR_NUMBER = 'consonant_or_number'
+
+
+class RevealStatus(IntEnum):
+    REVEALED = 0
+    NOT_FOUND = 1
+    WRONG_KIND = 2
+    INVALID_LETTER = 3
+    GUESSED_BEFORE = 4
+    NOTHING_LEFT = 5
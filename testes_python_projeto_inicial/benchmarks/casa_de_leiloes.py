@@ -0,0 +1,55 @@
+import time
+from random import Random
+
+from testes_python_projeto_inicial.src.leilao.casa_de_leiloes import CasaDeLeiloes
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+AUCTIONS_COUNT = 100_000
+USERS_COUNT = 50_000
+BIDS_COUNT = 10_000_000
+QUERIES_COUNT = 100_000
+
+
+def main():
+    random = Random(0)
+    casa = CasaDeLeiloes()
+    usuarios = [Usuario(f'Usuario {i}', 1_000_000.0) for i in range(USERS_COUNT)]
+
+    start = time.perf_counter()
+    leiloes = [casa.criar_leilao(f'Leilão {i}') for i in range(AUCTIONS_COUNT)]
+    print(f'{AUCTIONS_COUNT:,} leilões criados em {time.perf_counter() - start:.2f}s')
+
+    aceitos = 0
+    start = time.perf_counter()
+    for _ in range(BIDS_COUNT):
+        leilao = leiloes[random.randrange(AUCTIONS_COUNT)]
+        usuario = usuarios[random.randrange(USERS_COUNT)]
+        try:
+            casa.propor_lance(usuario, leilao, leilao.maior_lance + 1.0)
+            aceitos += 1
+        except LanceInvalido:
+            pass
+    seconds = time.perf_counter() - start
+    print(f'{BIDS_COUNT:,} lances ({aceitos:,} aceitos) em {seconds:.2f}s, '
+          f'{BIDS_COUNT / seconds:,.0f} lances por segundo')
+
+    start = time.perf_counter()
+    for _ in range(QUERIES_COUNT):
+        usuario = usuarios[random.randrange(USERS_COUNT)]
+        casa.disponivel(usuario)
+        casa.leiloes_liderados(usuario)
+    seconds = time.perf_counter() - start
+    print(f'  saldo disponível e leilões liderados: {seconds / QUERIES_COUNT * 1e6:.1f}us por usuário')
+
+    start = time.perf_counter()
+    for leilao in leiloes:
+        casa.encerrar(leilao)
+    seconds = time.perf_counter() - start
+    print(f'  encerrar: {seconds / AUCTIONS_COUNT * 1e6:.1f}us por leilão')
+
+    assert all(casa.reservado(usuario) == 0.0 for usuario in usuarios)
+
+
+if __name__ == '__main__':
+    main()
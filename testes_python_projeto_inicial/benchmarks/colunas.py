@@ -0,0 +1,71 @@
+import statistics
+import time
+import tracemalloc
+
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Lance, Leilao
+
+MEMORY_BIDS_COUNT = 1_000_000
+BIDS_COUNT = 10_000_000
+USERS_COUNT = 1_000
+
+
+# Como um lance era guardado antes das colunas
+class LanceAntigo:
+
+    def __init__(self, usuario, valor):
+        self.usuario = usuario
+        self.valor = valor
+
+
+def dar_lances(leilao, usuarios, bids_count):
+    for i in range(bids_count):
+        leilao.dar_lance(Lance(usuarios[i % len(usuarios)], float(i)))
+
+
+def guardar_lances_antigos(usuarios, bids_count):
+    return [LanceAntigo(usuarios[i % len(usuarios)], float(i)) for i in range(bids_count)]
+
+
+def medir_memoria(function):
+    tracemalloc.start()
+    result = function()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memory, result
+
+
+def main():
+    usuarios = [Usuario(f'Usuario {i}') for i in range(USERS_COUNT)]
+
+    print(f'Memória com {MEMORY_BIDS_COUNT:,} lances')
+    antigo, _ = medir_memoria(lambda: guardar_lances_antigos(usuarios, MEMORY_BIDS_COUNT))
+    print(f'  lista de lances: {antigo / MEMORY_BIDS_COUNT:.0f} bytes por lance')
+
+    def criar_leilao():
+        leilao = Leilao('Celular')
+        dar_lances(leilao, usuarios, MEMORY_BIDS_COUNT)
+        return leilao
+    colunas, _ = medir_memoria(criar_leilao)
+    print(f'  colunas: {colunas / MEMORY_BIDS_COUNT:.0f} bytes por lance')
+
+    print(f'Leilão com {BIDS_COUNT:,} lances')
+    leilao = Leilao('Celular')
+    start = time.perf_counter()
+    dar_lances(leilao, usuarios, BIDS_COUNT)
+    print(f'  dar_lance: {BIDS_COUNT / (time.perf_counter() - start):,.0f} lances por segundo')
+
+    start = time.perf_counter()
+    estatisticas = leilao.estatisticas
+    resumo = (estatisticas.quantidade, estatisticas.media, estatisticas.maximo, estatisticas.minimo,
+              estatisticas.participantes, estatisticas.quantil(0.5), estatisticas.quantil(0.99))
+    print(f'  estatisticas e quantis: {(time.perf_counter() - start) * 1e3:.2f}ms')
+
+    start = time.perf_counter()
+    lances = leilao.lances
+    media = statistics.fmean(lance.valor for lance in lances)
+    print(f'  média percorrendo os lances: {(time.perf_counter() - start) * 1e3:,.0f}ms')
+    assert media == resumo[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+from random import Random
+
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Leilao
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+WORKERS_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+ATTEMPTS_COUNT = 200_000
+AUCTIONS_COUNTS = (1, 64)
+# Cada worker reveza entre alguns usuários, senão sozinho ele só cobriria o
+# próprio lance e todos seriam recusados
+USERS_PER_WORKER = 4
+
+
+def propor_lances(usuarios, leiloes, tentativas, random):
+    aceitos = 0
+    for tentativa in range(tentativas):
+        usuario = usuarios[tentativa % USERS_PER_WORKER]
+        leilao = leiloes[random.randrange(len(leiloes))]
+        try:
+            usuario.propor_lance(leilao, leilao.maior_lance + 1)
+            aceitos += 1
+        except LanceInvalido:
+            pass
+    return aceitos
+
+
+def verificar(leiloes):
+    # Nenhum lance menor que o anterior e nenhum usuário com dois lances seguidos
+    for leilao in leiloes:
+        lances = leilao.lances
+        for anterior, lance in zip(lances, lances[1:]):
+            assert lance.valor >= anterior.valor
+            assert lance.usuario is not anterior.usuario
+
+
+def criar(workers_count, auctions_count):
+    usuarios = [
+        [Usuario(f'Usuario {i}.{j}', float('inf')) for j in range(USERS_PER_WORKER)]
+        for i in range(workers_count)
+    ]
+    leiloes = [Leilao(f'Leilão {i}') for i in range(auctions_count)]
+    return usuarios, leiloes
+
+
+def medir_threads(workers_count, auctions_count):
+    usuarios, leiloes = criar(workers_count, auctions_count)
+    tentativas = ATTEMPTS_COUNT // workers_count
+    aceitos = [0] * workers_count
+
+    def trabalhar(i):
+        aceitos[i] = propor_lances(usuarios[i], leiloes, tentativas, Random(i))
+
+    threads = [threading.Thread(target=trabalhar, args=(i,)) for i in range(workers_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    verificar(leiloes)
+    return sum(aceitos), seconds
+
+
+def medir_asyncio(workers_count, auctions_count):
+    usuarios, leiloes = criar(workers_count, auctions_count)
+    tentativas = ATTEMPTS_COUNT // workers_count
+
+    async def trabalhar(i):
+        random = Random(i)
+        aceitos = 0
+        for tentativa in range(tentativas):
+            usuario = usuarios[i][tentativa % USERS_PER_WORKER]
+            leilao = leiloes[random.randrange(len(leiloes))]
+            try:
+                usuario.propor_lance(leilao, leilao.maior_lance + 1)
+                aceitos += 1
+            except LanceInvalido:
+                pass
+            # Devolve o controle para que as tarefas disputem os mesmos leilões
+            await asyncio.sleep(0)
+        return aceitos
+
+    async def trabalhar_todos():
+        return await asyncio.gather(*(trabalhar(i) for i in range(workers_count)))
+
+    start = time.perf_counter()
+    aceitos = asyncio.run(trabalhar_todos())
+    seconds = time.perf_counter() - start
+
+    verificar(leiloes)
+    return sum(aceitos), seconds
+
+
+def main():
+    for label, medir in (('threads', medir_threads), ('asyncio', medir_asyncio)):
+        for auctions_count in AUCTIONS_COUNTS:
+            print(f'{label}, {ATTEMPTS_COUNT:,} tentativas em {auctions_count} leilões')
+            for workers_count in WORKERS_COUNTS:
+                aceitos, seconds = medir(workers_count, auctions_count)
+                print(f'  {workers_count:>2} {label}: {ATTEMPTS_COUNT / seconds:,.0f} tentativas e '
+                      f'{aceitos / seconds:,.0f} lances aceitos por segundo ({aceitos / ATTEMPTS_COUNT:.0%} aceitos)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+import csv
+import json
+import os
+import tempfile
+from random import Random
+
+from testes_python_projeto_inicial.src.leilao.reproducao import imprimir_relatorio, ler_log, reproduzir
+
+BIDS_COUNT = 2_000_000
+AUCTIONS_COUNT = 10_000
+USERS_COUNT = 5_000
+
+
+def gerar_lances(random):
+    # Uns poucos lances ficam abaixo do maior lance ou repetem o usuário, para
+    # que as recusas também sejam medidas
+    maiores_lances = [0.0] * AUCTIONS_COUNT
+    for _ in range(BIDS_COUNT):
+        leilao = random.randrange(AUCTIONS_COUNT)
+        valor = maiores_lances[leilao] + random.uniform(-1.0, 10.0)
+        maiores_lances[leilao] = max(maiores_lances[leilao], valor)
+        yield f'Leilão {leilao}', f'Usuario {random.randrange(USERS_COUNT)}', f'{valor:.2f}'
+
+
+def escrever_csv(caminho):
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(('leilao', 'usuario', 'valor'))
+        escritor.writerows(gerar_lances(Random(0)))
+
+
+def escrever_jsonl(caminho):
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for leilao, usuario, valor in gerar_lances(Random(0)):
+            arquivo.write(json.dumps({'leilao': leilao, 'usuario': usuario, 'valor': float(valor)}) + '\n')
+
+
+def main():
+    with tempfile.TemporaryDirectory() as pasta:
+        for nome, escrever in (('lances.csv', escrever_csv), ('lances.jsonl', escrever_jsonl)):
+            caminho = os.path.join(pasta, nome)
+            escrever(caminho)
+            print(f'{nome} ({os.path.getsize(caminho) / 2 ** 20:,.0f}MB)')
+            imprimir_relatorio(reproduzir(ler_log(caminho)))
+            print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import threading
+from types import MappingProxyType
+
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Lance, Leilao
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+_NENHUM_LEILAO = MappingProxyType({}).keys()
+
+
+class _IndicesDoUsuario:
+    __slots__ = ('lances_ativos', 'leiloes_liderados', 'trava')
+
+    def __init__(self):
+        # Dicionários só com as chaves, para que as consultas devolvam as
+        # visões keys() sem copiar nada
+        self.lances_ativos = {}
+        self.leiloes_liderados = {}
+        # Nenhuma outra trava é pega enquanto esta estiver com alguém
+        self.trava = threading.Lock()
+
+
+class CasaDeLeiloes:
+    # Cuida de vários leilões ao mesmo tempo. O lance não sai da carteira na
+    # hora: o valor fica reservado no usuário enquanto ele estiver ganhando o
+    # leilão e volta a ficar disponível assim que alguém cobre o lance. Só quem
+    # vence paga, quando o leilão é encerrado.
+    # Não existe uma trava da casa: cada lance pega a trava do usuário e depois
+    # a do leilão, como em Usuario.propor_lance, e os leilões da casa só
+    # aceitam lances que passam por ela
+
+    def __init__(self):
+        # {leilão: {usuário que deu algum lance: None}}
+        self.__leiloes = {}
+        # {usuário: leilões em que deu algum lance e leilões que está ganhando}
+        self.__indices = {}
+
+    def __len__(self):
+        return len(self.__leiloes)
+
+    def __contains__(self, leilao: Leilao):
+        return leilao in self.__leiloes
+
+    def criar_leilao(self, descricao):
+        leilao = Leilao(descricao, dono=self)
+        self.__leiloes[leilao] = {}
+        return leilao
+
+    def propor_lance(self, usuario: Usuario, leilao: Leilao, valor):
+        if leilao not in self.__leiloes:
+            raise LanceInvalido('Esse leilão não faz parte da casa ou já foi encerrado')
+
+        lance = Lance(usuario, valor)
+        lance_coberto = usuario.reservar_lance(leilao, lance, self)
+        # Fora das travas do usuário e do leilão, senão dois usuários cobrindo
+        # um ao outro poderiam se travar
+        if lance_coberto is not None:
+            lance_coberto.usuario.liberar(lance_coberto.valor)
+        return lance
+
+    def lance_aceito(self, leilao: Leilao, lance: Lance, lance_coberto: Lance):
+        # Chamado pelo leilão dentro da sua trava, então os índices de um
+        # leilão mudam na mesma ordem dos lances
+        self.__leiloes[leilao][lance.usuario] = None
+
+        indices = self.__buscar_indices(lance.usuario)
+        with indices.trava:
+            indices.lances_ativos[leilao] = None
+            indices.leiloes_liderados[leilao] = None
+
+        if lance_coberto is not None:
+            indices = self.__indices[lance_coberto.usuario]
+            with indices.trava:
+                indices.leiloes_liderados.pop(leilao, None)
+
+    def encerrar(self, leilao: Leilao):
+        # O vencedor paga o que estava reservado, os outros participantes
+        # deixam de ter lances ativos nesse leilão. Depois de leilao.encerrar
+        # nenhum lance entra, então os participantes não mudam mais
+        if leilao not in self.__leiloes:
+            raise LanceInvalido('Esse leilão não faz parte da casa ou já foi encerrado')
+        lance_vencedor = leilao.encerrar(self)
+        participantes = self.__leiloes.pop(leilao)
+
+        if lance_vencedor is not None:
+            lance_vencedor.usuario.pagar_reserva(lance_vencedor.valor)
+
+        for usuario in participantes:
+            indices = self.__indices[usuario]
+            with indices.trava:
+                indices.lances_ativos.pop(leilao, None)
+                indices.leiloes_liderados.pop(leilao, None)
+
+        return lance_vencedor
+
+    def __buscar_indices(self, usuario: Usuario):
+        indices = self.__indices.get(usuario)
+        if indices is None:
+            indices = self.__indices.setdefault(usuario, _IndicesDoUsuario())
+        return indices
+
+    def lance_vencedor(self, leilao: Leilao):
+        return leilao.ultimo_lance
+
+    def reservado(self, usuario: Usuario):
+        return usuario.reservado
+
+    def disponivel(self, usuario: Usuario):
+        return usuario.disponivel
+
+    # As consultas devolvem visões somente leitura que acompanham os lances,
+    # sem copiar. Para percorrer enquanto outras threads dão lances, copie antes
+    def lances_ativos(self, usuario: Usuario):
+        indices = self.__indices.get(usuario)
+        return indices.lances_ativos.keys() if indices is not None else _NENHUM_LEILAO
+
+    def leiloes_liderados(self, usuario: Usuario):
+        indices = self.__indices.get(usuario)
+        return indices.leiloes_liderados.keys() if indices is not None else _NENHUM_LEILAO
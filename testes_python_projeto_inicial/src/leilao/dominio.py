@@ -1,3 +1,10 @@
+import math
+import threading
+import time
+from array import array
+from collections.abc import Sequence
+
+from testes_python_projeto_inicial.src.leilao.estatisticas import EstatisticasDeLances
 from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
 
 
@@ -6,6 +13,11 @@ class Usuario:
     def __init__(self, nome, dinheiro=0):
         self.__nome = nome
         self.__carteira = dinheiro
+        # Valor dos lances que estão ganhando em uma casa de leilões, ainda na
+        # carteira mas fora do que pode ser gasto
+        self.__reservado = 0.0
+        self.__reservas = 0
+        self.__trava = threading.Lock()
 
     @property
     def nome(self):
@@ -15,44 +27,233 @@ class Usuario:
     def carteira(self):
         return self.__carteira
 
+    @property
+    def reservado(self):
+        return self.__reservado
+
+    @property
+    def disponivel(self):
+        return self.__carteira - self.__reservado
+
     def propor_lance(self, leilao: 'Leilao', valor):
-        if valor > self.__carteira:
-            raise LanceInvalido('Não pode propor um lance com um valor maior que o valor da carteira')
+        # A trava do usuário é sempre pega antes da trava do leilão, então dois
+        # lances do mesmo usuário não gastam o mesmo dinheiro e ninguém se trava
+        with self.__trava:
+            if valor > self.disponivel:
+                raise LanceInvalido('Não pode propor um lance com um valor maior que o valor da carteira')
+
+            lance = Lance(self, valor)
+            leilao.dar_lance(lance)
+            self.__carteira -= valor
+
+    def reservar_lance(self, leilao: 'Leilao', lance: 'Lance', dono):
+        # Lance pelo dono do leilão: o valor fica reservado em vez de sair da
+        # carteira. Retorna o lance que foi coberto, com a reserva que o dono
+        # precisa liberar fora das travas
+        with self.__trava:
+            if lance.valor > self.disponivel:
+                raise LanceInvalido('Não pode propor um lance com um valor maior que o valor disponível na carteira')
+
+            lance_coberto = leilao.dar_lance(lance, dono)
+            self.__reservado += lance.valor
+            self.__reservas += 1
+            return lance_coberto
+
+    def liberar(self, valor):
+        with self.__trava:
+            self.__liberar(valor)
+
+    def pagar_reserva(self, valor):
+        # O valor já estava separado, então o pagamento nunca falta
+        with self.__trava:
+            self.__liberar(valor)
+            self.__carteira -= valor
+
+    def __liberar(self, valor):
+        self.__reservas -= 1
+        # Sem nenhuma reserva não sobra reservado, mesmo que as somas com
+        # float deixem um resto
+        if self.__reservas == 0:
+            self.__reservado = 0.0
+        else:
+            self.__reservado -= valor
+
+    def pagar(self, valor):
+        with self.__trava:
+            if valor > self.disponivel:
+                raise LanceInvalido('Não pode pagar um valor maior que o valor disponível na carteira')
 
-        lance = Lance(self, valor)
-        leilao.dar_lance(lance)
-        self.__carteira -= valor
+            self.__carteira -= valor
 
 
 class Lance:
+    __slots__ = ('usuario', 'valor', 'instante')
 
-    def __init__(self, usuario, valor):
+    def __init__(self, usuario, valor, instante=None):
         self.usuario = usuario
         self.valor = valor
+        self.instante = instante
+
+    # Os lances lidos do leilão são criados a cada leitura, então a comparação
+    # é pelo valor. O instante só conta quando os dois lances têm um, o lance
+    # de quem propôs ainda não tem o instante que o leilão guardou
+    def __eq__(self, outro):
+        if not isinstance(outro, Lance):
+            return NotImplemented
+
+        if self.usuario is not outro.usuario or self.valor != outro.valor:
+            return False
+        return self.instante is None or outro.instante is None or self.instante == outro.instante
+
+    def __hash__(self):
+        return hash((id(self.usuario), self.valor))
+
+    def __repr__(self):
+        return f'Lance({self.usuario.nome!r}, {self.valor!r})'
+
+
+class _ColunasDeLances:
+    # Cada lance ocupa uma posição em cada coluna (valor, id do usuário e
+    # instante em nanossegundos) e o Lance só é criado quando for lido.
+    # O instante é a última coluna preenchida, então o tamanho nunca conta um
+    # lance que ainda não foi escrito por inteiro
+
+    def __init__(self):
+        self.usuarios = []
+        self.__ids_por_usuario = {}
+        self.ids_dos_usuarios = array('i')
+        self.valores = array('d')
+        self.instantes = array('q')
+
+    def __len__(self):
+        return len(self.instantes)
+
+    def __getitem__(self, posicao):
+        return Lance(self.usuarios[self.ids_dos_usuarios[posicao]], self.valores[posicao], self.instantes[posicao])
+
+    def buscar_id(self, usuario):
+        return self.__ids_por_usuario.get(usuario)
+
+    def adicionar(self, lance: Lance):
+        usuario_id = self.__ids_por_usuario.get(lance.usuario)
+        if usuario_id is None:
+            usuario_id = len(self.usuarios)
+            self.usuarios.append(lance.usuario)
+            self.__ids_por_usuario[lance.usuario] = usuario_id
+
+        self.ids_dos_usuarios.append(usuario_id)
+        self.valores.append(lance.valor)
+        self.instantes.append(lance.instante if lance.instante is not None else time.time_ns())
+        return usuario_id
+
+
+class HistoricoDeLances(Sequence):
+    # Visão somente leitura dos lances até o momento em que foi criada, sem
+    # copiar a lista: os lances só são adicionados no final, então as posições
+    # que a visão enxerga nunca mudam
+
+    def __init__(self, lances, posicoes: range):
+        self.__lances = lances
+        self.__posicoes = posicoes
+
+    def __len__(self):
+        return len(self.__posicoes)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return HistoricoDeLances(self.__lances, self.__posicoes[item])
+
+        return self.__lances[self.__posicoes[item]]
+
+    def __iter__(self):
+        lances = self.__lances
+        for posicao in self.__posicoes:
+            yield lances[posicao]
+
+    # Compara como a lista que Leilao.lances retornava, com qualquer sequência
+    def __eq__(self, outro):
+        if not isinstance(outro, Sequence) or isinstance(outro, (str, bytes)):
+            return NotImplemented
+
+        return len(self) == len(outro) and all(lance == outro_lance for lance, outro_lance in zip(self, outro))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'HistoricoDeLances({len(self)} lances)'
 
 
 class Leilao:
 
-    def __init__(self, descricao):
+    def __init__(self, descricao, dono=None):
         self.descricao = descricao
-        self.__lances = []
+        self.__lances = _ColunasDeLances()
+        self.__estatisticas = EstatisticasDeLances()
         self.maior_lance = 0.0
         self.menor_lance = 0.0
+        # Um leilão com dono, como a casa de leilões, só aceita os lances que
+        # passam por ele. O dono é avisado de cada lance aceito ainda dentro
+        # da trava, então o que ele guarda segue a ordem dos lances
+        self.__dono = dono
+        self.__encerrado = False
+        self.__trava = threading.Lock()
 
     @property
     def lances(self):
-        return self.__lances[:]
+        return HistoricoDeLances(self.__lances, range(len(self.__lances)))
 
-    def dar_lance(self, lance: Lance):
-        self._validar_lance(lance)
+    @property
+    def estatisticas(self):
+        return self.__estatisticas
 
-        if not self._tem_lances():
-            self.menor_lance = lance.valor
-        self.maior_lance = lance.valor
+    @property
+    def encerrado(self):
+        return self.__encerrado
+
+    @property
+    def ultimo_lance(self):
+        # O último lance aceito é sempre o que está ganhando
+        lances = self.__lances
+        return lances[len(lances) - 1] if len(lances) > 0 else None
+
+    def dar_lance(self, lance: Lance, dono=None):
+        # Validar e adicionar acontecem juntos, senão dois lances concorrentes
+        # poderiam ser validados contra o mesmo maior lance. Para o dono,
+        # retorna o lance que foi coberto
+        with self.__trava:
+            self._validar_dono(dono)
+            self._validar_lance(lance)
 
-        self.__lances.append(lance)
+            lance_coberto = self.ultimo_lance if dono is not None else None
+            if not self._tem_lances():
+                self.menor_lance = lance.valor
+            self.maior_lance = lance.valor
+
+            usuario_id = self.__lances.adicionar(lance)
+            self.__estatisticas.adicionar(lance.valor, usuario_id)
+
+            if dono is not None:
+                dono.lance_aceito(self, lance, lance_coberto)
+            return lance_coberto
+
+    def encerrar(self, dono=None):
+        # Depois de encerrado nenhum lance entra, retorna o lance vencedor
+        with self.__trava:
+            self._validar_dono(dono)
+            self.__encerrado = True
+            return self.ultimo_lance
+
+    def _validar_dono(self, dono):
+        if dono is not self.__dono:
+            raise LanceInvalido('Os lances desse leilão precisam passar pela casa de leilões')
+
+        if self.__encerrado:
+            raise LanceInvalido('Esse leilão já foi encerrado')
 
     def _validar_lance(self, lance: Lance):
+        if not math.isfinite(lance.valor):
+            raise LanceInvalido('O valor do lance precisa ser um número finito')
+
         if self._tem_dinheiro(lance.valor):
             raise LanceInvalido('Você só pode dar lances maiores do que já foram dados')
 
@@ -60,7 +261,7 @@ class Leilao:
             raise LanceInvalido('O mesmo usuário não pode propror dois lances seguidos')
 
     def _tem_lances(self):
-        return self.__lances
+        return len(self.__lances) > 0
 
     def _tem_dinheiro(self, valor):
         return self.maior_lance > valor
@@ -69,4 +270,4 @@ class Leilao:
         if not self._tem_lances():
             return False
 
-        return usuario == self.__lances[-1].usuario
+        return self.__lances.buscar_id(usuario) == self.__lances.ids_dos_usuarios[-1]
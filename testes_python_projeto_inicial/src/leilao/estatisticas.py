@@ -0,0 +1,87 @@
+import math
+
+
+class EsbocoDeQuantis:
+    # Conta os valores em faixas que crescem em progressão geométrica, então
+    # qualquer quantil sai com erro relativo de no máximo erro_relativo e a
+    # memória só depende da razão entre o maior e o menor valor, não de
+    # quantos valores foram adicionados
+
+    def __init__(self, erro_relativo=0.01):
+        if not 0 < erro_relativo < 1:
+            raise ValueError('O erro relativo precisa estar entre 0 e 1')
+
+        self.erro_relativo = erro_relativo
+        self.__gama = (1 + erro_relativo) / (1 - erro_relativo)
+        self.__log_gama = math.log(self.__gama)
+        self.__faixas = {}
+        self.__zeros = 0
+        self.quantidade = 0
+
+    def adicionar(self, valor):
+        # Infinito e NaN não cabem em nenhuma faixa, ficam de fora da contagem
+        # para não deslocar os quantis
+        if not math.isfinite(valor):
+            return
+
+        self.quantidade += 1
+        if valor <= 0:
+            self.__zeros += 1
+            return
+
+        faixa = math.ceil(math.log(valor) / self.__log_gama)
+        self.__faixas[faixa] = self.__faixas.get(faixa, 0) + 1
+
+    def quantil(self, q):
+        if not 0 <= q <= 1:
+            raise ValueError('O quantil precisa estar entre 0 e 1')
+        if self.quantidade == 0:
+            return None
+
+        posicao = q * (self.quantidade - 1)
+        acumulado = self.__zeros
+        if posicao < acumulado:
+            return 0.0
+
+        for faixa in sorted(self.__faixas):
+            acumulado += self.__faixas[faixa]
+            if posicao < acumulado:
+                # Meio da faixa, fica a no máximo erro_relativo de qualquer valor dela
+                return 2 * self.__gama ** faixa / (self.__gama + 1)
+
+    def __len__(self):
+        return len(self.__faixas)
+
+
+class EstatisticasDeLances:
+    # Atualizadas a cada lance aceito, nenhuma consulta precisa percorrer os lances
+
+    def __init__(self, erro_relativo=0.01):
+        self.quantidade = 0
+        self.soma = 0.0
+        self.maximo = None
+        self.minimo = None
+        self.participantes = 0
+        self.__esboco = EsbocoDeQuantis(erro_relativo)
+
+    @property
+    def media(self):
+        if self.quantidade == 0:
+            return None
+        return self.soma / self.quantidade
+
+    def adicionar(self, valor, usuario_id):
+        # Os ids dos usuários são dados em ordem a partir de 0 no primeiro lance
+        # de cada um, então o maior id conta quantos participantes existem
+        self.quantidade += 1
+        self.soma += valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if usuario_id >= self.participantes:
+            self.participantes = usuario_id + 1
+        self.__esboco.adicionar(valor)
+
+    def quantil(self, q):
+        return self.__esboco.quantil(q)
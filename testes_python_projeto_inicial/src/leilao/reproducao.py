@@ -0,0 +1,189 @@
+import csv
+import json
+import math
+import sys
+import time
+from collections import Counter
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Leilao
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+# Os logs têm um lance por linha com as colunas leilao, usuario e valor, em CSV
+# com cabeçalho ou em JSONL. Os lotes são lidos só quando os anteriores já
+# foram aplicados, então a leitura nunca passa na frente dos lances e o log
+# pode ser maior que a memória
+TAMANHO_DO_LOTE = 10_000
+MAXIMO_DE_RECUSAS = 1_000
+
+
+class RegistroDeLance:
+    __slots__ = ('linha', 'leilao', 'usuario', 'valor')
+
+    def __init__(self, linha, leilao, usuario, valor):
+        self.linha = linha
+        self.leilao = leilao
+        self.usuario = usuario
+        self.valor = valor
+
+
+class LanceRecusado:
+    __slots__ = ('linha', 'leilao', 'usuario', 'valor', 'motivo')
+
+    def __init__(self, registro: RegistroDeLance, motivo):
+        self.linha = registro.linha
+        self.leilao = registro.leilao
+        self.usuario = registro.usuario
+        self.valor = registro.valor
+        self.motivo = motivo
+
+
+class RelatorioDeReproducao:
+
+    def __init__(self):
+        self.aceitos = 0
+        self.recusados = 0
+        # Só os primeiros recusados são guardados, os motivos são todos contados
+        self.recusas = []
+        self.motivos = Counter()
+        self.segundos = 0.0
+        self.pico_de_memoria = None
+
+    @property
+    def lances(self):
+        return self.aceitos + self.recusados
+
+    @property
+    def lances_por_segundo(self):
+        if self.segundos == 0:
+            return 0.0
+        return self.lances / self.segundos
+
+
+def _ler_lotes(linhas, converter, tamanho_do_lote):
+    lote = []
+    for numero, linha in linhas:
+        lote.append(converter(numero, linha))
+        if len(lote) >= tamanho_do_lote:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _converter_csv(numero, linha):
+    return RegistroDeLance(numero, linha.get('leilao'), linha.get('usuario'), linha.get('valor'))
+
+
+def _converter_jsonl(numero, linha):
+    try:
+        dados = json.loads(linha)
+    except ValueError:
+        return RegistroDeLance(numero, None, None, None)
+    # Um JSON válido que não é um objeto, como [1, 2] ou 5, também não é um lance
+    if not isinstance(dados, dict):
+        return RegistroDeLance(numero, None, None, None)
+    return RegistroDeLance(numero, dados.get('leilao'), dados.get('usuario'), dados.get('valor'))
+
+
+def ler_csv(caminho, tamanho_do_lote=TAMANHO_DO_LOTE):
+    with open(caminho, 'r', encoding='utf-8', newline='') as arquivo:
+        # A linha 1 é o cabeçalho
+        linhas = enumerate(csv.DictReader(arquivo), 2)
+        yield from _ler_lotes(linhas, _converter_csv, tamanho_do_lote)
+
+
+def ler_jsonl(caminho, tamanho_do_lote=TAMANHO_DO_LOTE):
+    with open(caminho, 'r', encoding='utf-8') as arquivo:
+        linhas = ((numero, linha) for numero, linha in enumerate(arquivo, 1) if linha.strip())
+        yield from _ler_lotes(linhas, _converter_jsonl, tamanho_do_lote)
+
+
+def ler_log(caminho, tamanho_do_lote=TAMANHO_DO_LOTE):
+    if caminho.endswith('.jsonl'):
+        return ler_jsonl(caminho, tamanho_do_lote)
+    return ler_csv(caminho, tamanho_do_lote)
+
+
+def _ler_pico_de_memoria():
+    if resource is None:
+        return None
+
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # O macOS informa em bytes, os outros sistemas em kilobytes
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def reproduzir(lotes, dinheiro_inicial=float('inf'), maximo_de_recusas=MAXIMO_DE_RECUSAS):
+    # Cada usuário e cada leilão é criado no primeiro lance em que aparece e o
+    # lance passa pelo mesmo caminho de um lance de verdade, Usuario.propor_lance
+    relatorio = RelatorioDeReproducao()
+    usuarios = {}
+    leiloes = {}
+
+    def recusar(registro, motivo):
+        relatorio.recusados += 1
+        relatorio.motivos[motivo] += 1
+        if len(relatorio.recusas) < maximo_de_recusas:
+            relatorio.recusas.append(LanceRecusado(registro, motivo))
+
+    inicio = time.perf_counter()
+    for lote in lotes:
+        for registro in lote:
+            try:
+                valor = float(registro.valor)
+            except (TypeError, ValueError):
+                valor = math.nan
+            # float também aceita 'nan' e 'inf', que nunca são um lance
+            if not math.isfinite(valor):
+                recusar(registro, 'Linha sem um valor válido')
+                continue
+            if not registro.leilao or not registro.usuario:
+                recusar(registro, 'Linha sem leilão ou sem usuário')
+                continue
+
+            usuario = usuarios.get(registro.usuario)
+            if usuario is None:
+                usuario = usuarios[registro.usuario] = Usuario(registro.usuario, dinheiro_inicial)
+            leilao = leiloes.get(registro.leilao)
+            if leilao is None:
+                leilao = leiloes[registro.leilao] = Leilao(registro.leilao)
+
+            try:
+                usuario.propor_lance(leilao, valor)
+                relatorio.aceitos += 1
+            except LanceInvalido as erro:
+                recusar(registro, str(erro))
+
+    relatorio.segundos = time.perf_counter() - inicio
+    relatorio.pico_de_memoria = _ler_pico_de_memoria()
+    return relatorio
+
+
+def imprimir_relatorio(relatorio: RelatorioDeReproducao):
+    print(f'{relatorio.lances:,} lances em {relatorio.segundos:.2f}s, '
+          f'{relatorio.lances_por_segundo:,.0f} lances por segundo')
+    print(f'  aceitos: {relatorio.aceitos:,}')
+    print(f'  recusados: {relatorio.recusados:,}')
+    for motivo, quantidade in relatorio.motivos.most_common():
+        print(f'    {quantidade:,} - {motivo}')
+    if relatorio.pico_de_memoria is not None:
+        print(f'  pico de memória: {relatorio.pico_de_memoria / 2 ** 20:,.0f}MB')
+
+
+def main(argumentos):
+    if not argumentos:
+        print('Uso: python -m testes_python_projeto_inicial.src.leilao.reproducao <log.csv|log.jsonl> [dinheiro]')
+        return 1
+
+    dinheiro_inicial = float(argumentos[1]) if len(argumentos) > 1 else float('inf')
+    imprimir_relatorio(reproduzir(ler_log(argumentos[0]), dinheiro_inicial))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
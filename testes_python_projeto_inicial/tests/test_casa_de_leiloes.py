@@ -0,0 +1,129 @@
+from testes_python_projeto_inicial.src.leilao.casa_de_leiloes import CasaDeLeiloes
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Leilao
+
+import pytest
+
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+
+@pytest.fixture()
+def casa():
+    return CasaDeLeiloes()
+
+
+@pytest.fixture()
+def vini():
+    return Usuario('Vini', 100.0)
+
+
+@pytest.fixture()
+def gui():
+    return Usuario('Gui', 500.0)
+
+
+def test_deve_reservar_o_valor_do_lance_sem_tirar_da_carteira(casa, vini):
+    celular = casa.criar_leilao('Celular')
+
+    casa.propor_lance(vini, celular, 60.0)
+
+    assert vini.carteira == 100.0
+    assert casa.reservado(vini) == 60.0
+    assert casa.disponivel(vini) == 40.0
+    assert casa.leiloes_liderados(vini) == {celular}
+
+
+def test_nao_deve_permitir_lance_maior_que_o_valor_disponivel(casa, vini):
+    celular = casa.criar_leilao('Celular')
+    notebook = casa.criar_leilao('Notebook')
+    casa.propor_lance(vini, celular, 60.0)
+
+    with pytest.raises(LanceInvalido):
+        casa.propor_lance(vini, notebook, 50.0)
+
+    assert casa.reservado(vini) == 60.0
+    assert len(notebook.lances) == 0
+
+
+def test_deve_liberar_a_reserva_quando_o_lance_for_coberto(casa, vini, gui):
+    celular = casa.criar_leilao('Celular')
+    casa.propor_lance(vini, celular, 60.0)
+
+    casa.propor_lance(gui, celular, 80.0)
+
+    assert casa.reservado(vini) == 0.0
+    assert casa.leiloes_liderados(vini) == set()
+    assert casa.lances_ativos(vini) == {celular}
+    assert casa.leiloes_liderados(gui) == {celular}
+    assert casa.lance_vencedor(celular).usuario is gui
+
+
+def test_deve_cobrar_apenas_o_vencedor_quando_o_leilao_for_encerrado(casa, vini, gui):
+    celular = casa.criar_leilao('Celular')
+    casa.propor_lance(vini, celular, 60.0)
+    casa.propor_lance(gui, celular, 80.0)
+
+    lance_vencedor = casa.encerrar(celular)
+
+    assert lance_vencedor.valor == 80.0
+    assert gui.carteira == 420.0
+    assert vini.carteira == 100.0
+    assert casa.reservado(gui) == 0.0
+    assert casa.lances_ativos(vini) == set()
+    assert celular not in casa
+
+
+def test_nao_deve_permitir_lances_em_leilao_encerrado(casa, vini):
+    celular = casa.criar_leilao('Celular')
+    casa.encerrar(celular)
+
+    with pytest.raises(LanceInvalido):
+        casa.propor_lance(vini, celular, 10.0)
+
+
+def test_nao_deve_gastar_fora_da_casa_o_valor_reservado(casa, vini):
+    celular = casa.criar_leilao('Celular')
+    notebook = Leilao('Notebook')
+    casa.propor_lance(vini, celular, 90.0)
+
+    with pytest.raises(LanceInvalido):
+        vini.propor_lance(notebook, 90.0)
+    with pytest.raises(LanceInvalido):
+        vini.pagar(20.0)
+
+    assert vini.carteira == 100.0
+    assert casa.disponivel(vini) == 10.0
+    assert len(notebook.lances) == 0
+
+
+def test_nao_deve_aceitar_lances_diretos_em_leilao_da_casa(casa, vini, gui):
+    celular = casa.criar_leilao('Celular')
+    casa.propor_lance(vini, celular, 60.0)
+
+    with pytest.raises(LanceInvalido):
+        gui.propor_lance(celular, 80.0)
+
+    assert celular.maior_lance == 60.0
+    assert gui.carteira == 500.0
+
+    lance_vencedor = casa.encerrar(celular)
+
+    assert lance_vencedor.usuario is vini
+    assert vini.carteira == 40.0
+    assert casa.reservado(vini) == 0.0
+
+
+def test_deve_devolver_visoes_que_acompanham_os_lances(casa, vini, gui):
+    celular = casa.criar_leilao('Celular')
+    casa.propor_lance(vini, celular, 60.0)
+    leiloes_liderados = casa.leiloes_liderados(vini)
+    lances_ativos = casa.lances_ativos(vini)
+
+    casa.propor_lance(gui, celular, 80.0)
+
+    assert leiloes_liderados == set()
+    assert lances_ativos == {celular}
+    assert not hasattr(lances_ativos, 'add')
+
+    casa.encerrar(celular)
+
+    assert lances_ativos == set()
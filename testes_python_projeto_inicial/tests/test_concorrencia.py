@@ -0,0 +1,104 @@
+import sys
+import threading
+
+from testes_python_projeto_inicial.src.leilao.casa_de_leiloes import CasaDeLeiloes
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Leilao
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def troca_de_threads_frequente():
+    # Troca de thread a cada poucas instruções para forçar as disputas
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(intervalo)
+
+
+def disputar(quantidade_de_threads, alvo):
+    barreira = threading.Barrier(quantidade_de_threads)
+
+    def trabalhar(i):
+        barreira.wait()
+        alvo(i)
+
+    threads = [threading.Thread(target=trabalhar, args=(i,)) for i in range(quantidade_de_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_deve_manter_as_regras_dos_lances_com_varios_usuarios_concorrendo():
+    leilao = Leilao('Celular')
+    usuarios = [Usuario(f'Usuario {i}', 1_000_000.0) for i in range(8)]
+    gastos = [0.0] * len(usuarios)
+
+    def propor_lances(i):
+        for _ in range(500):
+            valor = leilao.maior_lance + 1
+            try:
+                usuarios[i].propor_lance(leilao, valor)
+                gastos[i] += valor
+            except LanceInvalido:
+                pass
+
+    disputar(len(usuarios), propor_lances)
+
+    lances = leilao.lances
+    for anterior, lance in zip(lances, lances[1:]):
+        assert lance.valor >= anterior.valor
+        assert lance.usuario is not anterior.usuario
+    assert leilao.maior_lance == lances[-1].valor
+    for usuario, gasto in zip(usuarios, gastos):
+        assert usuario.carteira == 1_000_000.0 - gasto
+
+
+def test_nao_deve_gastar_o_mesmo_dinheiro_em_dois_lances_concorrentes():
+    vini = Usuario('Vini', 100.0)
+    leiloes = [Leilao(f'Leilão {i}') for i in range(8)]
+    aceitos = []
+
+    def propor_lance(i):
+        try:
+            vini.propor_lance(leiloes[i], 60.0)
+            aceitos.append(i)
+        except LanceInvalido:
+            pass
+
+    disputar(len(leiloes), propor_lance)
+
+    assert len(aceitos) == 1
+    assert vini.carteira == 40.0
+
+
+def test_deve_manter_as_reservas_da_casa_com_varios_usuarios_concorrendo():
+    casa = CasaDeLeiloes()
+    leiloes = [casa.criar_leilao(f'Leilão {i}') for i in range(4)]
+    usuarios = [Usuario(f'Usuario {i}', 1_000.0) for i in range(8)]
+
+    def propor_lances(i):
+        for j in range(300):
+            leilao = leiloes[(i + j) % len(leiloes)]
+            try:
+                casa.propor_lance(usuarios[i], leilao, leilao.maior_lance + 1)
+            except LanceInvalido:
+                pass
+            assert usuarios[i].disponivel >= 0
+
+    disputar(len(usuarios), propor_lances)
+
+    for usuario in usuarios:
+        liderados = casa.leiloes_liderados(usuario)
+        assert {leilao for leilao in leiloes if leilao.ultimo_lance.usuario is usuario} == liderados
+        assert usuario.reservado == sum(leilao.maior_lance for leilao in liderados)
+
+    vencedores = [casa.encerrar(leilao) for leilao in leiloes]
+
+    for usuario in usuarios:
+        gasto = sum(lance.valor for lance in vencedores if lance.usuario is usuario)
+        assert usuario.carteira == 1_000.0 - gasto
+        assert usuario.reservado == 0.0
+        assert casa.lances_ativos(usuario) == set()
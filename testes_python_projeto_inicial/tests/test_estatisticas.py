@@ -0,0 +1,104 @@
+from random import Random
+
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Lance, Leilao
+from testes_python_projeto_inicial.src.leilao.estatisticas import EsbocoDeQuantis
+from testes_python_projeto_inicial.src.leilao.excecoes import LanceInvalido
+
+import pytest
+
+
+@pytest.fixture()
+def leilao():
+    leilao = Leilao('Celular')
+    gui = Usuario('Gui')
+    yuri = Usuario('Yuri')
+    vini = Usuario('Vini')
+
+    leilao.dar_lance(Lance(yuri, 100.0))
+    leilao.dar_lance(Lance(gui, 150.0))
+    leilao.dar_lance(Lance(yuri, 200.0))
+    leilao.dar_lance(Lance(vini, 250.0))
+
+    return leilao
+
+
+def test_deve_atualizar_as_estatisticas_a_cada_lance(leilao):
+    estatisticas = leilao.estatisticas
+
+    assert estatisticas.quantidade == 4
+    assert estatisticas.soma == 700.0
+    assert estatisticas.media == 175.0
+    assert estatisticas.maximo == 250.0
+    assert estatisticas.minimo == 100.0
+    assert estatisticas.participantes == 3
+
+
+def test_nao_deve_contar_lances_recusados_nas_estatisticas(leilao):
+    with pytest.raises(LanceInvalido):
+        leilao.dar_lance(Lance(Usuario('Gui'), 10.0))
+
+    assert leilao.estatisticas.quantidade == 4
+    assert leilao.estatisticas.participantes == 3
+
+
+def test_deve_criar_os_lances_a_partir_das_colunas(leilao):
+    lances = leilao.lances
+
+    assert [lance.usuario.nome for lance in lances] == ['Yuri', 'Gui', 'Yuri', 'Vini']
+    assert lances[0].usuario is lances[2].usuario
+    assert lances[0].instante <= lances[-1].instante
+
+
+def test_deve_retornar_nenhuma_media_quando_o_leilao_nao_tiver_lances():
+    estatisticas = Leilao('Celular').estatisticas
+
+    assert estatisticas.media is None
+    assert estatisticas.quantil(0.5) is None
+
+
+def test_deve_estimar_os_quantis_dentro_do_erro_relativo():
+    random = Random(0)
+    valores = sorted(random.uniform(1.0, 10_000.0) for _ in range(10_000))
+    esboco = EsbocoDeQuantis(erro_relativo=0.01)
+    for valor in valores:
+        esboco.adicionar(valor)
+
+    for q in (0.0, 0.1, 0.5, 0.9, 0.99, 1.0):
+        esperado = valores[int(q * (len(valores) - 1))]
+        assert esboco.quantil(q) == pytest.approx(esperado, rel=0.01)
+
+
+@pytest.mark.parametrize('valor', [float('inf'), float('nan')])
+def test_nao_deve_aceitar_lances_que_nao_sao_finitos(leilao, valor):
+    usuario = Usuario('Ana', float('inf'))
+
+    with pytest.raises(LanceInvalido):
+        usuario.propor_lance(leilao, valor)
+
+    assert usuario.carteira == float('inf')
+    assert leilao.maior_lance == 250.0
+    assert len(leilao.lances) == 4
+    assert leilao.estatisticas.quantidade == 4
+    assert leilao.estatisticas.maximo == 250.0
+
+
+def test_deve_ignorar_valores_que_nao_sao_finitos_no_esboco():
+    esboco = EsbocoDeQuantis()
+    for valor in (10.0, float('inf'), float('nan'), float('-inf'), 20.0):
+        esboco.adicionar(valor)
+
+    assert esboco.quantidade == 2
+    assert esboco.quantil(1.0) == pytest.approx(20.0, rel=0.01)
+
+
+def test_deve_comparar_os_lances_criados_das_colunas_pelo_valor():
+    leilao = Leilao('Celular')
+    yuri = Usuario('Yuri')
+    lance_do_yuri = Lance(yuri, 100.0)
+    leilao.dar_lance(lance_do_yuri)
+
+    assert lance_do_yuri in leilao.lances
+    assert leilao.lances[0] == lance_do_yuri
+    assert leilao.lances[0] == leilao.lances[0]
+    assert leilao.lances[0] != Lance(yuri, 150.0)
+    assert leilao.lances[0] != Lance(Usuario('Yuri'), 100.0)
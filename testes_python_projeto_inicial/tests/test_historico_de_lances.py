@@ -0,0 +1,62 @@
+from testes_python_projeto_inicial.src.leilao.dominio import Usuario, Lance, Leilao
+
+import pytest
+
+
+@pytest.fixture()
+def leilao():
+    leilao = Leilao('Celular')
+    gui = Usuario('Gui')
+    yuri = Usuario('Yuri')
+
+    leilao.dar_lance(Lance(yuri, 100.0))
+    leilao.dar_lance(Lance(gui, 150.0))
+    leilao.dar_lance(Lance(yuri, 200.0))
+
+    return leilao
+
+
+def test_deve_retornar_os_lances_na_ordem_em_que_foram_dados(leilao):
+    lances = leilao.lances
+
+    assert len(lances) == 3
+    assert [lance.valor for lance in lances] == [100.0, 150.0, 200.0]
+    assert lances[-1].usuario.nome == 'Yuri'
+
+
+def test_nao_deve_enxergar_os_lances_dados_depois_de_pegar_o_historico(leilao):
+    lances = leilao.lances
+
+    leilao.dar_lance(Lance(Usuario('Vini'), 300.0))
+
+    assert len(lances) == 3
+    assert len(leilao.lances) == 4
+    with pytest.raises(IndexError):
+        lances[3]
+
+
+def test_deve_fatiar_o_historico_sem_perder_a_ordem(leilao):
+    lances = leilao.lances
+
+    assert [lance.valor for lance in lances[1:]] == [150.0, 200.0]
+    assert [lance.valor for lance in lances[::-1]] == [200.0, 150.0, 100.0]
+    assert len(lances[5:]) == 0
+
+
+def test_nao_deve_permitir_alterar_o_historico(leilao):
+    with pytest.raises(TypeError):
+        leilao.lances[0] = Lance(Usuario('Vini'), 1000.0)
+
+
+def test_deve_comparar_o_historico_com_os_lances_dados():
+    leilao = Leilao('Celular')
+    lances = [Lance(Usuario('Yuri'), 100.0), Lance(Usuario('Gui'), 150.0)]
+    for lance in lances:
+        leilao.dar_lance(lance)
+
+    assert leilao.lances == lances
+    assert lances == leilao.lances
+    assert leilao.lances == tuple(lances)
+    assert leilao.lances[:1] == lances[:1]
+    assert leilao.lances != lances[:1]
+    assert leilao.lances != 'lances'
@@ -0,0 +1,89 @@
+import json
+
+from testes_python_projeto_inicial.src.leilao.reproducao import ler_log, reproduzir
+
+import pytest
+
+LANCES = [
+    ('Celular', 'Yuri', '100.0'),
+    ('Celular', 'Gui', '150.0'),
+    ('Celular', 'Gui', '200.0'),
+    ('Notebook', 'Yuri', '2000.0'),
+    ('Celular', 'Vini', '120.0'),
+    ('Celular', 'Vini', 'cento e vinte'),
+]
+
+
+@pytest.fixture()
+def log_csv(tmp_path):
+    caminho = tmp_path / 'lances.csv'
+    linhas = ['leilao,usuario,valor'] + [','.join(lance) for lance in LANCES]
+    caminho.write_text('\n'.join(linhas), encoding='utf-8')
+    return str(caminho)
+
+
+@pytest.fixture()
+def log_jsonl(tmp_path):
+    caminho = tmp_path / 'lances.jsonl'
+    linhas = [json.dumps({'leilao': leilao, 'usuario': usuario, 'valor': valor}) for leilao, usuario, valor in LANCES]
+    caminho.write_text('\n'.join(linhas), encoding='utf-8')
+    return str(caminho)
+
+
+def test_deve_ler_o_log_em_lotes(log_csv):
+    lotes = list(ler_log(log_csv, tamanho_do_lote=4))
+
+    assert [len(lote) for lote in lotes] == [4, 2]
+    assert lotes[0][0].linha == 2
+    assert lotes[0][0].usuario == 'Yuri'
+
+
+def test_deve_recusar_os_lances_invalidos_com_o_motivo(log_csv):
+    relatorio = reproduzir(ler_log(log_csv), dinheiro_inicial=1000.0)
+
+    assert relatorio.aceitos == 2
+    assert relatorio.recusados == 4
+    assert [(recusa.linha, recusa.motivo) for recusa in relatorio.recusas] == [
+        (4, 'O mesmo usuário não pode propror dois lances seguidos'),
+        (5, 'Não pode propor um lance com um valor maior que o valor da carteira'),
+        (6, 'Você só pode dar lances maiores do que já foram dados'),
+        (7, 'Linha sem um valor válido'),
+    ]
+
+
+def test_deve_reproduzir_logs_csv_e_jsonl_da_mesma_forma(log_csv, log_jsonl):
+    relatorio_csv = reproduzir(ler_log(log_csv), dinheiro_inicial=1000.0)
+    relatorio_jsonl = reproduzir(ler_log(log_jsonl, tamanho_do_lote=1), dinheiro_inicial=1000.0)
+
+    assert relatorio_jsonl.aceitos == relatorio_csv.aceitos
+    assert relatorio_jsonl.motivos == relatorio_csv.motivos
+    assert relatorio_jsonl.lances_por_segundo > 0
+
+
+def test_deve_guardar_apenas_as_primeiras_recusas(log_csv):
+    relatorio = reproduzir(ler_log(log_csv), dinheiro_inicial=1000.0, maximo_de_recusas=1)
+
+    assert relatorio.recusados == 4
+    assert len(relatorio.recusas) == 1
+
+
+def test_deve_recusar_valores_que_nao_sao_finitos_e_linhas_que_nao_sao_objetos(tmp_path):
+    caminho = tmp_path / 'lances.jsonl'
+    linhas = [
+        '{"leilao": "Celular", "usuario": "Yuri", "valor": NaN}',
+        '{"leilao": "Celular", "usuario": "Yuri", "valor": "inf"}',
+        '[1, 2]',
+        '5',
+        '{"leilao": "Celular", "usuario": "Yuri", "valor": 100.0}',
+    ]
+    caminho.write_text('\n'.join(linhas), encoding='utf-8')
+
+    relatorio = reproduzir(ler_log(str(caminho)), dinheiro_inicial=1000.0)
+
+    assert relatorio.aceitos == 1
+    assert [(recusa.linha, recusa.motivo) for recusa in relatorio.recusas] == [
+        (1, 'Linha sem um valor válido'),
+        (2, 'Linha sem um valor válido'),
+        (3, 'Linha sem um valor válido'),
+        (4, 'Linha sem um valor válido'),
+    ]